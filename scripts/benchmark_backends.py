@@ -0,0 +1,89 @@
+import argparse
+import math
+import random
+import statistics
+import time
+
+from src.data.json_loader import load_graph_from_json
+from src.data.synthetic_graphs import GRAPH_KINDS, synthetic_graph_data
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import distance_cache_for
+from src.solver.backends import BACKENDS, solve_route
+
+
+def connected_queries(graph, count, rng):
+    """Draw random (start_node, end_node) pairs whose end node can be reached from the start node."""
+    queries = []
+    while len(queries) < count:
+        start_id, end_id = rng.sample(range(len(graph)), 2)
+        if start_id in distance_cache_for(graph).distances(end_id):
+            queries.append((graph.name(start_id), graph.name(end_id)))
+    return queries
+
+
+def benchmark_graph(label, graph, queries, backends, generations, population_size):
+    """Solve every query with every backend and print latency and optimality gap per backend."""
+    print(f"{label}: {len(graph)} nodes, {graph.number_of_edges()} edges, {len(queries)} queries")
+    optimum = {query: distance_cache_for(graph).distances(graph.index(query[1]))[graph.index(query[0])]
+               for query in queries}
+    distance_cache_for(graph).clear()  # Only the backends' own work is timed
+    distance_cache_for(graph).straight_line_scale()  # Computed once per graph, like the A* scale of a service
+
+    for backend in backends:
+        latencies, gaps, reached = [], [], 0
+        for seed, (start_node, end_node) in enumerate(queries):
+            start = time.perf_counter()
+            path, distance = solve_route(graph, start_node, end_node, backend, generations, population_size,
+                                         seed=seed)
+            latencies.append(time.perf_counter() - start)
+            if path is not None and path[-1] == end_node and math.isfinite(distance):
+                reached += 1
+                gaps.append(distance / optimum[(start_node, end_node)] - 1 if optimum[(start_node, end_node)] else 0)
+        latencies.sort()
+        gap = f"{statistics.mean(gaps):7.2%} mean, {max(gaps):7.2%} max" if gaps else "n/a"
+        print(f"  {backend:14s} p50 {latencies[len(latencies) // 2] * 1000:9.2f} ms | "
+              f"p95 {latencies[int(0.95 * (len(latencies) - 1))] * 1000:9.2f} ms | "
+              f"reached {reached:3d}/{len(queries)} | gap {gap}")
+
+
+def main(graph_file: str = None, kinds=GRAPH_KINDS, num_nodes: int = 2000, queries: int = 20,
+         backends=BACKENDS, generations: int = 20, population_size: int = 20, seed: int = 0):
+    """
+    Compare the solver backends on the same queries: latency percentiles and gap to the shortest distance,
+    to decide which engine is good enough for which query.
+
+    Args:
+        graph_file (str, optional): Graph JSON file to benchmark instead of synthetic graphs.
+        kinds (tuple, optional): Synthetic graph kinds. Default is every kind.
+        num_nodes (int, optional): Number of nodes of the synthetic graphs. Default is 2000.
+        queries (int, optional): Number of random connected queries per graph. Default is 20.
+        backends (tuple, optional): Backends to compare. Default is every backend.
+        generations (int, optional): Generations of the genetic algorithm backends. Default is 20.
+        population_size (int, optional): Population size of the genetic algorithm backends. Default is 20.
+        seed (int, optional): Seed of the graphs and of the queries. Default is 0.
+    """
+    rng = random.Random(seed)
+    if graph_file:
+        graph_data, positions = load_graph_from_json(graph_file)
+        graphs = {graph_file: CompactGraph.from_data(graph_data, positions)}
+    else:
+        graphs = {kind: CompactGraph.from_data(*synthetic_graph_data(kind, num_nodes, seed)) for kind in kinds}
+    for label, graph in graphs.items():
+        benchmark_graph(label, graph, connected_queries(graph, queries, rng), backends, generations,
+                        population_size)
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_backends [graph_file] [--nodes 2000] [--queries 20] [--backends ga astar]
+    parser = argparse.ArgumentParser(description="Compare latency and optimality of the solver backends.")
+    parser.add_argument("graph_file", nargs="?")
+    parser.add_argument("--kinds", nargs="+", default=GRAPH_KINDS, choices=GRAPH_KINDS)
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--backends", nargs="+", default=BACKENDS, choices=BACKENDS)
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--population-size", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    main(args.graph_file, args.kinds, args.nodes, args.queries, args.backends, args.generations,
+         args.population_size, args.seed)
@@ -0,0 +1,60 @@
+import random
+import sys
+import time
+
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.batch_fitness import BatchFitnessEvaluator
+
+
+def time_evaluation(ga, population, repeats=3):
+    """
+    Evaluate a population several times, as consecutive generations would.
+    :return: A tuple (mean seconds per evaluation, fitnesses of the first evaluation).
+    """
+    start = time.perf_counter()
+    fitnesses = ga.evaluate_population(population)
+    for _ in range(repeats - 1):
+        ga.evaluate_population(population)
+    return (time.perf_counter() - start) / repeats, fitnesses
+
+
+def main(population_size: int = 10000, side: int = 30, engine: str = "compact"):
+    """
+    Compare per-individual and batched fitness evaluation on a random population of walks.
+
+    Args:
+        population_size (int, optional): Number of individuals to evaluate. Default is 10000.
+        side (int, optional): Side of the synthetic grid graph. Default is 30.
+        engine (str, optional): Graph engine used by the genetic algorithm. Default is "compact".
+    """
+    graph = grid_graph_data(side)
+    start_node, end_node = "0-0", f"{side - 1}-{side - 1}"
+
+    random.seed(0)
+    ga = GeneticAlgorithm(graph, start_node, end_node, generations=1, population_size=population_size, engine=engine)
+    population = ga.create_initial_population()
+    mean_length = sum(len(path) for path in population) / len(population)
+    print(f"Grid {side}x{side}, {len(population)} individuals, mean path length {mean_length:.1f}")
+
+    for dense in (True, False):
+        per_individual = GeneticAlgorithm(graph, start_node, end_node, 1, population_size, engine=engine)
+        batched = GeneticAlgorithm(graph, start_node, end_node, 1, population_size, engine=engine,
+                                   batch_fitness=True)
+        if not dense:
+            batched.batch_evaluator = BatchFitnessEvaluator(batched.batch_evaluator.graph,
+                                                            batched.batch_evaluator.end_node, dense=False)
+
+        loop_seconds, loop_fitnesses = time_evaluation(per_individual, population)
+        batch_seconds, batch_fitnesses = time_evaluation(batched, population)
+        label = "dense " if dense else "sparse"
+        print(f"{label}: per-individual {loop_seconds * 1000:8.1f} ms | batch {batch_seconds * 1000:8.1f} ms | "
+              f"speedup {loop_seconds / batch_seconds:5.1f}x | identical {loop_fitnesses == batch_fitnesses}")
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_batch_fitness [population_size] [grid_side] [engine]
+    population_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    side = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    engine = sys.argv[3] if len(sys.argv) > 3 else "compact"
+    main(population_size, side, engine)
@@ -0,0 +1,49 @@
+import random
+import sys
+import time
+
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.solver.batch_solver import BatchSolver
+
+
+def random_queries(graph, count, seed=0):
+    """Draw random (start_node, end_node) pairs of distinct nodes."""
+    rng = random.Random(seed)
+    nodes = list(graph)
+    return [tuple(rng.sample(nodes, 2)) for _ in range(count)]
+
+
+def main(queries: int = 200, side: int = 6, generations: int = 20, population_size: int = 20, workers: int = 4):
+    """
+    Measure query throughput of the batch solver against one GeneticAlgorithm per query.
+
+    Args:
+        queries (int, optional): Number of origin/destination queries. Default is 200.
+        side (int, optional): Side of the synthetic grid graph. Default is 6.
+        generations (int, optional): Generations per query. Default is 20.
+        population_size (int, optional): Population size per query. Default is 20.
+        workers (int, optional): Worker processes of the parallel run. Default is 4.
+    """
+    graph = grid_graph_data(side)
+    batch = random_queries(graph, queries)
+    print(f"Grid {side}x{side}, {queries} queries, {generations} generations x {population_size} individuals")
+
+    start = time.perf_counter()
+    for start_node, end_node in batch:
+        GeneticAlgorithm(graph, start_node, end_node, generations, population_size).run()
+    seconds = time.perf_counter() - start
+    print(f"one GeneticAlgorithm per query  : {queries / seconds:8.1f} queries/s")
+
+    for pool_size in (1, workers):
+        start = time.perf_counter()
+        with BatchSolver(graph, generations, population_size, workers=pool_size, seed=0) as solver:
+            solver.solve_batch(batch)
+        seconds = time.perf_counter() - start
+        print(f"BatchSolver, {pool_size:2d} worker(s)        : {queries / seconds:8.1f} queries/s")
+
+
+if __name__ == "__main__":
+    # Usage: python scripts/benchmark_batch_solver.py [queries] [grid_side] [generations] [population_size] [workers]
+    arguments = [int(argument) for argument in sys.argv[1:6]]
+    main(*arguments)
@@ -0,0 +1,85 @@
+import argparse
+import gc
+import math
+import time
+
+from src.data.synthetic_graphs import grid_graph_data, scale_free_graph_data
+from src.graph.compact_graph import CompactGraph
+from src.graph.graph_builder import GraphBuilder
+from src.graph.graph_manager import create_graph_from_data
+
+BUILD_KINDS = ("grid", "scale_free")
+
+
+def quadratic_networkx_graph(data):
+    """The former dict branch of `create_graph_from_data`: every adjacency list is inserted degree times."""
+    import networkx as nx
+
+    g = nx.Graph()
+    for node, edges in data.items():
+        for _ in edges:
+            for edge in edges:
+                g.add_edge(node, edge["node"], weight=edge["weight"])
+    return g
+
+
+def adjacency_compact_graph(data):
+    """The former `CompactGraph.from_data`: a {node: {neighbor: weight}} dictionary, then one CSR pass."""
+    adjacency = {}
+    for node, edges in data.items():
+        adjacency.setdefault(node, {})
+        for edge in edges:
+            adjacency[node][edge["node"]] = edge["weight"]
+            adjacency.setdefault(edge["node"], {})[node] = edge["weight"]
+    return CompactGraph.from_adjacency(adjacency)
+
+
+def graph_data(kind, num_edges):
+    """Synthetic graph data with about num_edges undirected edges (each listed from both ends)."""
+    if kind == "grid":
+        return grid_graph_data(max(math.isqrt(num_edges // 2), 2))
+    return scale_free_graph_data(max(num_edges // 2, 3))[0]
+
+
+def main(num_edges: int = 1_000_000, kinds=BUILD_KINDS, legacy: bool = True):
+    """
+    Time the graph construction from the JSON dictionary format on large synthetic graphs: the bulk
+    `GraphBuilder` pass on its own, and the networkx and compact graphs built through it, against the former
+    builders.
+
+    Args:
+        num_edges (int, optional): Approximate number of undirected edges of every graph. Default is 1000000.
+        kinds (tuple, optional): Graph kinds: "grid" (degree 4) and "scale_free" (hubs of high degree).
+        legacy (bool, optional): Also time the former quadratic networkx builder. Default is True.
+    """
+    GraphBuilder().to_networkx()  # Import networkx before the timings
+    for kind in kinds:
+        data = graph_data(kind, num_edges)
+        entries = sum(len(edges) for edges in data.values())
+        max_degree = max(len(edges) for edges in data.values())
+        print(f"{kind}: {len(data)} nodes, {entries // 2} edges, maximum degree {max_degree}")
+        builders = {
+            "GraphBuilder pass": lambda: GraphBuilder.from_data(data),
+            "CSR (builder)": lambda: CompactGraph.from_data(data),
+            "CSR (adjacency dict)": lambda: adjacency_compact_graph(data),
+            "networkx (builder)": lambda: create_graph_from_data(data),
+        }
+        if legacy:
+            builders["networkx (quadratic)"] = lambda: quadratic_networkx_graph(data)
+        for label, build in builders.items():
+            gc.collect()  # Every builder starts without garbage left by the previous one
+            start = time.perf_counter()
+            build()
+            seconds = time.perf_counter() - start
+            print(f"  {label:22s} {seconds:8.2f} s | {entries / 2 / seconds / 1e6:6.2f} M edges/s")
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_graph_building [--edges 1000000] [--kinds grid] [--no-legacy]
+    parser = argparse.ArgumentParser(description="Time the graph builders on large synthetic graphs.")
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--kinds", nargs="+", default=BUILD_KINDS, choices=BUILD_KINDS)
+    parser.add_argument("--no-legacy", dest="legacy", action="store_false",
+                        help="Skip the former quadratic networkx builder.")
+    args = parser.parse_args()
+    main(args.edges, args.kinds, args.legacy)
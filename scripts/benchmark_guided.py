@@ -0,0 +1,51 @@
+import random
+import sys
+import time
+
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.progress import ProgressRecorder
+from src.graph.goal_distances import distance_cache_for
+
+
+def main(side: int = 12, generations: int = 30, population_size: int = 30, runs: int = 5):
+    """
+    Compare blind and distance-guided random walks: initial population size, best distance per
+    generation and time, against the exact shortest distance.
+
+    Args:
+        side (int, optional): Side of the synthetic grid graph. Default is 12.
+        generations (int, optional): Number of generations. Default is 30.
+        population_size (int, optional): Size of the population. Default is 30.
+        runs (int, optional): Number of seeded runs averaged. Default is 5.
+    """
+    graph = grid_graph_data(side)
+    start_node, end_node = "0-0", f"{side - 1}-{side - 1}"
+    print(f"Grid {side}x{side}, {start_node} -> {end_node}, {generations} generations x {population_size} individuals")
+
+    for guided in (False, True):
+        gaps, seconds, reached = [], 0.0, 0
+        for seed in range(runs):
+            random.seed(seed)
+            recorder = ProgressRecorder()
+            ga = GeneticAlgorithm(graph, start_node, end_node, generations, population_size, engine="compact",
+                                  progress=recorder, guided=guided)
+            optimum = distance_cache_for(ga.graph).distances(ga.end_node)[ga.start_node]
+            reached += sum(path[-1] == ga.end_node for path in ga.create_initial_population())
+
+            start = time.perf_counter()
+            ga.run()
+            seconds += time.perf_counter() - start
+            gaps.append([event["best_distance"] / optimum - 1 for event in recorder.events])
+
+        label = "guided" if guided else "blind "
+        mean_gap = [sum(run[g] for run in gaps) / runs for g in range(generations)]
+        checkpoints = " ".join(f"g{g + 1}:{mean_gap[g]:6.1%}" for g in range(0, generations, max(1, generations // 5)))
+        print(f"{label}: initial walks reaching the goal {reached / runs:5.1f}/{population_size} | "
+              f"gap to optimum {checkpoints} | {seconds / runs:6.2f} s/run")
+
+
+if __name__ == "__main__":
+    # Usage: python scripts/benchmark_guided.py [grid_side] [generations] [population_size] [runs]
+    arguments = [int(argument) for argument in sys.argv[1:5]]
+    main(*arguments)
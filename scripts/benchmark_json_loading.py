@@ -0,0 +1,53 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.data.json_loader import load_graph_from_json, save_graph_to_json
+from src.data.json_stream import stream_compact_graph_from_json, stream_graph_from_json
+from src.data.synthetic_graphs import grid_graph_data, grid_positions
+
+
+def measure(load):
+    """Run a loader and return (seconds, peak traced memory in bytes)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return seconds, peak
+
+
+def main(sides=(50, 100, 200)):
+    """
+    Compare the peak memory of `load_graph_from_json` and the streaming loaders against the file size,
+    on synthetic grid graphs saved in the JSON format of `graphs/`.
+
+    Args:
+        sides (tuple, optional): Sides of the synthetic grid graphs. Default is (50, 100, 200).
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for side in sides:
+            file_path = os.path.join(directory, f"grid_{side}.json")
+            save_graph_to_json(grid_graph_data(side), grid_positions(side), file_path)
+            file_mb = os.path.getsize(file_path) / 1e6
+            quarter = (0, 0, side / 2 - 1, side / 2 - 1)
+            loaders = {
+                "json.load": lambda: load_graph_from_json(file_path),
+                "stream (dicts)": lambda: stream_graph_from_json(file_path),
+                "stream (compact)": lambda: stream_compact_graph_from_json(file_path),
+                "stream (bbox 1/4)": lambda: stream_compact_graph_from_json(file_path, bbox=quarter),
+            }
+            print(f"Grid {side}x{side}: file {file_mb:.1f} MB")
+            for label, load in loaders.items():
+                seconds, peak = measure(load)
+                print(f"  {label:18s} {seconds:7.2f} s | peak {peak / 1e6:7.1f} MB | "
+                      f"{peak / 1e6 / file_mb:5.2f}x file size")
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_json_loading [grid_side ...]
+    main(tuple(int(side) for side in sys.argv[1:]) or (50, 100, 200))
@@ -0,0 +1,85 @@
+import argparse
+import time
+
+from src.data.synthetic_graphs import GRAPH_KINDS, add_travel_attributes, synthetic_graph_data
+from src.genetic_algorithm.multi_objective import MultiObjectiveGeneticAlgorithm
+from src.genetic_algorithm.objectives import FITNESS_SCHEMES
+from src.graph.compact_graph import CompactGraph
+
+OBJECTIVES = ("weight", "time", "toll")
+
+
+def time_evaluation(graph_data, start_node, end_node, routes, repeats):
+    """
+    Seconds per population to sum the three objectives of random routes (without memo table): edge by edge on
+    the networkx edge dictionaries, path by path from the CSR arrays, and for the whole population at once.
+    """
+    solvers = {engine: MultiObjectiveGeneticAlgorithm(graph_data, start_node, end_node, 1, routes,
+                                                      objectives=OBJECTIVES, engine=engine, guided=True,
+                                                      fitness_cache_size=0, seed=0)
+               for engine in ("networkx", "compact")}
+    compact = solvers["compact"]
+    population = compact.create_initial_population()
+    names = [compact.to_node_names(path) for path in population]
+    evaluations = {
+        "networkx, per edge": lambda: [solvers["networkx"].path_objectives(path) for path in names],
+        "CSR arrays, per path": lambda: [compact.path_objectives(path) for path in population],
+        "CSR arrays, population": lambda: compact.objective_vectors(population),
+    }
+    timings = {}
+    for label, evaluate in evaluations.items():
+        start = time.perf_counter()
+        for _ in range(repeats):
+            evaluate()
+        timings[label] = (time.perf_counter() - start) / repeats
+    return timings, sum(len(path) - 1 for path in population)
+
+
+def main(kind: str = "grid", num_nodes: int = 144, generations: int = 30, population_size: int = 30,
+         routes: int = 500, repeats: int = 20):
+    """
+    Benchmark routes minimizing distance, travel time and tolls on a synthetic graph with toll roads: the
+    evaluation of the objectives of a population, then the fronts found with each fitness scheme.
+
+    Args:
+        kind (str, optional): Synthetic graph kind. Default is "grid".
+        num_nodes (int, optional): Number of nodes of the graph. Default is 144.
+        generations (int, optional): Generations of every run. Default is 30.
+        population_size (int, optional): Population size of every run. Default is 30.
+        routes (int, optional): Number of random routes of the timed evaluations. Default is 500.
+        repeats (int, optional): Number of timed evaluations of the routes. Default is 20.
+    """
+    graph_data, positions = synthetic_graph_data(kind, num_nodes)
+    add_travel_attributes(graph_data)
+    graph = CompactGraph.from_data(graph_data, positions, attributes=OBJECTIVES[1:])
+    start_node, end_node = graph.node_names[0], graph.node_names[-1]
+    print(f"{kind} graph, {len(graph)} nodes, route {start_node} -> {end_node}, objectives {', '.join(OBJECTIVES)}")
+
+    timings, edges = time_evaluation(graph_data, start_node, end_node, routes, repeats)
+    print(f"objective totals of {routes} routes ({edges} edges):")
+    for label, seconds in timings.items():
+        print(f"  {label:24s} {seconds * 1e3:8.3f} ms | {edges / seconds / 1e6:6.2f} M edges/s")
+
+    print(f"fronts after {generations} generations x {population_size}:")
+    for scheme in FITNESS_SCHEMES:
+        start = time.perf_counter()
+        ga = MultiObjectiveGeneticAlgorithm(graph, start_node, end_node, generations, population_size,
+                                            objectives=OBJECTIVES, fitness_scheme=scheme, guided=True, seed=0)
+        front = ga.run()
+        seconds = time.perf_counter() - start
+        best = {name: min(totals[name] for _, totals in front) for name in OBJECTIVES}
+        print(f"  {scheme:12s} {seconds:6.2f} s | {len(front):3d} routes | best " +
+              ", ".join(f"{name} {value:.0f}" for name, value in best.items()))
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_objectives [--kind grid] [--nodes 144] [--generations 30] [--routes 500]
+    parser = argparse.ArgumentParser(description="Benchmark multi-objective routes (distance, time, tolls).")
+    parser.add_argument("--kind", default="grid", choices=GRAPH_KINDS)
+    parser.add_argument("--nodes", type=int, default=144)
+    parser.add_argument("--generations", type=int, default=30)
+    parser.add_argument("--population-size", type=int, default=30)
+    parser.add_argument("--routes", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    main(args.kind, args.nodes, args.generations, args.population_size, args.routes, args.repeats)
@@ -0,0 +1,71 @@
+import math
+import random
+import sys
+import time
+
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm, correct_path_to_end, crossover
+
+
+def snake_path(ga, side, length, by_rows=True):
+    """Simple path of the given length sweeping the grid row by row (or column by column) from 0-0."""
+    nodes = []
+    for line in range(side):
+        cells = range(side) if line % 2 == 0 else range(side - 1, -1, -1)
+        nodes.extend(f"{line}-{cell}" if by_rows else f"{cell}-{line}" for cell in cells)
+    return ga.graph.to_ids(nodes[:length])
+
+
+def time_call(function, repeats):
+    """Mean seconds per call of function over repeats calls."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+def main(max_length: int = 10000):
+    """
+    Time the genetic operators on simple paths of 10 to max_length nodes in a grid graph.
+
+    Args:
+        max_length (int, optional): Longest path length measured. Default is 10000.
+    """
+    side = math.isqrt(max_length) + 2
+    graph = grid_graph_data(side)
+    # Without the memo table, so that every repeat of the fitness is computed rather than looked up
+    ga = GeneticAlgorithm(graph, "0-0", f"{side - 1}-{side - 1}", generations=1, population_size=1, engine="compact",
+                          fitness_cache_size=0)
+    print(f"Grid {side}x{side}, compact engine, times per call in microseconds")
+    print(f"{'length':>8} {'crossover':>12} {'repair/step':>12} {'mutate':>12} {'fitness':>12}")
+
+    length = 10
+    while length <= max_length:
+        parent1 = snake_path(ga, side, length)
+        parent2 = snake_path(ga, side, length, by_rows=False)
+        repeats = max(3, 20000 // length)
+
+        # Crossover ending on parent2's last node, so no repair is needed
+        crossover_time = time_call(lambda: crossover(parent1, parent2, ga.graph, parent2[-1]), repeats)
+
+        # Blind repair of the path prefix toward the goal, per appended node
+        random.seed(0)
+        steps = 0
+        start = time.perf_counter()
+        for _ in range(repeats):
+            repaired = correct_path_to_end(parent1[:-1], ga.graph, parent1[-1])
+            steps += len(repaired) - length + 1 if repaired else 1
+        repair_time = (time.perf_counter() - start) / steps
+
+        random.seed(0)
+        mutate_time = time_call(lambda: ga.mutate(list(parent1)), repeats)
+        fitness_time = time_call(lambda: ga.fitness(parent1), repeats)
+
+        print(f"{length:>8} {crossover_time * 1e6:>12.1f} {repair_time * 1e6:>12.1f} {mutate_time * 1e6:>12.1f} "
+              f"{fitness_time * 1e6:>12.1f}")
+        length *= 10
+
+
+if __name__ == "__main__":
+    # Usage: python scripts/benchmark_operators.py [max_length]
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
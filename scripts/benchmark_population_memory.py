@@ -0,0 +1,104 @@
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.array_population import ArrayGeneticAlgorithm
+
+REPRESENTATIONS = {"list of lists": GeneticAlgorithm, "NumPy buffers": ArrayGeneticAlgorithm}
+
+
+class GarbageCollectionTimer:
+    """Count the garbage collections and their total pause time while installed in ``gc.callbacks``."""
+
+    def __init__(self):
+        self.collections = 0
+        self.seconds = 0.0
+        self._start = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.collections += 1
+            self.seconds += time.perf_counter() - self._start
+
+
+def evolve(algorithm, graph, start_node, end_node, population, generations, traced):
+    """
+    Evolve a copy of the population for a number of generations.
+    :return: A tuple (last generation, seconds, GarbageCollectionTimer, peak bytes traced by tracemalloc or None,
+             solver).
+    """
+    ga = algorithm(graph, start_node, end_node, generations, len(population), engine="compact", batch_fitness=True,
+                   guided=True, seed=0)
+    ga._start_run()
+    population = [list(path) for path in population]
+    timer = GarbageCollectionTimer()
+    gc.collect()
+    if traced:
+        tracemalloc.start()
+    gc.callbacks.append(timer)
+    start = time.perf_counter()
+    try:
+        population = ga.evolve(population, generations)
+    finally:
+        seconds = time.perf_counter() - start
+        gc.callbacks.remove(timer)
+    peak = None
+    if traced:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return population, seconds, timer, peak, ga
+
+
+def list_bytes(population):
+    """Bytes of the lists of a population (the ids themselves are shared with the graph rows)."""
+    return sum(sys.getsizeof(path) for path in population)
+
+
+def main(side: int = 12, population_sizes=(200, 1000), generations: int = 10):
+    """
+    Compare the list-of-lists population with the double-buffered NumPy population (PopulationBuffers) on a
+    grid graph: time per generation, garbage collections and their pauses, peak memory traced during the run
+    and bytes per individual, with the best distance of the last generation as a sanity check.
+
+    Args:
+        side (int, optional): Side of the synthetic grid graph. Default is 12.
+        population_sizes (tuple, optional): Population sizes measured. Default is (200, 1000).
+        generations (int, optional): Generations evolved per measure. Default is 10.
+    """
+    graph = grid_graph_data(side)
+    start_node, end_node = "0-0", f"{side - 1}-{side - 1}"
+    print(f"Grid {side}x{side}, guided, {generations} generations")
+    for population_size in population_sizes:
+        initial = GeneticAlgorithm(graph, start_node, end_node, generations, population_size, engine="compact",
+                                   guided=True, seed=0).create_initial_population()
+        print(f"population {population_size}:")
+        for label, algorithm in REPRESENTATIONS.items():
+            last_generation, seconds, timer, _, ga = evolve(algorithm, graph, start_node, end_node, initial,
+                                                            generations, False)
+            peak = evolve(algorithm, graph, start_node, end_node, initial, generations, True)[3]
+            if isinstance(ga, ArrayGeneticAlgorithm):
+                per_individual = ga.buffers.nbytes / ga.buffers.capacity
+            else:
+                per_individual = 2 * list_bytes(last_generation) / len(last_generation)  # Two generations alive
+            best_distance = ga.select_best(last_generation)[1]
+            print(f"  {label:14s} {seconds / generations * 1e3:8.1f} ms/generation | "
+                  f"{timer.collections / generations:6.1f} GCs, {timer.seconds / generations * 1e3:6.2f} ms GC "
+                  f"per generation | peak {peak / 1e6:7.2f} MB | {per_individual:6.0f} B/individual | "
+                  f"best {best_distance:g}")
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_population_memory [--side 12] [--population-sizes 200 1000]
+    #                                                      [--generations 10]
+    parser = argparse.ArgumentParser(description="Compare list and NumPy buffer populations.")
+    parser.add_argument("--side", type=int, default=12)
+    parser.add_argument("--population-sizes", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--generations", type=int, default=10)
+    args = parser.parse_args()
+    main(args.side, tuple(args.population_sizes), args.generations)
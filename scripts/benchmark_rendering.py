@@ -0,0 +1,69 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.data.synthetic_graphs import grid_graph_data
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import distance_cache_for
+from src.visualization.batch_render import RouteRenderer, render_routes
+from src.visualization.visualization import visualize_path
+
+
+def shortest_routes(graph_data, count, seed=0):
+    """Shortest routes between random node pairs of graph data, as paths of node names."""
+    graph = CompactGraph.from_data(graph_data)
+    cache = distance_cache_for(graph)
+    rng = random.Random(seed)
+    routes = []
+    for _ in range(count):
+        start, end = rng.sample(range(len(graph)), 2)
+        routes.append(graph.to_names(cache.guide(end).complete([start])))
+    return routes
+
+
+def main(side: int = 20, num_routes: int = 200, baseline_routes: int = 5, workers: int = None):
+    """
+    Time the rendering of route maps to PNG files over a grid graph without positions: `visualize_path` per
+    route (spring layout and full drawing every time) against a RouteRenderer (layout and map drawn once), in
+    the calling process and in a worker pool.
+
+    Args:
+        side (int, optional): Side of the synthetic grid graph. Default is 20.
+        num_routes (int, optional): Number of routes rendered by the renderer. Default is 200.
+        baseline_routes (int, optional): Number of routes rendered with `visualize_path`. Default is 5.
+        workers (int, optional): Number of worker processes of the pool. Default is the number of CPUs.
+    """
+    graph_data = grid_graph_data(side)
+    routes = shortest_routes(graph_data, num_routes)
+    print(f"Grid {side}x{side} without positions, {num_routes} routes, {os.cpu_count()} CPUs")
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        for i, path in enumerate(routes[:baseline_routes]):
+            visualize_path(graph_data, path, output_file=os.path.join(directory, f"baseline-{i}.png"))
+        baseline = (time.perf_counter() - start) / baseline_routes
+        print(f"  visualize_path per route   {baseline * 1e3:8.1f} ms/route")
+
+        start = time.perf_counter()
+        renderer = RouteRenderer(graph_data)
+        setup = time.perf_counter() - start
+        print(f"  RouteRenderer setup        {setup * 1e3:8.1f} ms (layout and map, once)")
+        for label, pool_workers in (("RouteRenderer in process", 1), ("RouteRenderer worker pool", workers)):
+            start = time.perf_counter()
+            render_routes(renderer, routes, os.path.join(directory, label.replace(" ", "-")),
+                          workers=pool_workers)
+            seconds = (time.perf_counter() - start) / num_routes
+            print(f"  {label:26s} {seconds * 1e3:8.1f} ms/route | {baseline / seconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_rendering [--side 20] [--routes 200] [--baseline-routes 5] [--workers 4]
+    parser = argparse.ArgumentParser(description="Time headless batch rendering of route maps.")
+    parser.add_argument("--side", type=int, default=20)
+    parser.add_argument("--routes", type=int, default=200)
+    parser.add_argument("--baseline-routes", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    main(args.side, args.routes, args.baseline_routes, args.workers)
@@ -0,0 +1,40 @@
+import random
+import sys
+import time
+
+import numpy as np
+
+from src.genetic_algorithm.GeneticAlgorithm import selection
+from src.genetic_algorithm.selection import SELECTION_SCHEMES, select_indices
+
+
+def main(sizes=(1000, 10000, 100000)):
+    """
+    Time one generation of parent selection with the original tournament selection and with every
+    vectorised scheme, on random fitness values.
+
+    Args:
+        sizes (tuple, optional): Population sizes. Default is (1000, 10000, 100000).
+    """
+    rng = np.random.default_rng(0)
+    print(f"{'population':>10} {'original':>12} " + " ".join(f"{scheme:>12}" for scheme in SELECTION_SCHEMES))
+    for size in sizes:
+        fitnesses = rng.normal(size=size).tolist()
+        population = list(range(size))
+
+        random.seed(0)
+        start = time.perf_counter()
+        selection(population, fitnesses)
+        timings = [time.perf_counter() - start]
+
+        fitness_array = np.asarray(fitnesses)
+        for scheme in SELECTION_SCHEMES:
+            start = time.perf_counter()
+            select_indices(scheme, fitness_array, size, rng)
+            timings.append(time.perf_counter() - start)
+        print(f"{size:>10} " + " ".join(f"{seconds * 1000:>10.2f}ms" for seconds in timings))
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_selection [population_size ...]
+    main(tuple(int(size) for size in sys.argv[1:]) or (1000, 10000, 100000))
@@ -0,0 +1,64 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("matplotlib", "networkx", "scipy", "pandas")
+
+# Prints the heavy modules loaded by the code before it
+REPORT_MODULES = f"import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+
+
+def time_command(command, repeats):
+    """Run a command `repeats` times and return (median wall seconds, stdout of the last run)."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root, MPLBACKEND="Agg")
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=root, env=env, capture_output=True, text=True, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result.stdout
+
+
+def main(graph_file: str = "graphs/bc_cities.json", start_node: str = "Tijuana", end_node: str = "Mexicali",
+         repeats: int = 5):
+    """
+    Measure the start-up time of the command-line entry points in fresh interpreters, and which heavy
+    dependencies they load. The "eager imports" line is the cost every run paid when the scripts imported
+    the visualization module (matplotlib and networkx) at start-up.
+
+    Args:
+        graph_file (str, optional): Graph file of the headless run. Default is graphs/bc_cities.json.
+        start_node (str, optional): Start node of the headless run. Default is Tijuana.
+        end_node (str, optional): End node of the headless run. Default is Mexicali.
+        repeats (int, optional): Runs per command; the median is reported. Default is 5.
+    """
+    python = sys.executable
+    commands = {
+        "interpreter": [python, "-c", "pass"],
+        "eager imports": [python, "-c", "import matplotlib.pyplot, networkx"],
+        "import run_algorithm": [python, "-c", f"import scripts.run_algorithm; {REPORT_MODULES}"],
+        "import http_service": [python, "-c", f"import src.solver.http_service; {REPORT_MODULES}"],
+        "headless run": [python, "scripts/run_algorithm.py", graph_file, start_node, end_node, "10", "20", "0",
+                         "--no-plot"],
+    }
+    for label, command in commands.items():
+        seconds, output = time_command(command, repeats)
+        line = f"{label:22s} {seconds * 1000:8.1f} ms"
+        if label.startswith("import"):
+            line += f" | heavy modules loaded: {output.strip() or 'none'}"
+        print(line)
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_startup [graph_file start_node end_node] [--repeats 5]
+    parser = argparse.ArgumentParser(description="Measure the start-up time of the command-line scripts.")
+    parser.add_argument("graph_file", nargs="?", default="graphs/bc_cities.json")
+    parser.add_argument("start_node", nargs="?", default="Tijuana")
+    parser.add_argument("end_node", nargs="?", default="Mexicali")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    main(args.graph_file, args.start_node, args.end_node, args.repeats)
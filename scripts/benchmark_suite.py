@@ -0,0 +1,80 @@
+import argparse
+import json
+import sys
+
+from src.benchmark.suite import compare_results, environment_info, run_case_with_timeout
+from src.data.synthetic_graphs import GRAPH_KINDS
+
+
+def main(kinds=GRAPH_KINDS, sizes=(100, 1000, 10000), generations: int = 20, population_size: int = 30,
+         seed: int = 0, output: str = None, baseline: str = None, threshold: float = 0.1, timeout: float = 300):
+    """
+    Run the benchmark suite on synthetic graphs, optionally save the results and compare them with a
+    previous run.
+
+    Args:
+        kinds (tuple, optional): Graph kinds to benchmark. Default is every kind.
+        sizes (tuple, optional): Numbers of nodes, up to 1000000. Default is (100, 1000, 10000).
+        generations (int, optional): Number of generations per solve. Default is 20.
+        population_size (int, optional): Size of the population. Default is 30.
+        seed (int, optional): Seed of the graphs and of the genetic algorithm. Default is 0.
+        output (str, optional): JSON file the results are written to.
+        baseline (str, optional): JSON results file of an earlier run to compare against.
+        threshold (float, optional): Relative slowdown reported as a regression. Default is 0.1.
+        timeout (float, optional): Seconds allowed per case before it is recorded as timed out. Default is 300.
+
+    Returns:
+        int: 1 if a regression was found against the baseline, else 0.
+    """
+    results = {"environment": environment_info(), "results": []}
+    print(f"{'kind':>10} {'nodes':>8} {'load json':>10} {'load bin':>10} {'population':>11} "
+          f"{'evaluation':>11} {'generation':>11} {'solve':>9} {'gap':>7}")
+    for kind in kinds:
+        for size in sizes:
+            case = run_case_with_timeout(kind, size, generations, population_size, seed, timeout=timeout)
+            results["results"].append(case)
+            if case["timed_out"]:
+                loaded = f"{case['load_json_seconds']:>9.3f}s {case['load_binary_seconds']:>9.4f}s" \
+                    if "load_json_seconds" in case else f"{'-':>10} {'-':>10}"
+                print(f"{kind:>10} {case.get('nodes', size):>8} {loaded} timed out after {timeout:g}s")
+                continue
+            gap = f"{case['gap']:.1%}" if case["gap"] is not None else "-"
+            print(f"{kind:>10} {case['nodes']:>8} {case['load_json_seconds']:>9.3f}s "
+                  f"{case['load_binary_seconds']:>9.4f}s {case['population_seconds']:>10.3f}s "
+                  f"{case['evaluation_seconds']:>10.4f}s {case['generation_seconds'] or 0:>10.4f}s "
+                  f"{case['solve_seconds']:>8.2f}s {gap:>7}")
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {output}")
+
+    if not baseline:
+        return 0
+    with open(baseline, 'r') as f:
+        rows = compare_results(json.load(f), results, threshold)
+    regressions = [row for row in rows if row["regression"]]
+    for row in regressions:
+        case = row["case"]
+        print(f"REGRESSION {case['kind']} {case['num_nodes']}: {row['metric']} "
+              f"{row['baseline']:.4g} -> {row['current']:.4g}")
+    print(f"{len(rows)} metrics compared, {len(regressions)} regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_suite [--sizes 100,1000] [--output results.json] [--baseline old.json]
+    parser = argparse.ArgumentParser(description="Benchmark the genetic algorithm on synthetic graphs.")
+    parser.add_argument("--kinds", default=",".join(GRAPH_KINDS), help="Comma-separated graph kinds.")
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma-separated numbers of nodes.")
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--population-size", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare with the results JSON file of an earlier run.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown counted as a regression.")
+    parser.add_argument("--timeout", type=float, default=300, help="Seconds allowed per case.")
+    args = parser.parse_args()
+    sys.exit(main(tuple(args.kinds.split(",")), tuple(int(size) for size in args.sizes.split(",")),
+                  args.generations, args.population_size, args.seed, args.output, args.baseline, args.threshold,
+                  args.timeout))
@@ -0,0 +1,91 @@
+import argparse
+import random
+import time
+
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import distance_cache_for
+from src.graph.graph_utils import get_all_edges
+
+
+def traffic_changes(graph, best_path, closures, slowdown_fraction, rng):
+    """Close edges of the current best route and slow down a random fraction of the other edges by 50%."""
+    changes = []
+    for i in rng.sample(range(len(best_path) - 1), min(closures, len(best_path) - 1)):
+        changes.append((best_path[i], best_path[i + 1], None))
+    for u, v, weight in get_all_edges(graph):
+        if rng.random() < slowdown_fraction:
+            changes.append((u, v, weight * 1.5))
+    return changes
+
+
+def main(side: int = 12, generations: int = 100, population_size: int = 50, tolerance: float = 0.02,
+         closures: int = 2, slowdown_fraction: float = 0.1, runs: int = 5):
+    """
+    Compare a cold solve with a warm-started `resume` after edge closures and slowdowns on a grid graph:
+    time and generations until the route is within `tolerance` of the new shortest distance.
+
+    Args:
+        side (int, optional): Side of the synthetic grid graph. Default is 12.
+        generations (int, optional): Maximum number of generations of each solve. Default is 100.
+        population_size (int, optional): Size of the population. Default is 50.
+        tolerance (float, optional): Relative gap to the shortest distance that stops a solve. Default is 0.02.
+        closures (int, optional): Number of edges of the best route closed. Default is 2.
+        slowdown_fraction (float, optional): Fraction of the edges slowed down by 50%. Default is 0.1.
+        runs (int, optional): Number of seeded scenarios averaged. Default is 5.
+    """
+    data = grid_graph_data(side)
+    start_node, end_node = "0-0", f"{side - 1}-{side - 1}"
+    print(f"Grid {side}x{side}, {start_node} -> {end_node}, up to {generations} generations x {population_size}, "
+          f"{closures} closures on the route and {slowdown_fraction:.0%} of edges slowed down")
+
+    totals = {"cold": [0.0, 0, 0.0], "warm": [0.0, 0, 0.0]}
+    for seed in range(runs):
+        ga = GeneticAlgorithm(CompactGraph.from_data(data), start_node, end_node, generations, population_size,
+                              guided=True, seed=seed)
+        best_path, _ = ga.run()
+        changes = traffic_changes(ga.graph, best_path, closures, slowdown_fraction, random.Random(seed))
+
+        start = time.perf_counter()
+        dropped = ga.update_graph(changes)
+        # The target is known here only to measure the time to a good route; it is not needed to resume
+        optimum = distance_cache_for(ga.graph).distances(ga.end_node)[ga.start_node]
+        ga.target_distance = optimum * (1 + tolerance)
+        _, warm_distance = ga.resume()
+        warm_seconds = time.perf_counter() - start
+        warm_generations = ga.generation
+
+        start = time.perf_counter()
+        cold = GeneticAlgorithm(CompactGraph.from_data(ga.graph.to_data()), start_node, end_node, generations,
+                                population_size, guided=True, target_distance=optimum * (1 + tolerance), seed=seed)
+        _, cold_distance = cold.run()
+        cold_seconds = time.perf_counter() - start
+
+        for label, seconds, gens, distance in (("cold", cold_seconds, cold.generation, cold_distance),
+                                               ("warm", warm_seconds, warm_generations, warm_distance)):
+            totals[label][0] += seconds
+            totals[label][1] += gens
+            totals[label][2] += distance / optimum - 1
+        print(f"  seed {seed}: {len(changes)} changes, {dropped} memoized paths dropped | "
+              f"cold {cold_seconds * 1000:7.1f} ms gap {cold_distance / optimum - 1:6.1%} | "
+              f"warm {warm_seconds * 1000:7.1f} ms gap {warm_distance / optimum - 1:6.1%}")
+
+    for label, (seconds, gens, gap) in totals.items():
+        print(f"{label}: {seconds / runs * 1000:7.1f} ms/solve | {gens / runs:5.1f} generations | "
+              f"mean gap to optimum {gap / runs:6.1%}")
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_warm_start [--side 12] [--generations 100] [--runs 5]
+    parser = argparse.ArgumentParser(description="Compare cold solves with warm starts after graph updates.")
+    parser.add_argument("--side", type=int, default=12)
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--population-size", type=int, default=50)
+    parser.add_argument("--tolerance", type=float, default=0.02)
+    parser.add_argument("--closures", type=int, default=2)
+    parser.add_argument("--slowdown-fraction", type=float, default=0.1)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    main(args.side, args.generations, args.population_size, args.tolerance, args.closures,
+         args.slowdown_fraction, args.runs)
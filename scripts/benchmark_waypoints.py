@@ -0,0 +1,99 @@
+import argparse
+import random
+import time
+
+from src.data.synthetic_graphs import GRAPH_KINDS, synthetic_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.waypoints import WaypointGeneticAlgorithm
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import distance_cache_for
+
+
+def chained_solve(graph_data, stops, generations, population_size, seed):
+    """One cold guided GeneticAlgorithm per leg, as when routes through stops were solved leg by leg."""
+    route, total = [stops[0]], 0
+    for leg, (u, v) in enumerate(zip(stops, stops[1:])):
+        ga = GeneticAlgorithm(graph_data, u, v, generations, population_size, engine="compact", guided=True,
+                              seed=seed + leg)
+        path, distance = ga.run()
+        route.extend(path[1:])
+        total += distance
+    return route, total
+
+
+def nearest_neighbor_distance(graph, stops):
+    """Distance of the nearest-neighbor stop order with shortest legs, a simple free-order baseline."""
+    cache = distance_cache_for(graph)
+    current, remaining, total = stops[0], set(stops[1:-1]), 0
+    while remaining:
+        distances = {stop: cache.distances(graph.index(stop))[graph.index(current)] for stop in remaining}
+        current = min(distances, key=distances.get)
+        total += distances[current]
+        remaining.discard(current)
+    return total + cache.distances(graph.index(stops[-1]))[graph.index(current)]
+
+
+def main(kind: str = "grid", num_nodes: int = 400, num_stops: int = 20, generations: int = 60,
+         population_size: int = 40, runs: int = 2):
+    """
+    Compare a route through num_stops stops solved leg by leg (a cold GeneticAlgorithm per leg, each
+    building its graph and distance table again) with one WaypointGeneticAlgorithm solve, in fixed and in
+    free stop order. Gaps are relative to the shortest route through the stops in the given order.
+
+    Args:
+        kind (str, optional): Synthetic graph kind. Default is "grid".
+        num_nodes (int, optional): Number of nodes of the graph. Default is 400.
+        num_stops (int, optional): Number of stops, start and end included. Default is 20.
+        generations (int, optional): Generations of every solve. Default is 60.
+        population_size (int, optional): Population size of every solve. Default is 40.
+        runs (int, optional): Number of random stop sets averaged. Default is 2.
+    """
+    graph_data, positions = synthetic_graph_data(kind, num_nodes)
+    print(f"{kind} graph, {len(graph_data)} nodes, {num_stops} stops, {generations} generations x "
+          f"{population_size}")
+    totals = {}
+    for seed in range(runs):
+        graph = CompactGraph.from_data(graph_data, positions)
+        cache = distance_cache_for(graph)
+        component = cache.distances(0)  # Stops are drawn from the component of node 0
+        stops = graph.to_names(random.Random(seed).sample(sorted(component), num_stops))
+        optimum = sum(cache.distances(graph.index(v))[graph.index(u)] for u, v in zip(stops, stops[1:]))
+        cache.clear()  # Every solve computes its own distance tables
+
+        results = {}
+        start = time.perf_counter()
+        _, distance = chained_solve(graph_data, stops, generations, population_size, seed)
+        results["chained legs"] = (distance, time.perf_counter() - start)
+        for label, free_order in (("waypoints", False), ("waypoints free order", True)):
+            start = time.perf_counter()
+            ga = WaypointGeneticAlgorithm(CompactGraph.from_data(graph_data, positions), stops[0], stops[-1],
+                                          stops[1:-1], generations, population_size, free_order=free_order,
+                                          elitism=2, seed=seed)
+            _, distance = ga.run()
+            results[label] = (distance, time.perf_counter() - start)
+        results["nearest neighbor order"] = (nearest_neighbor_distance(graph, stops), 0.0)
+
+        for label, (distance, seconds) in results.items():
+            total = totals.setdefault(label, [0.0, 0.0])
+            total[0] += distance / optimum - 1
+            total[1] += seconds
+        print(f"  seed {seed}: shortest in order {optimum} | " +
+              " | ".join(f"{label} {distance:.0f} in {seconds:.2f} s" for label, (distance, seconds) in
+                         results.items() if seconds))
+
+    for label, (gap, seconds) in totals.items():
+        timing = f"{seconds / runs:6.2f} s/route" if seconds else "   exact legs"
+        print(f"{label:24s} {timing} | mean gap to the shortest route in order {gap / runs:7.1%}")
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.benchmark_waypoints [--kind grid] [--nodes 400] [--stops 20] [--runs 2]
+    parser = argparse.ArgumentParser(description="Compare chained per-leg solves with one waypoint solve.")
+    parser.add_argument("--kind", default="grid", choices=GRAPH_KINDS)
+    parser.add_argument("--nodes", type=int, default=400)
+    parser.add_argument("--stops", type=int, default=20)
+    parser.add_argument("--generations", type=int, default=60)
+    parser.add_argument("--population-size", type=int, default=40)
+    parser.add_argument("--runs", type=int, default=2)
+    args = parser.parse_args()
+    main(args.kind, args.nodes, args.stops, args.generations, args.population_size, args.runs)
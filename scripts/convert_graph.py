@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+
+from src.data.binary_graph import BINARY_EXTENSION, convert_json_to_binary, load_graph_from_binary
+from src.data.json_loader import load_graph_from_json
+from src.graph.compact_graph import CompactGraph
+
+
+def main(json_file: str, binary_file: str = None):
+    """
+    Convert a graph JSON file to the memory-mapped binary format and compare the load times.
+
+    Args:
+        json_file (str): Path to the JSON file containing the graph definition.
+        binary_file (str, optional): Output path. Default is the JSON path with the ``.graphbin`` extension.
+    """
+    binary_file = binary_file or os.path.splitext(json_file)[0] + BINARY_EXTENSION
+
+    start = time.perf_counter()
+    convert_json_to_binary(json_file, binary_file)
+    print(f"Converted {json_file} -> {binary_file} in {time.perf_counter() - start:.3f}s "
+          f"({os.path.getsize(json_file)} -> {os.path.getsize(binary_file)} bytes)")
+
+    start = time.perf_counter()
+    graph_data, _ = load_graph_from_json(json_file)
+    json_graph = CompactGraph.from_data(graph_data)
+    json_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    binary_graph = load_graph_from_binary(binary_file)
+    binary_seconds = time.perf_counter() - start
+
+    print(f"{json_graph.number_of_nodes()} nodes, {json_graph.number_of_edges()} edges")
+    print(f"JSON load + index: {json_seconds * 1000:.2f} ms | binary memory-map: {binary_seconds * 1000:.2f} ms")
+    assert binary_graph.number_of_edges() == json_graph.number_of_edges()
+
+
+if __name__ == "__main__":
+    # Usage: python convert_graph.py graph_file.json [graph_file.graphbin]
+    if len(sys.argv) < 2:
+        print("Usage: python convert_graph.py <graph_file.json> [output_file.graphbin]")
+    else:
+        main(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
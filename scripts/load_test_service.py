@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from src.solver.http_service import RoutingService, load_graph_file
+
+
+async def post_route(reader, writer, payload):
+    """Send one POST /route on a keep-alive connection and return (status, response)."""
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(b"POST /route HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 + f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def run_load(host, port, queries, concurrency, generations, population_size, deadline):
+    """Replay queries over `concurrency` connections and return per-request (status, latency) pairs."""
+    pending = list(queries)
+    results = []
+
+    async def client():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while pending:
+                graph, start_node, end_node = pending.pop()
+                started = time.perf_counter()
+                status, _ = await post_route(reader, writer, {
+                    "graph": graph, "start": start_node, "end": end_node, "generations": generations,
+                    "population_size": population_size, "deadline": deadline})
+                results.append((status, time.perf_counter() - started))
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return results
+
+
+async def load_test(graph_file, host, port, requests, concurrency, generations, population_size, deadline, workers):
+    graph = load_graph_file(graph_file)
+    graph_name = "graph"
+    rng = random.Random(0)
+    nodes = list(graph.node_names)
+    queries = [(graph_name, *rng.sample(nodes, 2)) for _ in range(requests)]
+
+    service = None
+    if port is None:
+        # No server given: start one in this process on a free port
+        service = RoutingService({graph_name: graph}, workers=workers)
+        server = await service.start(host, 0)
+        port = server.sockets[0].getsockname()[1]
+    try:
+        started = time.perf_counter()
+        results = await run_load(host, port, queries, concurrency, generations, population_size, deadline)
+        elapsed = time.perf_counter() - started
+    finally:
+        if service is not None:
+            await service.close()
+
+    latencies = sorted(latency for status, latency in results if status == 200)
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    print(f"{len(results)} requests in {elapsed:.2f}s with {concurrency} connections: "
+          f"{len(latencies) / elapsed:.1f} routes/s, statuses {statuses}")
+    if latencies:
+        def percentile(fraction):
+            return latencies[min(int(fraction * len(latencies)), len(latencies) - 1)] * 1000
+        print(f"latency p50 {percentile(0.5):.1f} ms | p95 {percentile(0.95):.1f} ms | "
+              f"p99 {percentile(0.99):.1f} ms | max {latencies[-1] * 1000:.1f} ms")
+
+
+def main(graph_file: str, host: str = "127.0.0.1", port: int = None, requests: int = 200, concurrency: int = 8,
+         generations: int = 20, population_size: int = 20, deadline: float = 10.0, workers: int = None):
+    """
+    Load-test the HTTP routing service with random queries on a graph.
+
+    Args:
+        graph_file (str): Graph file; queries are random pairs of its nodes. When a port is given the
+                          server must serve this graph under the name "graph".
+        host (str, optional): Server address. Default is 127.0.0.1.
+        port (int, optional): Server port. Default is None: start a service in this process.
+        requests (int, optional): Number of requests. Default is 200.
+        concurrency (int, optional): Number of concurrent keep-alive connections. Default is 8.
+        generations (int, optional): Generations per route. Default is 20.
+        population_size (int, optional): Population size per route. Default is 20.
+        deadline (float, optional): Deadline per request in seconds. Default is 10.
+        workers (int, optional): Worker processes of the in-process service. Default is the number of CPUs.
+    """
+    asyncio.run(load_test(graph_file, host, port, requests, concurrency, generations, population_size, deadline,
+                          workers))
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.load_test_service graphs/bc_cities.json [--port 8080] [--requests 200]
+    parser = argparse.ArgumentParser(description="Load-test the HTTP routing service.")
+    parser.add_argument("graph_file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="Port of a running service; by default one is started.")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--population-size", type=int, default=20)
+    parser.add_argument("--deadline", type=float, default=10.0)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+    main(args.graph_file, args.host, args.port, args.requests, args.concurrency, args.generations,
+         args.population_size, args.deadline, args.workers)
@@ -0,0 +1,64 @@
+import argparse
+
+from src.data.json_loader import load_graph_from_json
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.profiling import PhaseProfiler
+
+
+def main(graph_file: str = None, start_node: str = None, end_node: str = None, generations: int = 50,
+         population_size: int = 50, side: int = 6, seed: int = 0, trace: str = None, pstats_file: str = None,
+         **ga_options):
+    """
+    Run the genetic algorithm once with the phase profiler and print where the time went.
+
+    Args:
+        graph_file (str, optional): Graph JSON file. Default is a synthetic side x side grid.
+        start_node (str, optional): Start node. Default is the first corner of the grid.
+        end_node (str, optional): End node. Default is the opposite corner of the grid.
+        generations (int, optional): Number of generations. Default is 50.
+        population_size (int, optional): Size of the population. Default is 50.
+        side (int, optional): Side of the synthetic grid when no graph file is given. Default is 6.
+        seed (int, optional): Random seed. Default is 0.
+        trace (str, optional): Write a Chrome trace of every phase call to this file.
+        pstats_file (str, optional): Write the cProfile statistics to this file and print the top entries.
+        ga_options: Extra keyword arguments for GeneticAlgorithm.
+    """
+    if graph_file:
+        graph, _ = load_graph_from_json(graph_file)
+    else:
+        graph = grid_graph_data(side)
+        start_node, end_node = start_node or "0-0", end_node or f"{side - 1}-{side - 1}"
+
+    profiler = PhaseProfiler(trace=trace is not None, cprofile=pstats_file is not None)
+    ga = GeneticAlgorithm(graph, start_node, end_node, generations, population_size, profiler=profiler, seed=seed,
+                          **ga_options)
+    best_path, best_distance = ga.run()
+    print(f"Best path found: {best_path} with distance {best_distance}")
+    print(profiler.report())
+
+    if trace:
+        profiler.write_chrome_trace(trace)
+        print(f"Chrome trace written to {trace}")
+    if pstats_file:
+        profiler.write_pstats(pstats_file)
+        profiler.print_stats(15)
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.profile_run [graph_file start_node end_node] [--trace trace.json] [--pstats run.prof]
+    parser = argparse.ArgumentParser(description="Profile the phases of one genetic algorithm run.")
+    parser.add_argument("graph_file", nargs="?")
+    parser.add_argument("start_node", nargs="?")
+    parser.add_argument("end_node", nargs="?")
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--population-size", type=int, default=50)
+    parser.add_argument("--side", type=int, default=6, help="Side of the synthetic grid without a graph file.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", default="networkx")
+    parser.add_argument("--guided", action="store_true")
+    parser.add_argument("--trace", help="Write a Chrome trace JSON file.")
+    parser.add_argument("--pstats", help="Write cProfile statistics to this file.")
+    args = parser.parse_args()
+    main(args.graph_file, args.start_node, args.end_node, args.generations, args.population_size, args.side,
+         args.seed, args.trace, args.pstats, engine=args.engine, guided=args.guided)
@@ -0,0 +1,70 @@
+import argparse
+import json
+import time
+
+from src.data.binary_graph import BINARY_EXTENSION, load_graph_from_binary
+from src.data.json_loader import load_graph_from_json
+from src.visualization.batch_render import IMAGE_FORMATS, RouteRenderer, render_routes
+
+
+def read_routes(routes_file):
+    """
+    Read solved routes from a JSON lines file, one object with a "path" (and optionally a "distance") per line,
+    like the responses of the route service. Lines without a path (unreachable queries) are skipped.
+    :return: A tuple (paths, titles).
+    """
+    paths, titles = [], []
+    with open(routes_file, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            route = json.loads(line)
+            path = route.get("path")
+            if not path:
+                continue
+            paths.append(path)
+            distance = route.get("distance")
+            titles.append(f"{path[0]} -> {path[-1]}" + (f": {distance:g} km" if distance is not None else ""))
+    return paths, titles
+
+
+def main(graph_file: str, routes_file: str, output_dir: str, image_format: str = "png", workers: int = None,
+         layout_file: str = None):
+    """
+    Render route maps of solved queries to image files, without a display.
+
+    Args:
+        graph_file (str): Path to the JSON (or binary ``.graphbin``) file containing the graph definition.
+        routes_file (str): JSON lines file of routes, see `read_routes`.
+        output_dir (str): Directory of the images.
+        image_format (str, optional): "png" or "svg" (the map is embedded as a PNG raster, only the route and
+            the title are vectors). Default is "png".
+        workers (int, optional): Number of worker processes. Default is the number of CPUs.
+        layout_file (str, optional): JSON file caching the layout of graphs without positions across runs.
+    """
+    if graph_file.endswith(BINARY_EXTENSION):
+        graph = load_graph_from_binary(graph_file)
+        positions = graph.positions_dict() or {}
+    else:
+        graph, positions = load_graph_from_json(graph_file)
+    paths, titles = read_routes(routes_file)
+
+    start = time.perf_counter()
+    renderer = RouteRenderer(graph, positions, layout_file=layout_file)
+    files = render_routes(renderer, paths, output_dir, image_format, titles, workers)
+    print(f"Rendered {len(files)} routes to {output_dir} in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.render_routes graph_file.json routes.jsonl output_dir [--format svg] [--workers 4]
+    #                                        [--layout-file layout.json]
+    parser = argparse.ArgumentParser(description="Render route maps of solved queries to image files.")
+    parser.add_argument("graph_file")
+    parser.add_argument("routes_file")
+    parser.add_argument("output_dir")
+    parser.add_argument("--format", dest="image_format", default="png", choices=IMAGE_FORMATS,
+                        help="Image format; in svg the map is an embedded PNG raster and only the route is vector.")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--layout-file", help="JSON file caching the layout of nodes without positions.")
+    args = parser.parse_args()
+    main(args.graph_file, args.routes_file, args.output_dir, args.image_format, args.workers, args.layout_file)
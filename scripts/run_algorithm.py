@@ -1,48 +1,89 @@
-import sys
+import argparse
 
+from src.data.binary_graph import BINARY_EXTENSION, load_graph_from_binary
 from src.data.json_loader import load_graph_from_json
 from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
-from src.visualization.visualization import visualize_path
+from src.genetic_algorithm.array_population import ArrayGeneticAlgorithm
+from src.genetic_algorithm.waypoints import WaypointGeneticAlgorithm
 
 
-def main(graph_file: str, start_node: str, end_node: str, generations: int = 100, population_size: int = 50):
+def main(graph_file: str, start_node: str, end_node: str, generations: int = 100, population_size: int = 50,
+         seed: int = None, plot: bool = True, output_file: str = None, waypoints=None, free_order: bool = False,
+         array_population: bool = False):
     """
     Run the genetic algorithm to find an optimal path between two nodes in a graph.
 
     Args:
-        graph_file (str): Path to the JSON file containing the graph definition.
+        graph_file (str): Path to the JSON (or binary ``.graphbin``) file containing the graph definition.
         start_node (str): Name of the starting node.
         end_node (str): Name of the destination node.
         generations (int, optional): Number of generations to run the algorithm. Default is 100.
         population_size (int, optional): Size of the population. Default is 50.
+        seed (int, optional): Random seed making the run reproducible. Default is None (not reproducible).
+        plot (bool, optional): Show the graph and the path in a window. Default is True.
+        output_file (str, optional): Save the plot to this image file instead of showing it; works without
+                                     a display.
+        waypoints (list, optional): Names of intermediate stops the route must pass through, in order.
+        free_order (bool, optional): Let the algorithm choose the order of the waypoints. Default is False.
+        array_population (bool, optional): Keep the population in NumPy buffers (ArrayGeneticAlgorithm), faster
+                                           and smaller for large populations; not with waypoints. Default is False.
     """
+    if waypoints and array_population:
+        raise ValueError("The NumPy buffer population does not support waypoints")
 
-    # Step 1: Load the graph from JSON file
-    graph, positions = load_graph_from_json(graph_file)
+    # Step 1: Load the graph from JSON file, or memory-map it from a binary file
+    if graph_file.endswith(BINARY_EXTENSION):
+        graph = load_graph_from_binary(graph_file)
+        positions = graph.positions_dict() or {}
+    else:
+        graph, positions = load_graph_from_json(graph_file)
     if not graph:
         print(f"Error: Could not load the graph from {graph_file}")
         return
 
-    # Step 2: Initialize the genetic algorithm
-    ga = GeneticAlgorithm(graph=graph, start_node=start_node, end_node=end_node,
-                          generations=generations, population_size=population_size)
+    # Step 2: Initialize the genetic algorithm, with one solve for the whole route when there are stops
+    if waypoints:
+        ga = WaypointGeneticAlgorithm(graph, start_node, end_node, waypoints, generations, population_size,
+                                      free_order=free_order, seed=seed)
+    elif array_population:
+        ga = ArrayGeneticAlgorithm(graph, start_node, end_node, generations, population_size, seed=seed)
+    else:
+        ga = GeneticAlgorithm(graph=graph, start_node=start_node, end_node=end_node,
+                              generations=generations, population_size=population_size, seed=seed)
 
     # Step 3: Run the genetic algorithm to find the best path
     best_path, best_distance = ga.run()
     print(f"Best path found: {best_path} with distance {best_distance}")
 
-    # Step 4: Visualize the graph and the optimal path
-    visualize_path(graph, best_path, positions)
+    # Step 4: Visualize the graph and the optimal path. matplotlib is only imported here, so headless
+    # runs (plot=False) never pay for it
+    if plot or output_file:
+        from src.visualization.visualization import visualize_path
+        visualize_path(graph.to_data() if graph_file.endswith(BINARY_EXTENSION) else graph, best_path, positions,
+                       output_file)
+        if output_file:
+            print(f"Plot saved to {output_file}")
 
 
 if __name__ == "__main__":
-    # Usage: python run_algorithm.py graph_file.json start_node end_node
-    if len(sys.argv) < 4:
-        print("Usage: python run_algorithm.py <graph_file> <start_node> <end_node> [generations] [population_size]")
-    else:
-        graph_file = sys.argv[1]
-        start_node = sys.argv[2]
-        end_node = sys.argv[3]
-        generations = int(sys.argv[4]) if len(sys.argv) > 4 else 100
-        population_size = int(sys.argv[5]) if len(sys.argv) > 5 else 50
-        main(graph_file, start_node, end_node, generations, population_size)
+    # Usage: python run_algorithm.py graph_file.json start_node end_node [generations] [population_size] [seed]
+    #                                [--via stop ...] [--free-order] [--array-population]
+    #                                [--no-plot | --output path.png]
+    parser = argparse.ArgumentParser(description="Find a short path between two nodes with the genetic algorithm.")
+    parser.add_argument("graph_file")
+    parser.add_argument("start_node")
+    parser.add_argument("end_node")
+    parser.add_argument("generations", type=int, nargs="?", default=100)
+    parser.add_argument("population_size", type=int, nargs="?", default=50)
+    parser.add_argument("seed", type=int, nargs="?")
+    parser.add_argument("--via", nargs="+", default=None, help="Intermediate stops of the route, in order.")
+    parser.add_argument("--free-order", action="store_true", help="Visit the --via stops in any order.")
+    parser.add_argument("--array-population", action="store_true",
+                        help="Keep the population in NumPy buffers (without --via).")
+    parser.add_argument("--no-plot", dest="plot", action="store_false", help="Only print the path.")
+    parser.add_argument("--output", help="Save the plot to this image file instead of showing it.")
+    args = parser.parse_args()
+    if args.via and args.array_population:
+        parser.error("--array-population cannot be combined with --via")
+    main(args.graph_file, args.start_node, args.end_node, args.generations, args.population_size, args.seed,
+         args.plot, args.output, args.via, args.free_order, args.array_population)
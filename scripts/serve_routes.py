@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import os
+
+from src.solver.backends import BACKENDS
+from src.solver.http_service import RoutingService
+
+
+async def serve(service, host, port):
+    server = await service.start(host, port)
+    print(f"Serving {', '.join(service.graphs)} on http://{host}:{server.sockets[0].getsockname()[1]} "
+          f"with {service.workers} workers")
+    try:
+        await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(graph_files, host: str = "127.0.0.1", port: int = 8080, workers: int = None, max_concurrency: int = None,
+         max_queue: int = 64, deadline: float = 30.0, backend: str = "ga", **ga_options):
+    """
+    Run the HTTP routing service until interrupted.
+
+    Args:
+        graph_files (list): Graph files (JSON or .graphbin); each graph is named after its file name.
+        host (str, optional): Interface to listen on. Default is 127.0.0.1.
+        port (int, optional): Port to listen on. Default is 8080.
+        workers (int, optional): Worker processes. Default is the number of CPUs.
+        max_concurrency (int, optional): Routes solved at once. Default is the number of workers.
+        max_queue (int, optional): Routes waiting for a slot before requests are rejected. Default is 64.
+        deadline (float, optional): Default seconds allowed per request. Default is 30.
+        backend (str, optional): Default solver backend of the requests. Default is "ga".
+        ga_options: Extra keyword arguments for GeneticAlgorithm.
+    """
+    graphs = {os.path.splitext(os.path.basename(path))[0]: path for path in graph_files}
+    service = RoutingService.from_files(graphs, workers=workers, max_concurrency=max_concurrency,
+                                        max_queue=max_queue, default_deadline=deadline, backend=backend,
+                                        **ga_options)
+    try:
+        asyncio.run(serve(service, host, port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    # Usage: python -m scripts.serve_routes graphs/bc_cities.json [--port 8080] [--workers 4]
+    parser = argparse.ArgumentParser(description="Serve routes over HTTP/JSON.")
+    parser.add_argument("graph_files", nargs="+")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--max-concurrency", type=int)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--deadline", type=float, default=30.0)
+    parser.add_argument("--backend", default="ga", choices=BACKENDS)
+    parser.add_argument("--engine", default="compact")
+    parser.add_argument("--guided", action="store_true")
+    args = parser.parse_args()
+    main(args.graph_files, args.host, args.port, args.workers, args.max_concurrency, args.max_queue, args.deadline,
+         args.backend, engine=args.engine, guided=args.guided)
@@ -0,0 +1,199 @@
+import multiprocessing
+import os
+import platform
+import subprocess
+import tempfile
+import time
+
+from src.data.binary_graph import load_graph_from_binary, save_graph_to_binary
+from src.data.json_loader import load_graph_from_json, save_graph_to_json
+from src.data.synthetic_graphs import synthetic_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.progress import ProgressRecorder
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import dijkstra_distances
+
+# Timings recorded for every case; lower is better
+TIME_METRICS = ("generate_seconds", "load_json_seconds", "load_binary_seconds", "setup_seconds",
+                "population_seconds", "evaluation_seconds", "generation_seconds", "solve_seconds")
+# Fields identifying a case, used to match results of different runs
+CASE_KEY = ("kind", "num_nodes", "generations", "population_size", "seed")
+
+
+def _timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def benchmark_query(graph):
+    """
+    Pick a reproducible hard query: from the first node to the reachable node farthest from it.
+    :param graph: CompactGraph.
+    :return: A tuple (start name, end name, exact shortest distance).
+    """
+    distances = dijkstra_distances(graph, 0)
+    end = max(distances, key=lambda node_id: (distances[node_id], -node_id))
+    return graph.name(0), graph.name(end), distances[end]
+
+
+def run_case(kind, num_nodes, generations, population_size, seed=0, ga_options=None, directory=None, report=None):
+    """
+    Benchmark GeneticAlgorithm on one synthetic graph.
+    :param kind: Graph kind, one of `synthetic_graphs.GRAPH_KINDS`.
+    :param num_nodes: Requested number of nodes.
+    :param generations: Number of generations of the solve.
+    :param population_size: Size of the population.
+    :param seed: Seed of the graph generator and of the genetic algorithm.
+    :param ga_options: Extra keyword arguments for GeneticAlgorithm, by default the compact engine.
+    :param directory: Directory for the temporary graph files, by default a new temporary directory.
+    :param report: Optional callable receiving the partial result once the graph is loaded and indexed,
+                   so a caller can keep those timings if the solve never finishes.
+    :return: Dictionary with the CASE_KEY fields, the graph size, the query, the TIME_METRICS and the
+             solution quality (best distance and gap to the exact optimum).
+    """
+    if directory is None:
+        with tempfile.TemporaryDirectory() as directory:
+            return run_case(kind, num_nodes, generations, population_size, seed, ga_options, directory, report)
+    ga_options = {"engine": "compact", **(ga_options or {})}
+
+    (graph_data, positions), generate_seconds = _timed(lambda: synthetic_graph_data(kind, num_nodes, seed))
+    json_path = os.path.join(directory, f"{kind}_{num_nodes}.json")
+    binary_path = os.path.join(directory, f"{kind}_{num_nodes}.graphbin")
+    save_graph_to_json(graph_data, positions, json_path)
+    save_graph_to_binary(graph_data, positions, binary_path)
+    del graph_data, positions
+
+    (graph_data, _), load_json_seconds = _timed(lambda: load_graph_from_json(json_path))
+    _, load_binary_seconds = _timed(lambda: load_graph_from_binary(binary_path).number_of_nodes())
+    compact = CompactGraph.from_data(graph_data)
+    start_node, end_node, optimum = benchmark_query(compact)
+
+    def create_ga(**options):
+        return GeneticAlgorithm(graph_data, start_node, end_node, generations, population_size, seed=seed,
+                                **ga_options, **options)
+
+    ga, setup_seconds = _timed(create_ga)
+    result = {
+        "kind": kind, "num_nodes": num_nodes, "generations": generations,
+        "population_size": population_size, "seed": seed,
+        "nodes": compact.number_of_nodes(), "edges": compact.number_of_edges(),
+        "start_node": start_node, "end_node": end_node, "optimum": optimum,
+        "generate_seconds": generate_seconds, "load_json_seconds": load_json_seconds,
+        "load_binary_seconds": load_binary_seconds, "setup_seconds": setup_seconds,
+    }
+    if report is not None:
+        report(dict(result))
+
+    population, population_seconds = _timed(ga.create_initial_population)
+    _, evaluation_seconds = _timed(lambda: ga.evaluate_population(population))
+
+    recorder = ProgressRecorder()
+    ga = create_ga(progress=recorder)
+    (best_path, best_distance), solve_seconds = _timed(ga.run)
+    elapsed = [event["elapsed"] for event in recorder.events]
+    generation_seconds = (elapsed[-1] - elapsed[0]) / (len(elapsed) - 1) if len(elapsed) > 1 else None
+
+    reached = best_path is not None and best_path[-1] == end_node
+    result.update({
+        "population_seconds": population_seconds, "evaluation_seconds": evaluation_seconds,
+        "generation_seconds": generation_seconds, "solve_seconds": solve_seconds,
+        "generations_run": ga.generation, "stop_reason": ga.stop_reason, "reached": reached,
+        "best_distance": best_distance if reached else None,
+        "gap": best_distance / optimum - 1 if reached and optimum else None,
+    })
+    return result
+
+
+def _case_worker(connection, args, kwargs):
+    """Child process of `run_case_with_timeout`: send the partial result, then the full one."""
+    try:
+        result = run_case(*args, **kwargs, report=lambda partial: connection.send(("partial", partial)))
+        connection.send(("done", result))
+    finally:
+        connection.close()
+
+
+def run_case_with_timeout(kind, num_nodes, generations, population_size, seed=0, ga_options=None, timeout=None):
+    """
+    Run `run_case` in a child process killed after timeout seconds, since a single generation of a
+    large case can take arbitrarily long and the GA can only stop between generations.
+    :param timeout: Seconds allowed for the whole case, None for no limit.
+    :return: The result of `run_case`; a case that did not finish keeps its loading timings (if the
+             graph was loaded in time) and has ``"timed_out": True``.
+    """
+    parent_connection, child_connection = multiprocessing.Pipe(duplex=False)
+    args = (kind, num_nodes, generations, population_size, seed)
+    process = multiprocessing.Process(target=_case_worker, daemon=True,
+                                      args=(child_connection, args, {"ga_options": ga_options}))
+    process.start()
+    child_connection.close()
+
+    result = {"kind": kind, "num_nodes": num_nodes, "generations": generations,
+              "population_size": population_size, "seed": seed}
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    try:
+        while True:
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            if not parent_connection.poll(remaining):
+                result["timed_out"] = True
+                return result
+            message, payload = parent_connection.recv()
+            result.update(payload)
+            if message == "done":
+                result["timed_out"] = False
+                return result
+    except EOFError:
+        raise RuntimeError(f"Benchmark case {kind} {num_nodes} failed") from None
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        parent_connection.close()
+
+
+def environment_info():
+    """Description of the run for the results file: commit, interpreter, machine and date."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "python": platform.python_version(), "machine": platform.platform(),
+            "cpus": os.cpu_count(), "date": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def compare_results(baseline, current, threshold=0.1, min_seconds=0.01):
+    """
+    Compare two results files (as written by `scripts/benchmark_suite.py`) case by case.
+    :param baseline: Results dictionary of the reference run.
+    :param current: Results dictionary of the new run.
+    :param threshold: Relative slowdown above which a timing counts as a regression.
+    :param min_seconds: Absolute slowdown below which a timing never counts as a regression, so that
+                        the noise of sub-millisecond timings is not reported.
+    :return: List of dictionaries (case, metric, baseline, current, ratio, regression), one per metric
+             present in both runs. The best distance is compared too: any increase is a regression, and
+             so is a case that times out when it did not in the baseline.
+    """
+    baseline_cases = {tuple(case[field] for field in CASE_KEY): case for case in baseline["results"]}
+    rows = []
+    for case in current["results"]:
+        key = tuple(case[field] for field in CASE_KEY)
+        reference = baseline_cases.get(key)
+        if reference is None:
+            continue
+        if case.get("timed_out") and not reference.get("timed_out"):
+            rows.append({"case": dict(zip(CASE_KEY, key)), "metric": "timed_out", "baseline": False,
+                         "current": True, "ratio": None, "regression": True})
+        for metric in TIME_METRICS + ("best_distance",):
+            before, after = reference.get(metric), case.get(metric)
+            if before is None or after is None:
+                continue
+            ratio = after / before if before else None
+            if metric == "best_distance":
+                regression = after > before
+            else:
+                regression = ratio is not None and ratio > 1 + threshold and after - before > min_seconds
+            rows.append({"case": dict(zip(CASE_KEY, key)), "metric": metric, "baseline": before,
+                         "current": after, "ratio": ratio, "regression": regression})
+    return rows
@@ -0,0 +1,167 @@
+import struct
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.data.json_loader import load_graph_from_json
+from src.graph.compact_graph import CompactGraph, position_array
+
+BINARY_EXTENSION = ".graphbin"
+
+MAGIC = b"GPFBIN02"
+# magic, number of nodes, number of adjacency entries, size of the names blob, weight dtype, has positions,
+# number of edge attributes, size of the edge attribute names blob
+HEADER = struct.Struct("<8sqqq8sqqq")
+ALIGNMENT = 8
+
+
+def _aligned(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _section_layout(num_nodes, num_entries, names_size, weight_dtype, has_positions, num_attributes=0,
+                    attribute_names_size=0):
+    """
+    Byte offset of every section of a binary graph file, in file order.
+    :return: Tuple (layout, file_size) where layout is a dictionary {section: (offset, dtype, shape)}.
+    """
+    sections = [("offsets", np.dtype("<i8"), (num_nodes + 1,)),
+                ("neighbor_ids", np.dtype("<i8"), (num_entries,)),
+                ("weights", weight_dtype, (num_entries,))]
+    if has_positions:
+        sections.append(("positions", np.dtype("<f8"), (num_nodes, 2)))
+    sections += [("name_offsets", np.dtype("<i8"), (num_nodes + 1,)),
+                 ("names", np.dtype("u1"), (names_size,))]
+    if num_attributes:
+        sections += [("attributes", np.dtype("<f8"), (num_attributes, num_entries)),
+                     ("attribute_name_offsets", np.dtype("<i8"), (num_attributes + 1,)),
+                     ("attribute_names", np.dtype("u1"), (attribute_names_size,))]
+
+    layout = {}
+    offset = HEADER.size
+    for name, dtype, shape in sections:
+        offset = _aligned(offset)
+        layout[name] = (offset, dtype, shape)
+        offset += dtype.itemsize * int(np.prod(shape))
+    return layout, offset
+
+
+class _NameTable(Sequence):
+    """Read-only sequence of node names decoded on access from a UTF-8 blob and its offsets."""
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, node_id):
+        if isinstance(node_id, slice):
+            return [self[i] for i in range(*node_id.indices(len(self)))]
+        if node_id < 0:
+            node_id += len(self)
+        if not 0 <= node_id < len(self):
+            raise IndexError("node id out of range")
+        start, stop = int(self.offsets[node_id]), int(self.offsets[node_id + 1])
+        return bytes(self.blob[start:stop]).decode("utf-8")
+
+    def __iter__(self):
+        # Decode the blob in one go; byte offsets are character offsets only for ASCII names
+        text = bytes(self.blob).decode("utf-8")
+        if text.isascii():
+            offsets = self.offsets.tolist()
+            return (text[start:stop] for start, stop in zip(offsets[:-1], offsets[1:]))
+        return (self[i] for i in range(len(self)))
+
+
+def _encode_names(names):
+    """UTF-8 blob of names and the array of their byte offsets in it."""
+    encoded = [str(name).encode("utf-8") for name in names]
+    offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+    np.cumsum([len(name) for name in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype="u1"), offsets
+
+
+def save_graph_to_binary(graph, positions, file_path, attributes=()):
+    """
+    Save a graph, the positions of its nodes and its edge attributes in the binary graph format.
+    :param graph: CompactGraph, or graph data in the format returned by `load_graph_from_json`.
+    :param positions: Dictionary representing the positions of the nodes (may be None or empty).
+    :param file_path: Path where the binary file will be saved.
+    :param attributes: Names of the edge attributes to keep from graph data (see `CompactGraph.from_data`);
+                       a CompactGraph keeps all of its ``edge_attributes``.
+    """
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph.from_data(graph, positions, attributes)
+    elif positions:
+        graph = CompactGraph(graph.node_names, graph.offsets, graph.neighbor_ids, graph.weights,
+                             position_array(graph.node_names, positions), graph.edge_attributes)
+
+    names, name_offsets = _encode_names(graph.node_names)
+    attribute_names, attribute_name_offsets = _encode_names(graph.edge_attributes)
+    num_nodes = len(name_offsets) - 1
+    num_attributes = len(graph.edge_attributes)
+    weights = graph.weights
+    if weights.dtype.kind not in "iuf":
+        weights = weights.astype(np.float64)
+    weight_dtype = weights.dtype.newbyteorder("<")
+    has_positions = graph.positions is not None
+
+    arrays = {"offsets": graph.offsets, "neighbor_ids": graph.neighbor_ids, "weights": weights,
+              "positions": graph.positions, "name_offsets": name_offsets, "names": names,
+              "attributes": list(graph.edge_attributes.values()), "attribute_name_offsets": attribute_name_offsets,
+              "attribute_names": attribute_names}
+    layout, _ = _section_layout(num_nodes, len(graph.neighbor_ids), int(name_offsets[-1]), weight_dtype,
+                                has_positions, num_attributes, int(attribute_name_offsets[-1]))
+
+    with open(file_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, num_nodes, len(graph.neighbor_ids), int(name_offsets[-1]),
+                            weight_dtype.str.encode("ascii"), int(has_positions), num_attributes,
+                            int(attribute_name_offsets[-1])))
+        for name, (offset, dtype, shape) in layout.items():
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(np.ascontiguousarray(arrays[name], dtype=dtype).reshape(shape).tobytes())
+
+
+def convert_json_to_binary(json_path, binary_path):
+    """
+    Convert a graph JSON file (see `load_graph_from_json`) to the binary graph format.
+    :param json_path: Path to the JSON file.
+    :param binary_path: Path where the binary file will be saved.
+    """
+    graph_data, positions = load_graph_from_json(json_path)
+    save_graph_to_binary(graph_data, positions, binary_path)
+
+
+def load_graph_from_binary(file_path):
+    """
+    Load a graph saved by `save_graph_to_binary` by memory-mapping the file.
+
+    Nothing is parsed or copied: the CSR arrays, positions, edge attributes and node names are views on
+    the mapped file, so loading takes constant time and processes loading the same file share its pages.
+    :param file_path: Path to the binary file.
+    :return: CompactGraph object; its ``positions`` attribute holds the node coordinates (or None).
+    """
+    data = np.memmap(file_path, dtype=np.uint8, mode="r")
+    if len(data) < HEADER.size:
+        raise ValueError(f"{file_path} is not a binary graph file")
+    (magic, num_nodes, num_entries, names_size, weight_dtype, has_positions, num_attributes,
+     attribute_names_size) = HEADER.unpack(bytes(data[:HEADER.size]))
+    if magic != MAGIC:
+        raise ValueError(f"{file_path} is not a binary graph file")
+
+    layout, file_size = _section_layout(num_nodes, num_entries, names_size,
+                                        np.dtype(weight_dtype.rstrip(b"\0").decode("ascii")), has_positions,
+                                        num_attributes, attribute_names_size)
+    if len(data) < file_size:
+        raise ValueError(f"{file_path} is truncated")
+    arrays = {name: np.frombuffer(data, dtype=dtype, count=int(np.prod(shape)), offset=offset).reshape(shape)
+              for name, (offset, dtype, shape) in layout.items()}
+
+    edge_attributes = {}
+    if num_attributes:
+        names = _NameTable(arrays["attribute_names"], arrays["attribute_name_offsets"])
+        edge_attributes = dict(zip(names, arrays["attributes"]))
+    return CompactGraph(_NameTable(arrays["names"], arrays["name_offsets"]), arrays["offsets"],
+                        arrays["neighbor_ids"], arrays["weights"], arrays.get("positions"), edge_attributes)
@@ -4,6 +4,9 @@ import json
 def load_graph_from_json(file_path):
     """
     Load graph data and positions from a JSON file.
+
+    Every edge entry has a "node" and a "weight"; further numeric attributes of the edge (e.g. "time" or
+    "toll") are kept as they are, after those two keys.
     :param file_path: Path to the JSON file.
     :return: A tuple containing two elements:
              1. A dictionary representing the graph structure.
@@ -12,7 +15,7 @@ def load_graph_from_json(file_path):
     with open(file_path, 'r') as f:
         graph_data = json.load(f)
 
-    graph = {node: [{"node": neighbor["node"], "weight": neighbor["weight"]} for neighbor in neighbors]
+    graph = {node: [{"node": neighbor["node"], "weight": neighbor["weight"], **neighbor} for neighbor in neighbors]
              for node, neighbors in graph_data.items() if node != "positions"}
 
     positions = graph_data.get("positions", {})
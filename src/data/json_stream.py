@@ -0,0 +1,176 @@
+import json
+
+from src.graph.compact_graph import CompactGraph, position_array
+from src.graph.graph_builder import GraphBuilder
+
+WHITESPACE = " \t\n\r"
+
+
+class _JsonStreamReader:
+    """
+    Minimal pull parser over a text stream for the members of (nested) JSON objects.
+
+    Only the text of the value being decoded is kept in memory: the buffer grows while a value is
+    incomplete and the consumed prefix is dropped after every value.
+    """
+
+    def __init__(self, stream, chunk_size):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _read_more(self):
+        """Append the next chunk to the buffer, at least as large as the buffer so retries stay linear."""
+        if self.position:
+            self.buffer = self.buffer[self.position:]
+            self.position = 0
+        chunk = self.stream.read(max(self.chunk_size, len(self.buffer)))
+        if not chunk:
+            self.eof = True
+        self.buffer += chunk
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it ('' at the end of the stream)."""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer) or self.eof:
+                return self.buffer[self.position:self.position + 1]
+            self._read_more()
+
+    def expect(self, character):
+        if self.peek() != character:
+            raise ValueError(f"Invalid graph JSON: expected {character!r} at {self.peek()!r}")
+        self.position += 1
+
+    def value(self):
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as error:
+                if self.eof:
+                    raise ValueError(f"Invalid graph JSON: {error}") from error
+                self._read_more()
+                continue
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.eof:
+                self._read_more()
+                continue
+            self.position = end
+            return value
+
+    def object_keys(self):
+        """
+        Iterate over the keys of the object starting at the current position. The caller must consume
+        the value of every key (with `value` or `object_keys`) before asking for the next key.
+        """
+        self.expect("{")
+        first = True
+        while True:
+            if self.peek() == "}":
+                self.position += 1
+                return
+            if not first:
+                self.expect(",")
+            first = False
+            key = self.value()
+            self.expect(":")
+            yield key
+
+
+def iter_json_graph(stream, chunk_size=1 << 16):
+    """
+    Read a graph in the JSON format of `load_graph_from_json` one node at a time.
+    :param stream: Text stream positioned at the start of the JSON document.
+    :param chunk_size: Number of characters read from the stream at a time.
+    :return: Iterator of ("edges", node, [{"node": neighbor, "weight": weight}, ...]) and
+             ("position", node, (x, y)) records, in file order.
+    """
+    reader = _JsonStreamReader(stream, chunk_size)
+    for key in reader.object_keys():
+        if key == "positions":
+            for node in reader.object_keys():
+                x, y = reader.value()
+                yield "position", node, (x, y)
+        else:
+            yield "edges", key, reader.value()
+
+
+def _positions_in_bbox(file_path, bbox, chunk_size):
+    """First pass for a bounding box filter: positions of the nodes inside the box."""
+    min_x, min_y, max_x, max_y = bbox
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return {node: position for kind, node, position in iter_json_graph(f, chunk_size)
+                if kind == "position" and min_x <= position[0] <= max_x and min_y <= position[1] <= max_y}
+
+
+def _iter_filtered_graph(file_path, nodes, bbox, chunk_size):
+    """Records of `iter_json_graph` restricted to a node subset and/or a bounding box."""
+    keep = None if nodes is None else set(nodes)
+    if bbox is not None:
+        # Positions are usually stored after the adjacency lists, so find the nodes in the box first
+        in_bbox = _positions_in_bbox(file_path, bbox, chunk_size)
+        keep = in_bbox.keys() if keep is None else keep & in_bbox.keys()
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for kind, node, value in iter_json_graph(f, chunk_size):
+            if keep is not None and node not in keep:
+                continue
+            if kind == "edges":
+                value = [{"node": edge["node"], "weight": edge["weight"], **edge} for edge in value
+                         if keep is None or edge["node"] in keep]
+            yield kind, node, value
+
+
+def stream_graph_from_json(file_path, nodes=None, bbox=None, chunk_size=1 << 16):
+    """
+    Load graph data and positions from a JSON file without parsing the whole document at once.
+
+    Same result as `load_graph_from_json`, but the file is read node by node, so besides the result
+    only one adjacency list is held in memory. With a filter, edges to nodes outside the selection
+    are dropped as they are read.
+    :param file_path: Path to the JSON file.
+    :param nodes: Optional collection of node names to keep.
+    :param bbox: Optional bounding box (min_x, min_y, max_x, max_y) of the positions of the nodes to
+                 keep; nodes without a position are dropped.
+    :param chunk_size: Number of characters read from the file at a time.
+    :return: A tuple containing two elements:
+             1. A dictionary representing the graph structure.
+             2. A dictionary representing the positions of the nodes.
+    """
+    graph, positions = {}, {}
+    for kind, node, value in _iter_filtered_graph(file_path, nodes, bbox, chunk_size):
+        if kind == "edges":
+            graph[node] = value
+        else:
+            positions[node] = list(value)
+    return graph, positions
+
+
+def stream_compact_graph_from_json(file_path, nodes=None, bbox=None, chunk_size=1 << 16, attributes=()):
+    """
+    Load a JSON graph file straight into a CompactGraph, reading it node by node.
+
+    The edges are collected by a `GraphBuilder` as the file is read (like `CompactGraph.from_data`), so
+    neither the parsed document nor the dictionary of adjacency lists is ever materialised.
+    :param file_path: Path to the JSON file.
+    :param nodes: Optional collection of node names to keep.
+    :param bbox: Optional bounding box (min_x, min_y, max_x, max_y), see `stream_graph_from_json`.
+    :param chunk_size: Number of characters read from the file at a time.
+    :param attributes: Names of edge attributes (e.g. "time", "toll") stored as arrays besides the weights.
+    :return: CompactGraph object with the node positions.
+    """
+    builder, positions = GraphBuilder(attributes), {}
+    for kind, node, value in _iter_filtered_graph(file_path, nodes, bbox, chunk_size):
+        if kind == "edges":
+            builder.add_adjacency(node, value)
+        else:
+            positions[node] = value
+    node_names = builder.node_names
+    return CompactGraph(node_names, *builder.csr_arrays(), position_array(node_names, positions),
+                        builder.csr_attributes())
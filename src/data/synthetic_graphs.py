@@ -0,0 +1,156 @@
+import math
+import random
+
+GRAPH_KINDS = ("grid", "geometric", "scale_free")
+
+
+def grid_graph_data(side, seed=0):
+    """
+    Build a side x side grid road graph in the JSON dictionary format with random integer weights.
+    Nodes are named "row-col".
+    :param side: Number of nodes per row and column.
+    :param seed: Seed for the edge weights.
+    :return: Dictionary representing the graph structure.
+    """
+    rng = random.Random(seed)
+    graph = {f"{row}-{col}": [] for row in range(side) for col in range(side)}
+    for row in range(side):
+        for col in range(side):
+            for next_row, next_col in ((row + 1, col), (row, col + 1)):
+                if next_row < side and next_col < side:
+                    weight = rng.randint(1, 100)
+                    graph[f"{row}-{col}"].append({"node": f"{next_row}-{next_col}", "weight": weight})
+                    graph[f"{next_row}-{next_col}"].append({"node": f"{row}-{col}", "weight": weight})
+    return graph
+
+
+def grid_positions(side):
+    """
+    Positions of the nodes of `grid_graph_data`, one unit apart.
+    :param side: Number of nodes per row and column.
+    :return: Dictionary {"row-col": [col, row]}.
+    """
+    return {f"{row}-{col}": [col, row] for row in range(side) for col in range(side)}
+
+
+def _distance_weight(positions, u, v, scale):
+    """Integer edge weight proportional to the Euclidean distance between two nodes (at least 1)."""
+    (x1, y1), (x2, y2) = positions[u], positions[v]
+    return max(1, round(math.hypot(x1 - x2, y1 - y2) * scale))
+
+
+def random_geometric_graph_data(num_nodes, radius=None, seed=0):
+    """
+    Build a random geometric road graph: nodes are uniform random points in the unit square and
+    every pair closer than radius is connected, with a weight proportional to its length.
+    Nodes are named "g<i>". Neighbor pairs are found with a cell grid, in linear expected time.
+    :param num_nodes: Number of nodes.
+    :param radius: Connection radius, by default the connectivity threshold sqrt(ln(n) / (pi * n)):
+                   the mean degree is about ln(n) and all but a few nodes are connected.
+    :param seed: Seed for the node positions.
+    :return: A tuple containing two elements:
+             1. A dictionary representing the graph structure.
+             2. A dictionary representing the positions of the nodes.
+    """
+    rng = random.Random(seed)
+    if radius is None:
+        radius = math.sqrt(math.log(max(num_nodes, 2)) / (math.pi * max(num_nodes, 1)))
+    names = [f"g{i}" for i in range(num_nodes)]
+    positions = {name: [rng.random(), rng.random()] for name in names}
+    scale = 100 / radius
+
+    cells = {}
+    for name in names:
+        x, y = positions[name]
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(name)
+
+    graph = {name: [] for name in names}
+    for name in names:
+        x, y = positions[name]
+        cell_x, cell_y = int(x / radius), int(y / radius)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for other in cells.get((cell_x + dx, cell_y + dy), ()):
+                    other_x, other_y = positions[other]
+                    if other != name and (x - other_x) ** 2 + (y - other_y) ** 2 <= radius ** 2:
+                        graph[name].append({"node": other, "weight": _distance_weight(positions, name, other, scale)})
+    return graph, positions
+
+
+def scale_free_graph_data(num_nodes, edges_per_node=2, seed=0):
+    """
+    Build a scale-free graph by preferential attachment (Barabasi-Albert): each new node connects to
+    edges_per_node existing nodes picked with probability proportional to their degree. Nodes get
+    random positions in the unit square and weights proportional to the edge length.
+    Nodes are named "s<i>".
+    :param num_nodes: Number of nodes.
+    :param edges_per_node: Number of edges added with every new node.
+    :param seed: Seed for the attachment and the positions.
+    :return: A tuple containing two elements:
+             1. A dictionary representing the graph structure.
+             2. A dictionary representing the positions of the nodes.
+    """
+    rng = random.Random(seed)
+    names = [f"s{i}" for i in range(num_nodes)]
+    positions = {name: [rng.random(), rng.random()] for name in names}
+    scale = 100 * math.sqrt(max(num_nodes, 1))
+    graph = {name: [] for name in names}
+
+    # Every node appears in `endpoints` once per incident edge, so a uniform draw is degree-proportional
+    endpoints = []
+    for new in range(num_nodes):
+        if new <= edges_per_node:
+            targets = set(range(new))
+        else:
+            targets = set()
+            while len(targets) < edges_per_node:
+                targets.add(rng.choice(endpoints))
+        for target in sorted(targets):
+            u, v = names[new], names[target]
+            weight = _distance_weight(positions, u, v, scale)
+            graph[u].append({"node": v, "weight": weight})
+            graph[v].append({"node": u, "weight": weight})
+            endpoints.extend((new, target))
+    return graph, positions
+
+
+def add_travel_attributes(graph, toll_fraction=0.2, seed=0):
+    """
+    Give every edge of graph data a "time" and a "toll" attribute, the same in both directions, so that
+    distance, time and tolls conflict: a fraction of the edges are toll roads, twice as fast as their length
+    suggests, and the other roads are up to 50% slower.
+    :param graph: Dictionary in the JSON format, changed in place.
+    :param toll_fraction: Fraction of the edges that are toll roads.
+    :param seed: Seed of the generator.
+    :return: The same dictionary.
+    """
+    rng = random.Random(seed)
+    attributes = {}
+    for node, edges in graph.items():
+        for edge in edges:
+            key = (node, edge["node"]) if node <= edge["node"] else (edge["node"], node)
+            if key not in attributes:
+                if rng.random() < toll_fraction:
+                    attributes[key] = {"time": max(1, round(edge["weight"] / 2)), "toll": rng.randint(1, 20)}
+                else:
+                    attributes[key] = {"time": round(edge["weight"] * rng.uniform(1.0, 1.5)), "toll": 0}
+            edge.update(attributes[key])
+    return graph
+
+
+def synthetic_graph_data(kind, num_nodes, seed=0):
+    """
+    Build a synthetic graph of roughly num_nodes nodes.
+    :param kind: One of GRAPH_KINDS; a grid has the largest square number of nodes not above num_nodes.
+    :param num_nodes: Number of nodes.
+    :param seed: Seed of the generator.
+    :return: A tuple (graph data, positions), like `load_graph_from_json`.
+    """
+    if kind == "grid":
+        side = max(math.isqrt(num_nodes), 1)
+        return grid_graph_data(side, seed), grid_positions(side)
+    if kind == "geometric":
+        return random_geometric_graph_data(num_nodes, seed=seed)
+    if kind == "scale_free":
+        return scale_free_graph_data(num_nodes, seed=seed)
+    raise ValueError(f"Unknown graph kind {kind!r}, expected one of {GRAPH_KINDS}")
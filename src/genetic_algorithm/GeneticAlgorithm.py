@@ -1,51 +1,99 @@
+import heapq
 import random
+import time
+
+import numpy as np
+from src.genetic_algorithm.batch_fitness import BatchFitnessEvaluator, pack_population
+from src.genetic_algorithm.fitness_cache import FitnessCache
+from src.genetic_algorithm.objectives import DISTANCE_WEIGHT, END_BONUS, EXPLORATION_BONUS
+from src.genetic_algorithm.profiling import NULL_PROFILER
+from src.genetic_algorithm.random_streams import make_rng
+from src.genetic_algorithm.selection import SELECTION_SCHEMES, select_indices
+from src.genetic_algorithm.progress import progress_event
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import distance_cache_for
 from src.graph.graph_manager import create_graph_from_data
+from src.graph.graph_utils import update_edges
 
+ENGINES = ("networkx", "compact")
 
-def selection(population, fitnesses, tournament_size=3):
-    """Tournament selection to choose parents for the next generation."""
+
+def selection(population, fitnesses, tournament_size=3, rng=random):
+    """
+    Tournament selection to choose parents for the next generation.
+    The rng argument of the operators is a random.Random instance (by default the global `random` module).
+    """
+    # Sampling indices draws the same random numbers as sampling (individual, fitness) pairs, without
+    # building the pairs list on every round
+    indices = range(len(population))
     selected = []
     for _ in range(len(population)):
-        tournament = random.sample(list(zip(population, fitnesses)), tournament_size)
-        winner = max(tournament, key=lambda x: x[1])[0]  # Select the individual with the highest fitness
-        selected.append(winner)
+        tournament = rng.sample(indices, tournament_size)
+        winner = max(tournament, key=fitnesses.__getitem__)  # Select the individual with the highest fitness
+        selected.append(population[winner])
     return selected
 
 
-def crossover(parent1, parent2, graph, end_node):
-    """Perform crossover between two parents and correct invalid paths."""
+def first_positions(path):
+    """Map every node of a path to the index of its first occurrence."""
+    # Built back to front so that the first occurrence of a repeated node is written last
+    return dict(zip(reversed(path), range(len(path) - 1, -1, -1)))
+
+
+def crossover(parent1, parent2, graph, end_node, guide=None, rng=random):
+    """Perform crossover between two parents and correct invalid paths (guided by an optional GoalGuide)."""
     # Find a common node if exists to perform crossover; otherwise, keep the first parent
-    common_nodes = set(parent1).intersection(parent2)
+    # Candidates are kept in parent1 order so the choice does not depend on set/hash ordering;
+    # the position map of parent2 doubles as its membership set (one pass over each parent)
+    positions2 = first_positions(parent2)
+    common_nodes = [node for node in parent1 if node in positions2]
     if common_nodes:
-        crossover_point = random.choice(list(common_nodes))
-        idx1, idx2 = parent1.index(crossover_point), parent2.index(crossover_point)
+        crossover_point = rng.choice(common_nodes)
+        idx1, idx2 = parent1.index(crossover_point), positions2[crossover_point]
 
-        # Generate the child and ensure it is a valid path by removing duplicates
-        child = parent1[:idx1] + parent2[idx2:]
-        child = list(dict.fromkeys(child))  # Remove duplicates while preserving order
+        # Generate the child and ensure it is a valid path by removing duplicates while preserving order
+        child = list(dict.fromkeys(parent1[:idx1] + parent2[idx2:]))
 
         # Correct path to reach end_node if not included
         if child[-1] != end_node:
-            child = correct_path_to_end(child, graph, end_node)
+            child = correct_path_to_end(child, graph, end_node, guide, rng)
         return child
     return parent1
 
 
-def correct_path_to_end(child, graph, end_node):
-    """Ensure the child path connects to the end_node by adding valid nodes."""
+def correct_path_to_end(child, graph, end_node, guide=None, rng=random):
+    """
+    Ensure the child path connects to the end_node by adding valid nodes.
+    With a GoalGuide, steps are biased toward end_node and a walk that gets stuck is completed along
+    shortest routes, so the repair only fails if end_node is unreachable.
+    """
+    if guide is not None:
+        visited = set(child)
+        while child[-1] != end_node:
+            next_node = guide.step(child[-1], visited, rng)
+            if next_node is None:
+                return guide.complete(child)
+            child.append(next_node)
+            visited.add(next_node)
+        return child
+
+    visited = set(child)  # Membership set so each step costs O(degree) instead of O(path length)
     last_node = child[-1]
     while last_node != end_node:
-        neighbors = [node for node in graph[last_node] if node not in child]
+        neighbors = [node for node in graph[last_node] if node not in visited]
         if not neighbors:
             return None  # Return None if no valid path to end_node can be found
-        next_node = random.choice(neighbors)
+        next_node = rng.choice(neighbors)
         child.append(next_node)
+        visited.add(next_node)
         last_node = next_node
     return child
 
 
 def calculate_path_distance(graph, path):
     """Calculate the total distance of a path on the graph."""
+    if isinstance(graph, CompactGraph):
+        return graph.path_distance(path)
     total_distance = 0
     for i in range(len(path) - 1):
         current_node, next_node = path[i], path[i + 1]
@@ -56,40 +104,180 @@ def calculate_path_distance(graph, path):
 
 
 class GeneticAlgorithm:
-
-    def __init__(self, graph, start_node, end_node, generations, population_size):
-        self.graph = create_graph_from_data(graph)  # Create graph from provided data
-        self.start_node = start_node
-        self.end_node = end_node
+    # Names of the edge attributes kept besides the weight when the graph is built from graph data
+    graph_attributes = ()
+
+    def __init__(self, graph, start_node, end_node, generations, population_size, engine="networkx",
+                 batch_fitness=False, progress=None, verbose=False, guided=False, elitism=0,
+                 stall_generations=None, target_distance=None, time_budget=None, fitness_cache_size=65536,
+                 profiler=None, selection_scheme=None, selection_params=None, seed=None, rng=None,
+                 initial_paths=None):
+        """
+        :param graph: Graph data as returned by `load_graph_from_json`, or a prebuilt CompactGraph.
+        :param engine: "networkx" to evolve paths of node names on a networkx.Graph, or "compact" to
+                       evolve paths of integer ids on a CompactGraph. Both give the same result for a
+                       fixed random seed; paths are translated back to node names on output.
+        :param batch_fitness: Evaluate whole populations at once with a BatchFitnessEvaluator instead of
+                              calling `fitness` per individual. The fitness values are the same.
+        :param progress: Optional callable receiving a progress event (see `progress_event`) after every
+                         generation is evaluated. No statistics are computed when it is None.
+        :param verbose: Print every generation and individual to stdout (slow for large populations).
+        :param guided: Bias random walks toward end_node with a precomputed distance-to-goal table
+                       (cached per destination on the graph object) and complete walks and repairs that
+                       get stuck along shortest routes, so no individual is lost when a path exists.
+        :param elitism: Number of fittest individuals, by base fitness (see `elite_indices`), carried unchanged
+                        into the next generation.
+        :param stall_generations: Stop when the best distance has not improved for this many generations.
+        :param target_distance: Stop as soon as the best individual reaches end_node within this distance.
+        :param time_budget: Stop starting new generations after this many seconds of `run`.
+        :param fitness_cache_size: Number of paths whose distance and base fitness are memoized during a
+                                   run (0 disables the memo table).
+        :param profiler: Optional PhaseProfiler accumulating time per phase and counts of rejected
+                         children and failed repairs (see `profiling`).
+        :param selection_scheme: None for the original tournament selection on the `random` module, or
+                                 one of SELECTION_SCHEMES ("tournament", "sus", "rank", "truncation")
+                                 for the vectorised NumPy implementations (see `selection`).
+        :param selection_params: Optional parameters of the scheme (tournament_size, pressure or fraction).
+        :param seed: Seed of a private random generator for this instance (an int or a str), see `make_rng`.
+                     With the same seed a run draws the same numbers as after ``random.seed(seed)``.
+        :param rng: Random generator to use instead (a random.Random, e.g. from `spawn_rngs`). Without
+                    seed and rng the global `random` module is used.
+        :param initial_paths: Optional paths of node names from start_node (e.g. the k shortest paths) put in
+                              the initial population before the random walks that fill it up.
+        """
+        if isinstance(graph, CompactGraph):
+            engine = "compact"
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+        self.engine = engine
+
+        if engine == "compact":
+            self.graph = graph if isinstance(graph, CompactGraph) else CompactGraph.from_data(
+                graph, attributes=self.graph_attributes)
+            self.start_node = self.graph.index(start_node)
+            self.end_node = self.graph.index(end_node)
+        else:
+            self.graph = create_graph_from_data(graph, self.graph_attributes)  # Create graph from provided data
+            self.start_node = start_node
+            self.end_node = end_node
+        self.initial_paths = []
+        for path in initial_paths or ():
+            engine_path = self.graph.to_ids(path) if engine == "compact" else list(path)
+            if not engine_path or engine_path[0] != self.start_node or not self.is_valid_path(engine_path):
+                raise ValueError(f"Initial path {path} does not start at {start_node!r} or is not connected")
+            self.initial_paths.append(engine_path)
         self.generations = generations
         self.population_size = population_size
         self.visited_nodes = set()
+        self.progress = progress
+        self.verbose = verbose
+        self.guide = distance_cache_for(self.graph).guide(self.end_node) if guided else None
+        self.elitism = elitism
+        self.stall_generations = stall_generations
+        self.target_distance = target_distance
+        self.time_budget = time_budget
+        self.generation = 0
+        self.evaluations = 0
+        self.start_time = None
+        self.stop_reason = None
+        self.best_distance = float('inf')
+        self.stalled_generations = 0
+        self.base_fitnesses = []  # Base fitness of every individual of the last evaluated population
+        self.best_individual = None  # Fittest path seen so far in the run, see `update_best`
+        self.best_base_fitness = -float('inf')
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        self.rng = rng if rng is not None else make_rng(seed) if seed is not None else random
+        if selection_scheme is not None and selection_scheme not in SELECTION_SCHEMES:
+            raise ValueError(f"Unknown selection scheme {selection_scheme!r}, expected one of {SELECTION_SCHEMES}")
+        self.selection_scheme = selection_scheme
+        self.selection_params = selection_params or {}
+        self._selection_rng = None
+
+        self.fitness_cache = FitnessCache(fitness_cache_size) if fitness_cache_size else None
+        self.population = None  # Last population of `run` or `resume`
+
+        self.batch_evaluator = None
+        if batch_fitness:
+            self.build_batch_evaluator()
+
+    def build_batch_evaluator(self):
+        """(Re)build the batch fitness evaluator on the current edges of the graph."""
+        compact = self.graph if self.engine == "compact" else CompactGraph.from_networkx(self.graph)
+        self.batch_node_index = None if self.engine == "compact" else compact.node_index
+        end_node = self.end_node if self.engine == "compact" else compact.index(self.end_node)
+        previous = self.batch_evaluator
+        self.batch_evaluator = BatchFitnessEvaluator(compact, end_node)
+        if previous is not None:
+            self.batch_evaluator.visited[:] = previous.visited  # Keep the exploration bonus state
 
     def fitness(self, individual):
         """Calculate fitness based on path distance and node exploration."""
+        return self.add_exploration_bonus(individual, self.memoized_base_fitness(individual)[1])
+
+    def memoized_base_fitness(self, individual):
+        """`base_fitness` through the memo table, when there is one."""
+        if self.fitness_cache is None:
+            return self.base_fitness(individual)
+        key = tuple(individual)
+        cached = self.fitness_cache.get(key)
+        if cached is None:
+            cached = self.base_fitness(individual)
+            self.fitness_cache.put(key, cached)
+        return cached
+
+    def add_exploration_bonus(self, individual, fitness):
+        """Add the reward of the nodes of individual that no earlier path visited to its base fitness."""
+        if fitness == -float('inf'):
+            return fitness
+
+        # Add a small reward for exploring new nodes
+        unexplored_nodes = set(individual) - self.visited_nodes
+        fitness += len(unexplored_nodes) * EXPLORATION_BONUS
+        self.visited_nodes.update(unexplored_nodes)
+
+        return fitness
+
+    def base_fitness(self, individual):
+        """
+        Pure part of the fitness: it only depends on the path, unlike the exploration bonus that depends
+        on the nodes visited so far, so it can be memoized.
+        :return: A tuple (distance, fitness) where both are infinite (-inf fitness) for invalid paths.
+        """
         if not self.is_valid_path(individual):
-            return -float('inf')  # Penalize invalid paths directly
+            return float('inf'), -float('inf')  # Penalize invalid paths directly
 
         total_distance = calculate_path_distance(self.graph, individual)
         if total_distance == float('inf'):
-            return -float('inf')  # Penalize invalid paths
+            return total_distance, -float('inf')  # Penalize invalid paths
+        return total_distance, self.distance_fitness(total_distance, individual[-1] == self.end_node)
 
-        # Adjust distance weight for stronger penalization of long paths
-        distance_weight = 0.85  # Increased emphasis on short distance
-        path_fitness = (1 / (1 + total_distance)) ** distance_weight
+    @staticmethod
+    def distance_fitness(total_distance, reached_end):
+        """Fitness of a valid path from its distance and whether it ends at end_node."""
+        path_fitness = (1 / (1 + total_distance)) ** DISTANCE_WEIGHT
 
         # Reward correct end node
-        if individual[-1] == self.end_node:
-            fitness = path_fitness + 3.0  # Higher reward for reaching end_node
-        else:
-            fitness = path_fitness - total_distance  # Heavy penalty for non-terminal paths
-
-        # Add a small reward for exploring new nodes
-        unexplored_nodes = set(individual) - self.visited_nodes
-        fitness += len(unexplored_nodes) * 0.1
-        self.visited_nodes.update(unexplored_nodes)
-
-        return fitness
+        if reached_end:
+            return path_fitness + END_BONUS
+        return path_fitness - total_distance  # Heavy penalty for non-terminal paths
+
+    def evaluate_population(self, population):
+        """
+        Calculate the fitness of every individual, in order, as a list. Their base fitness, without the
+        exploration bonus, is kept in `base_fitnesses`.
+        """
+        with self.profiler.phase("fitness"):
+            if self.batch_evaluator is None:
+                self.base_fitnesses = [self.memoized_base_fitness(individual)[1] for individual in population]
+                return [self.add_exploration_bonus(individual, fitness)
+                        for individual, fitness in zip(population, self.base_fitnesses)]
+            return self.evaluate_packed(*pack_population(population, self.batch_node_index))
+
+    def evaluate_packed(self, nodes, offsets):
+        """`evaluate_population` of a population packed for the batch evaluator."""
+        base_fitnesses, _, valid = self.batch_evaluator.evaluate_base(nodes, offsets)
+        self.base_fitnesses = base_fitnesses.tolist()
+        return self.batch_evaluator.add_exploration_bonus(base_fitnesses, nodes, offsets, valid).tolist()
 
     def is_valid_path(self, path):
         """Check if a given path is valid in the graph."""
@@ -100,77 +288,300 @@ class GeneticAlgorithm:
 
     def create_initial_population(self):
         """Create the initial population with random paths."""
-        population = []
-        for _ in range(self.population_size):
-            individual = [self.start_node]
-            current_node = self.start_node
-            while current_node != self.end_node:
-                next_node = self.get_random_adjacent_node(current_node, individual)
-                if next_node is None:
-                    break  # If no valid next node, stop the path
-                individual.append(next_node)
-                current_node = next_node
-            if self.is_valid_path(individual):  # Ensure only valid paths are added
-                population.append(individual)
-        return population
-
-    def get_random_adjacent_node(self, node, current_path):
-        """Get a random adjacent node that has not been visited in the current path."""
-        adjacent_nodes = [neighbor for neighbor in self.graph[node] if neighbor not in current_path]
+        with self.profiler.phase("initialization"):
+            population = [list(path) for path in self.initial_paths[:self.population_size]]
+            for _ in range(self.population_size - len(population)):
+                individual = self.random_path()
+                if individual is not None:
+                    population.append(individual)
+            return population
+
+    def random_path(self):
+        """Random walk from start_node that stops at end_node or when stuck; None if the path is invalid."""
+        individual = [self.start_node]
+        visited = {self.start_node}
+        current_node = self.start_node
+        while current_node != self.end_node:
+            next_node = self.get_random_adjacent_node(current_node, visited)
+            if next_node is None:
+                if self.guide is not None and self.guide.reachable(current_node):
+                    individual = self.guide.complete(individual)
+                break  # If no valid next node, stop the path
+            individual.append(next_node)
+            visited.add(next_node)
+            current_node = next_node
+        if self.is_valid_path(individual):  # Ensure only valid paths are added
+            return individual
+        self.profiler.count("initial_paths_rejected")
+        return None
+
+    def get_random_adjacent_node(self, node, visited):
+        """Get a random adjacent node that has not been visited in the current path (a set, or the path)."""
+        if self.guide is not None:
+            return self.guide.step(node, visited, self.rng)
+        adjacent_nodes = [neighbor for neighbor in self.graph[node] if neighbor not in visited]
         if not adjacent_nodes:
             return None  # No unvisited adjacent nodes
-        return random.choice(adjacent_nodes)
+        return self.rng.choice(adjacent_nodes)
+
+    def recombine(self, parent1, parent2):
+        """Crossover of two parents into one child (see `crossover`), or None if it cannot be repaired."""
+        return crossover(parent1, parent2, self.graph, self.end_node, self.guide, self.rng)
 
     def mutate(self, individual, mutation_rate=0.2):
         """Apply mutation to a path to introduce diversity."""
         for i in range(1, len(individual) - 1):  # Exclude start and end nodes
-            if random.random() < mutation_rate:
+            if self.rng.random() < mutation_rate:
                 current_node = individual[i]
                 neighbors = list(self.graph.neighbors(current_node))
                 if neighbors:
                     # Replace with a random neighbor if possible
-                    individual[i] = random.choice(neighbors)
+                    individual[i] = self.rng.choice(neighbors)
 
         # Remove any duplicates that could create loops in the path
         individual = list(dict.fromkeys(individual))
 
         # Ensure path reaches the end node
         if individual[-1] != self.end_node:
-            individual = correct_path_to_end(individual, self.graph, self.end_node)
+            individual = correct_path_to_end(individual, self.graph, self.end_node, self.guide, self.rng)
+            if individual is None:
+                self.profiler.count("mutation_repair_failures")
+                return None
+
+        if not self.is_valid_path(individual):
+            self.profiler.count("invalid_mutations")
+            return None  # Return None if invalid
+        return individual
 
-        return individual if individual and self.is_valid_path(individual) else None  # Return None if invalid
+    def to_node_names(self, path):
+        """Translate an engine path (node names or integer ids) into node names."""
+        if self.engine == "compact" and path is not None:
+            return self.graph.to_names(path)
+        return path
 
     def visualize_population(self, population, fitnesses):
         """Visualize the population and their fitness scores."""
         print("Current Population and Fitnesses:")
         for i, (individual, fitness) in enumerate(zip(population, fitnesses)):
-            print(f"Individual {i + 1}: Path = {individual} | Fitness = {fitness:.4f}")
+            print(f"Individual {i + 1}: Path = {self.to_node_names(individual)} | Fitness = {fitness:.4f}")
+
+    def select(self, population, fitnesses):
+        """Select as many parents as there are individuals with the configured selection scheme."""
+        if self.selection_scheme is None:
+            return selection(population, fitnesses, rng=self.rng)
+        if self._selection_rng is None:
+            # Seeded from the instance generator so that its seed makes runs reproducible
+            self._selection_rng = np.random.default_rng(self.rng.getrandbits(64))
+        indices = select_indices(self.selection_scheme, fitnesses, len(population), self._selection_rng,
+                                 **self.selection_params)
+        return [population[i] for i in indices.tolist()]
+
+    def create_next_generation(self, population, fitnesses):
+        """Create the next generation through selection, crossover and mutation."""
+        profiler = self.profiler
+        # Selection: tournament selection
+        with profiler.phase("selection"):
+            selected_population = self.select(population, fitnesses)
+
+        # Elitism: the fittest individuals survive unchanged
+        next_generation = []
+        if self.elitism:
+            with profiler.phase("elitism"):
+                next_generation = [list(population[i]) for i in self.elite_indices()]
+
+        # Crossover and mutation to create the next generation
+        while len(next_generation) < self.population_size:
+            with profiler.phase("crossover"):
+                parent1, parent2 = self.rng.sample(selected_population, 2)
+                child = self.recombine(parent1, parent2)
+            if child:
+                with profiler.phase("mutation"):
+                    child = self.mutate(child)  # Ensure mutation on valid paths
+            else:
+                profiler.count("crossover_repair_failures")
+            if child:  # mutate only returns valid paths
+                next_generation.append(child)
+                profiler.count("children_accepted")
+            else:
+                profiler.count("children_rejected")
+        return next_generation
+
+    def evolve(self, population, generations):
+        """Evolve a population for a number of generations and return the last generation."""
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        track_best = self.progress is not None or self.stall_generations is not None or self.target_distance is not None
+        for _ in range(generations):
+            if self.time_budget is not None and time.perf_counter() - self.start_time >= self.time_budget:
+                self.stop_reason = "time_budget"
+                break
+            self.generation += 1
+            if self.verbose:
+                print(f"\nGeneration {self.generation}:")
+            fitnesses = self.evaluate_population(population)
+            self.evaluations += len(population)
+
+            if self.verbose:
+                # Visualize the population and their fitnesses
+                self.visualize_population(population, fitnesses)
+            best_individual = self.update_best(population)
+            if track_best:
+                with self.profiler.phase("progress"):
+                    best_distance = calculate_path_distance(self.graph, best_individual)
+                    if self.progress is not None:
+                        self.progress(progress_event(self.generation, fitnesses, best_distance,
+                                                     time.perf_counter() - self.start_time, self.evaluations))
+                    stop = self.converged(best_individual, best_distance)
+                if stop:
+                    break
+
+            population = self.create_next_generation(population, fitnesses)
+        return population
+
+    def converged(self, best_individual, best_distance):
+        """Update the stall counter with the best individual of a generation and check the stop criteria."""
+        reached_end = best_individual[-1] == self.end_node
+        if reached_end and best_distance < self.best_distance:
+            self.best_distance = best_distance
+            self.stalled_generations = 0
+        else:
+            self.stalled_generations += 1
+
+        if self.target_distance is not None and reached_end and best_distance <= self.target_distance:
+            self.stop_reason = "target_distance"
+        elif self.stall_generations is not None and self.stalled_generations >= self.stall_generations:
+            self.stop_reason = "stalled"
+        return self.stop_reason is not None
+
+    def elite_indices(self):
+        """
+        Indices of the `elitism` individuals of the last evaluated population with the highest base fitness,
+        fittest first. The exploration bonus is left out: it rewards the first path to reach a node, not the
+        path itself, and must not rank a longer route above a shorter one.
+        """
+        base_fitnesses = self.base_fitnesses
+        return heapq.nlargest(self.elitism, range(len(base_fitnesses)), key=base_fitnesses.__getitem__)
+
+    def update_best(self, population):
+        """
+        Keep the fittest path seen so far in the run, by base fitness, up to date with the last evaluated
+        population.
+        :return: The fittest individual of the population.
+        """
+        base_fitnesses = self.base_fitnesses
+        best_base_fitness = max(base_fitnesses)
+        best_individual = population[base_fitnesses.index(best_base_fitness)]
+        if self.best_individual is None or best_base_fitness > self.best_base_fitness:
+            self.best_base_fitness = best_base_fitness
+            self.best_individual = (best_individual.tolist() if isinstance(best_individual, np.ndarray)
+                                    else list(best_individual))
+        return best_individual
+
+    def select_best(self, population):
+        """Return the fittest individual of a population (engine path), by base fitness, and its distance."""
+        self.evaluate_population(population)
+        base_fitnesses = self.base_fitnesses
+        best_individual = population[base_fitnesses.index(max(base_fitnesses))]
+        return best_individual, calculate_path_distance(self.graph, best_individual)
+
+    def update_graph(self, changes):
+        """
+        Apply edge changes to the graph in place (see `update_edges`) while keeping everything learnt on the
+        rest of the graph: only the memoized fitness of paths that use a changed, removed or added edge is
+        dropped (an added edge can make a memoized invalid path valid). The goal guide and the batch evaluator
+        are rebuilt on the new edges. Call `resume` afterwards.
+        :param changes: Iterable of (node1, node2, weight) or (node1, node2, weight, attributes) tuples of node
+                        names; a weight of None removes the edge and an edge not in the graph is added.
+        :return: Number of memoized paths dropped.
+        """
+        stale = update_edges(self.graph, changes)
+        if self.engine == "compact":
+            stale = {(self.graph.index(u), self.graph.index(v)) for u, v in stale}
+        dropped = 0
+        if stale and self.fitness_cache is not None:
+            dropped = self.fitness_cache.discard_where(lambda path: any(edge in stale for edge in zip(path, path[1:])))
+        if self.guide is not None:
+            self.guide = distance_cache_for(self.graph).guide(self.end_node)
+        if self.batch_evaluator is not None:
+            self.build_batch_evaluator()
+        return dropped
+
+    def repair_path(self, individual):
+        """
+        Cut a path before its first edge missing from the graph and walk it again to end_node.
+        :return: The path (unchanged if all its edges exist), or None if end_node cannot be reached.
+        """
+        for i in range(len(individual) - 1):
+            if individual[i + 1] not in self.graph[individual[i]]:
+                return correct_path_to_end(individual[:i + 1], self.graph, self.end_node, self.guide, self.rng)
+        return individual
+
+    def repair_population(self, population):
+        """
+        Make a population valid on the current edges: every path is repaired with `repair_path`, and paths
+        that cannot be repaired are replaced with random paths.
+        """
+        with self.profiler.phase("initialization"):
+            repaired = []
+            for individual in population:
+                individual = self.repair_path(individual)
+                if individual is not None:
+                    repaired.append(individual)
+                else:
+                    self.profiler.count("population_repair_failures")
+            for _ in range(self.population_size - len(repaired)):
+                individual = self.random_path()
+                if individual is not None:
+                    repaired.append(individual)
+            return repaired
+
+    def _start_run(self):
+        """Reset the per-run state (generation counter, stop criteria, selection generator)."""
+        self.generation = 0
+        self.evaluations = 0
+        self.start_time = time.perf_counter()
+        self.stop_reason = None
+        self.best_distance = float('inf')
+        self.stalled_generations = 0
+        self.best_individual = None
+        self.best_base_fitness = -float('inf')
+        self._selection_rng = None
+
+    def _finish_run(self, population):
+        """
+        Keep the last population for `resume` and return the best path seen during the run, in node names,
+        and its distance.
+        """
+        if self.stop_reason is None:
+            self.stop_reason = "generations"
+        self.population = population
+
+        # Return the best solution of all generations, the last one included
+        self.evaluate_population(population)
+        self.update_best(population)
+        return self.to_node_names(self.best_individual), calculate_path_distance(self.graph, self.best_individual)
 
     def run(self):
         """Run the genetic algorithm to find the best path from start to end node."""
-        population = self.create_initial_population()
-        for generation in range(self.generations):
-            print(f"\nGeneration {generation + 1}:")
-            fitnesses = [self.fitness(individual) for individual in population]
-
-            # Visualize the population and their fitnesses
-            self.visualize_population(population, fitnesses)
-
-            # Selection: tournament selection
-            selected_population = selection(population, fitnesses)
-
-            # Crossover and mutation to create the next generation
-            next_generation = []
-            while len(next_generation) < self.population_size:
-                parent1, parent2 = random.sample(selected_population, 2)
-                child = crossover(parent1, parent2, self.graph, self.end_node)
-                child = self.mutate(child) if child else None  # Ensure mutation on valid paths
-                if child and self.is_valid_path(child):
-                    next_generation.append(child)
-
-            population = next_generation
-
-        # Return the best solution after all generations
-        best_individual = max(population, key=self.fitness)
-        best_distance = calculate_path_distance(self.graph, best_individual)
-        return best_individual, best_distance
+        self._start_run()
+        if self.fitness_cache is not None:
+            self.fitness_cache.clear()
+        with self.profiler.run():
+            population = self.evolve(self.create_initial_population(), self.generations)
+            return self._finish_run(population)
+
+    def resume(self, generations=None):
+        """
+        Warm start: continue evolving the last population of `run` (or `resume`), typically after
+        `update_graph`. The population is repaired and the memoized fitness of the unaffected paths is
+        reused, so the updated route takes far fewer generations than a cold `run`.
+        :param generations: Number of generations to evolve, by default `generations`.
+        :return: Same as `run`; a cold `run` is made if there is no population yet.
+        """
+        if self.population is None:
+            return self.run()
+        self._start_run()
+        with self.profiler.run():
+            population = self.evolve(self.repair_population(self.population),
+                                     self.generations if generations is None else generations)
+            return self._finish_run(population)
@@ -0,0 +1,360 @@
+import math
+
+import numpy as np
+
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm, correct_path_to_end
+
+# Rows are allocated this much wider than the longest path, so most children fit without growing them
+WIDTH_SLACK = 1.5
+
+# Outcome of a trial child, see `ArrayGeneticAlgorithm.create_next_generation`
+ACCEPTED, CROSSOVER_REPAIR_FAILED, MUTATION_REPAIR_FAILED, INVALID = range(4)
+
+
+class PopulationBuffers:
+    """
+    Population of paths of integer ids kept in preallocated NumPy matrices instead of a list of lists.
+
+    Individual i of the current generation is ``paths[i, :lengths[i]]``. Trial children are assembled in the
+    trial buffer (``trial_paths`` and ``trial_lengths``), the accepted ones are copied into the back buffer
+    (``next_paths`` and ``next_lengths``) and `swap` makes the back buffer the current generation. A generation
+    therefore allocates no per-individual objects, and the population is a handful of arrays the garbage
+    collector never scans. Ids take the smallest integer type that holds them (2 bytes up to 32767 nodes).
+
+    Rows are `WIDTH_SLACK` times as long as the longest path. Writing a longer path grows the matrices (by at
+    least the same factor) and `swap` narrows them when the paths of a generation have become much shorter, as
+    they do while a run converges, so they are reallocated a few times per run at most. The trial buffer grows
+    on its own, as the long trial children are mostly rejected.
+    """
+
+    def __init__(self, capacity, width, num_nodes):
+        """
+        :param capacity: Number of rows of every buffer, the largest generation.
+        :param width: Initial length of the rows.
+        :param num_nodes: Number of nodes of the graph.
+        """
+        self.capacity = capacity
+        self.num_nodes = num_nodes
+        self.dtype = next(dtype for dtype in (np.int16, np.int32, np.int64) if num_nodes <= np.iinfo(dtype).max)
+        self.width = self.trial_width = max(width, 1)
+        self.paths, self.next_paths, self.trial_paths = (np.zeros((capacity, self.width), dtype=self.dtype)
+                                                         for _ in range(3))
+        self.lengths, self.next_lengths, self.trial_lengths = (np.zeros(capacity, dtype=np.int64) for _ in range(3))
+        self.columns = self.trial_columns = np.arange(self.width)
+        self.size = 0
+
+    @classmethod
+    def from_paths(cls, paths, capacity, num_nodes):
+        """Buffers holding paths (lists of ids) as the current generation, with room for capacity individuals."""
+        longest = max((len(path) for path in paths), default=1)
+        buffers = cls(max(capacity, len(paths)), math.ceil(longest * WIDTH_SLACK), num_nodes)
+        for i, path in enumerate(paths):
+            buffers.paths[i, :len(path)] = path
+            buffers.lengths[i] = len(path)
+        buffers.size = len(paths)
+        return buffers
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        """Individual i of the current generation, as a view of its row."""
+        return self.paths[i, :self.lengths[i]]
+
+    def __iter__(self):
+        return (self[i] for i in range(self.size))
+
+    def to_lists(self):
+        """The current generation as a list of paths (lists of ids)."""
+        return [self.paths[i, :self.lengths[i]].tolist() for i in range(self.size)]
+
+    def ensure_width(self, width):
+        """Grow the rows of the current generation and of the back buffer so that a path of this length fits."""
+        if width > self.width:
+            self.width = max(width, math.ceil(self.width * WIDTH_SLACK))
+            self.paths, self.next_paths = _widen(self.paths, self.width), _widen(self.next_paths, self.width)
+            self.columns = np.arange(self.width)
+        self.ensure_trial_width(self.width)  # Trial rows are never shorter, so trials copy into the back buffer
+
+    def ensure_trial_width(self, width):
+        """Grow the rows of the trial buffer so that a path of this length fits."""
+        if width > self.trial_width:
+            self.trial_width = max(width, math.ceil(self.trial_width * WIDTH_SLACK))
+            self.trial_paths = _widen(self.trial_paths, self.trial_width)
+            self.trial_columns = np.arange(self.trial_width)
+
+    def write_trial(self, row, path):
+        """Write a path (a sequence of ids) into a row of the trial buffer."""
+        self.ensure_trial_width(len(path))
+        self.trial_paths[row, :len(path)] = path
+        self.trial_lengths[row] = len(path)
+
+    def accept_trials(self, start, trials):
+        """Copy rows of the trial buffer into the back buffer, from row start on."""
+        if not len(trials):
+            return
+        lengths = self.trial_lengths[trials]
+        self.ensure_width(int(lengths.max()))
+        self.next_paths[start:start + len(trials)] = self.trial_paths[trials, :self.width]
+        self.next_lengths[start:start + len(trials)] = lengths
+
+    def swap(self, size):
+        """Make the first size rows of the back buffer the current generation."""
+        self.paths, self.next_paths = self.next_paths, self.paths
+        self.lengths, self.next_lengths = self.next_lengths, self.lengths
+        self.size = size
+
+        width = math.ceil(int(self.lengths[:size].max(initial=1)) * WIDTH_SLACK)
+        if width * WIDTH_SLACK < self.width:
+            self.width = self.trial_width = width
+            matrices = (self.paths, self.next_paths, self.trial_paths)
+            self.paths, self.next_paths, self.trial_paths = (matrix[:, :width].copy() for matrix in matrices)
+            self.columns = self.trial_columns = np.arange(width)
+
+    def pack(self):
+        """The current generation as (nodes, offsets), see `pack_population`."""
+        lengths = self.lengths[:self.size]
+        offsets = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return self.paths[:self.size][self.columns < lengths[:, None]], offsets
+
+    @property
+    def nbytes(self):
+        """Bytes held by the buffers."""
+        return sum(array.nbytes for array in (self.paths, self.next_paths, self.trial_paths, self.lengths,
+                                              self.next_lengths, self.trial_lengths))
+
+
+def _widen(matrix, width):
+    """Copy of a matrix padded with zero columns up to width."""
+    widened = np.zeros((len(matrix), width), dtype=matrix.dtype)
+    widened[:, :matrix.shape[1]] = matrix
+    return widened
+
+
+def _ranks(rows, count):
+    """Rank of every entry among the entries of the same row, for row ids in ascending order."""
+    row_counts = np.bincount(rows, minlength=count)
+    return np.arange(len(rows)) - (np.cumsum(row_counts) - row_counts)[rows]
+
+
+def crossover_rows(buffers, parents1, parents2, draws):
+    """
+    `crossover` of many pairs of individuals of the current generation at once, without the repair. Child i is
+    written into row i of the trial buffer.
+
+    Nodes are matched between the parents by sorting (pair, node) keys, so the whole batch costs a few NumPy
+    calls. Paths must be simple: every node appears at most once per parent.
+    :param buffers: PopulationBuffers.
+    :param parents1: Array of row indices of the first parents.
+    :param parents2: Array of row indices of the second parents, paired with parents1.
+    :param draws: Uniform numbers in [0, 1) choosing the crossover point of every pair among the nodes of parent1
+                  that are in parent2, in parent1 order.
+    :return: Array of the crossover point positions in parents1; a pair without common node gives a copy of
+             parent1 and the length of parent1.
+    """
+    count, num_nodes = len(parents1), buffers.num_nodes
+    paths1, lengths1 = buffers.paths[parents1], buffers.lengths[parents1]
+    paths2, lengths2 = buffers.paths[parents2], buffers.lengths[parents2]
+    rows1, columns1 = np.nonzero(buffers.columns < lengths1[:, None])
+    rows2, columns2 = np.nonzero(buffers.columns < lengths2[:, None])
+    keys1 = rows1 * num_nodes + paths1[rows1, columns1]
+    keys2 = rows2 * num_nodes + paths2[rows2, columns2]
+
+    # Nodes of parent1 found in parent2, in parent1 order, and their position in parent2
+    order2 = np.argsort(keys2)
+    found2 = order2[np.minimum(np.searchsorted(keys2, keys1, sorter=order2), len(keys2) - 1)]
+    common = np.flatnonzero(keys2[found2] == keys1)
+    common_counts = np.bincount(rows1[common], minlength=count)
+    has_common = common_counts > 0
+    chosen = common[(np.cumsum(common_counts) - common_counts)[has_common] +
+                    (draws[has_common] * common_counts[has_common]).astype(np.int64)]
+    idx1, idx2 = lengths1.copy(), lengths2.copy()
+    idx1[has_common], idx2[has_common] = columns1[chosen], columns2[found2[chosen]]
+
+    # Child: parent1 before the crossover point, then parent2 from it without the nodes already taken
+    order1 = np.argsort(keys1)
+    found1 = order1[np.minimum(np.searchsorted(keys1, keys2, sorter=order1), len(keys1) - 1)]
+    in_head = (keys1[found1] == keys2) & (columns1[found1] < idx1[rows2])
+    tail = np.flatnonzero((columns2 >= idx2[rows2]) & ~in_head)
+    tail_rows = rows2[tail]
+    lengths = idx1 + np.bincount(tail_rows, minlength=count)
+
+    buffers.ensure_trial_width(int(lengths.max()))
+    buffers.trial_paths[:count, :paths1.shape[1]] = paths1
+    buffers.trial_paths[tail_rows, idx1[tail_rows] + _ranks(tail_rows, count)] = paths2[tail_rows, columns2[tail]]
+    buffers.trial_lengths[:count] = lengths
+    return idx1
+
+
+def mutate_rows(buffers, count, graph, rng, mutation_rate=0.2):
+    """
+    `mutate` the first count rows of the trial buffer at once, without the repair and the edge check: every
+    inner node is replaced with probability mutation_rate by a random neighbor, then repeated nodes are removed
+    (keeping their first occurrence).
+    :param graph: CompactGraph of the paths.
+    :param rng: numpy.random.Generator.
+    :return: Boolean array telling which rows were mutated.
+    """
+    paths, lengths = buffers.trial_paths[:count], buffers.trial_lengths[:count]
+    columns = buffers.trial_columns
+    rows, columns = np.nonzero((columns >= 1) & (columns < (lengths - 1)[:, None]))  # Exclude start and end nodes
+    drawn = rng.random(len(rows)) < mutation_rate
+    rows, columns = rows[drawn], columns[drawn]
+    nodes = paths[rows, columns].astype(np.int64)
+    starts = graph.offsets[nodes]
+    degrees = graph.offsets[nodes + 1] - starts
+    replaced = np.flatnonzero(degrees > 0)
+    picks = starts[replaced] + (rng.random(len(replaced)) * degrees[replaced]).astype(np.int64)
+    paths[rows[replaced], columns[replaced]] = graph.neighbor_ids[picks]
+
+    mutated = np.zeros(count, dtype=bool)
+    mutated[rows[replaced]] = True
+    remove_repeated_nodes(buffers, np.flatnonzero(mutated))
+    return mutated
+
+
+def remove_repeated_nodes(buffers, rows):
+    """Remove the repeated nodes of some rows of the trial buffer, keeping first occurrences like dict.fromkeys."""
+    if not len(rows):
+        return
+    paths, lengths = buffers.trial_paths[rows], buffers.trial_lengths[rows]
+    cell_rows, cell_columns = np.nonzero(buffers.trial_columns < lengths[:, None])
+    keys = cell_rows * buffers.num_nodes + paths[cell_rows, cell_columns]
+    # A stable sort keeps the occurrences of a node in column order, so all but the first are repeats
+    order = np.argsort(keys, kind='stable')
+    kept = np.ones(len(keys), dtype=bool)
+    kept[order[1:]] = keys[order[1:]] != keys[order[:-1]]
+    cell_rows, cell_columns = cell_rows[kept], cell_columns[kept]
+    buffers.trial_paths[rows[cell_rows], _ranks(cell_rows, len(rows))] = paths[cell_rows, cell_columns]
+    buffers.trial_lengths[rows] = np.bincount(cell_rows, minlength=len(rows))
+
+
+class ArrayGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Genetic algorithm on the compact engine whose population lives in PopulationBuffers.
+
+    The operators are those of `GeneticAlgorithm`, applied to a batch of trial children at a time by
+    `crossover_rows` and `mutate_rows`, which write straight into the trial buffer: parent pairs, crossover points,
+    mutations, duplicate removal, the edge check and the fitness are NumPy operations on whole batches. Only the
+    repair walks toward end_node are made per child, by `correct_path_to_end` on a list. The accepted children
+    fill the back buffer in trial order, like the sequential loop of `create_next_generation` fills a list.
+
+    Selection and the walks draw from the instance generator as usual, the batched operators from a NumPy
+    generator seeded from it, so a seed makes runs reproducible but they differ from `GeneticAlgorithm` runs.
+    Individuals are simple paths, as every operator keeps them; initial paths with a repeated node are rejected.
+    The `recombine` and `mutate` hooks are not used.
+    """
+
+    def __init__(self, graph, start_node, end_node, generations, population_size, **options):
+        """
+        :param graph: Graph data as returned by `load_graph_from_json`, or a prebuilt CompactGraph.
+        :param options: Keyword arguments of `GeneticAlgorithm`; the engine is always "compact" and the
+                        fitness always batched.
+        """
+        if options.get("engine", "compact") != "compact":
+            raise ValueError("ArrayGeneticAlgorithm only runs on the compact engine")
+        options.update(engine="compact", batch_fitness=True)
+        super().__init__(graph, start_node, end_node, generations, population_size, **options)
+        for path in self.initial_paths:
+            if len(set(path)) != len(path):
+                raise ValueError(f"Initial path {self.to_node_names(path)} is not a simple path")
+        self.buffers = None
+        self._operator_rng = None
+        self._acceptance = 1.0
+
+    def _start_run(self):
+        """Reset the per-run state, including the generator of the batched operators."""
+        super()._start_run()
+        self._operator_rng = None
+        self._acceptance = 1.0
+
+    def operator_rng(self):
+        """NumPy generator of the batched operators, seeded from the instance generator on first use in a run."""
+        if self._operator_rng is None:
+            self._operator_rng = np.random.default_rng(self.rng.getrandbits(64))
+        return self._operator_rng
+
+    def evaluate_population(self, population):
+        """Calculate the fitness of every individual of PopulationBuffers (or of a list of paths) as a list."""
+        if not isinstance(population, PopulationBuffers):
+            return super().evaluate_population(population)
+        with self.profiler.phase("fitness"):
+            return self.evaluate_packed(*population.pack())
+
+    def evolve(self, population, generations):
+        """Evolve a population (list of paths) in PopulationBuffers and return the last generation as a list."""
+        self.buffers = PopulationBuffers.from_paths(population, max(self.population_size, self.elitism),
+                                                    len(self.graph))
+        return super().evolve(self.buffers, generations).to_lists()
+
+    def create_next_generation(self, population, fitnesses):
+        """
+        Fill the back buffer of PopulationBuffers with the next generation and swap the buffers. Trial children
+        are made in batches sized after the share of children accepted so far.
+        """
+        profiler = self.profiler
+        with profiler.phase("selection"):
+            selected = np.asarray(self.select(range(len(population)), fitnesses))  # Row indices of the parents
+        rng = self.operator_rng()
+
+        size = 0
+        if self.elitism:
+            with profiler.phase("elitism"):
+                elite = self.elite_indices()
+                size = len(elite)
+                population.next_paths[:size] = population.paths[elite]
+                population.next_lengths[:size] = population.lengths[elite]
+
+        while size < self.population_size:
+            remaining = self.population_size - size
+            count = min(population.capacity, max(remaining, math.ceil(remaining / self._acceptance)))
+            with profiler.phase("crossover"):
+                # Two distinct parents per child, like sampling two of the selected individuals
+                first = rng.integers(0, len(selected), count)
+                second = (first + rng.integers(1, len(selected), count)) % len(selected)
+                crossover_rows(population, selected[first], selected[second], rng.random(count))
+                status = np.full(count, ACCEPTED, dtype=np.int8)
+                self.repair_trials(population, count, status, CROSSOVER_REPAIR_FAILED)
+            with profiler.phase("mutation"):
+                mutate_rows(population, count, self.graph, rng)
+                self.repair_trials(population, count, status, MUTATION_REPAIR_FAILED)
+                status[(status == ACCEPTED) & ~self.trials_valid(population, count)] = INVALID
+
+            accepted = np.flatnonzero(status == ACCEPTED)[:remaining]
+            # Trials after the last child needed are never counted, as if they had not been made
+            made = count if len(accepted) < remaining else int(accepted[-1]) + 1
+            self._acceptance = max(len(accepted) / made, 1 / population.capacity)
+            population.accept_trials(size, accepted)
+            size += len(accepted)
+
+            outcomes = np.bincount(status[:made], minlength=4)
+            profiler.count("children_accepted", int(outcomes[ACCEPTED]))
+            profiler.count("children_rejected", made - int(outcomes[ACCEPTED]))
+            profiler.count("crossover_repair_failures", int(outcomes[CROSSOVER_REPAIR_FAILED]))
+            profiler.count("mutation_repair_failures", int(outcomes[MUTATION_REPAIR_FAILED]))
+            profiler.count("invalid_mutations", int(outcomes[INVALID]))
+        population.swap(size)
+        return population
+
+    def repair_trials(self, buffers, count, status, failure):
+        """
+        Walk the trial children that do not end at end_node to it with `correct_path_to_end`.
+        :param status: Array of trial outcomes; failed repairs are marked with failure.
+        """
+        lengths = buffers.trial_lengths[:count]
+        ends = buffers.trial_paths[np.arange(count), lengths - 1]
+        for row in np.flatnonzero((ends != self.end_node) & (status == ACCEPTED)).tolist():
+            child = correct_path_to_end(buffers.trial_paths[row, :lengths[row]].tolist(), self.graph,
+                                        self.end_node, self.guide, self.rng)
+            if child is None:
+                status[row] = failure
+            else:
+                buffers.write_trial(row, child)
+
+    def trials_valid(self, buffers, count):
+        """Boolean array telling which of the first count trial children only use edges of the graph."""
+        paths = buffers.trial_paths[:count]
+        rows, columns = np.nonzero(buffers.trial_columns < (buffers.trial_lengths[:count] - 1)[:, None])
+        _, exists = self.batch_evaluator.lookup_edges(paths[rows, columns], paths[rows, columns + 1])
+        return np.bincount(rows[~exists], minlength=count) == 0
@@ -0,0 +1,157 @@
+import itertools
+
+import numpy as np
+
+from src.genetic_algorithm.objectives import DISTANCE_WEIGHT, END_BONUS, EXPLORATION_BONUS
+
+# Graphs up to this many nodes use a dense n x n weight matrix, larger ones a sorted sparse edge index
+DENSE_MAX_NODES = 2048
+
+
+def pack_population(population, node_index=None):
+    """
+    Pack a list of paths into a ragged (CSR-style) integer representation.
+    :param population: List of non-empty paths (lists of integer ids, or node names if node_index is given).
+    :param node_index: Optional mapping from node name to integer id.
+    :return: A tuple (nodes, offsets) where nodes is the flat concatenation of all paths and the nodes of
+             path i are nodes[offsets[i]:offsets[i + 1]].
+    """
+    lengths = np.fromiter((len(path) for path in population), dtype=np.int64, count=len(population))
+    offsets = np.zeros(len(population) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = itertools.chain.from_iterable(population)
+    if node_index is not None:
+        flat = map(node_index.__getitem__, flat)
+    nodes = np.fromiter(flat, dtype=np.int64, count=int(offsets[-1]))
+    return nodes, offsets
+
+
+class BatchFitnessEvaluator:
+    """
+    Population-level counterpart of `GeneticAlgorithm.fitness`.
+
+    All edges of all individuals are looked up in one vectorized pass, either in a dense weight matrix
+    (small graphs) or by binary search in the sorted CSR edge keys (large graphs). The exploration
+    bonus is computed against a boolean visited mask with the same first-come semantics as the
+    per-individual `visited_nodes` set, so the fitness values are identical to calling `fitness` on
+    each individual in order.
+    """
+
+    def __init__(self, graph, end_node, distance_weight=DISTANCE_WEIGHT, dense=None):
+        """
+        :param graph: CompactGraph the paths are evaluated against.
+        :param end_node: Integer id of the destination node.
+        :param distance_weight: Exponent applied to the inverse distance, as in `fitness`.
+        :param dense: Force (True) or disable (False) the dense weight matrix; by default it is used for
+                      graphs with at most DENSE_MAX_NODES nodes.
+        """
+        self.graph = graph
+        self.end_node = end_node
+        self.distance_weight = distance_weight
+        self.num_nodes = graph.number_of_nodes()
+        self.visited = np.zeros(self.num_nodes, dtype=bool)
+
+        rows = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(graph.offsets))
+        self.dense = self.num_nodes <= DENSE_MAX_NODES if dense is None else dense
+        if self.dense:
+            self.weight_matrix = np.zeros((self.num_nodes, self.num_nodes), dtype=np.float64)
+            self.adjacency_matrix = np.zeros((self.num_nodes, self.num_nodes), dtype=bool)
+            self.weight_matrix[rows, graph.neighbor_ids] = graph.weights
+            self.adjacency_matrix[rows, graph.neighbor_ids] = True
+        else:
+            keys = rows * self.num_nodes + graph.neighbor_ids
+            order = np.argsort(keys, kind='stable')
+            self.edge_keys = keys[order]
+            self.edge_weights = graph.weights[order].astype(np.float64)
+
+    def reset(self):
+        """Forget the nodes visited so far, restarting the exploration bonus."""
+        self.visited[:] = False
+
+    def lookup_edges(self, u, v):
+        """
+        Look up a batch of edges.
+        :param u: Array of source ids.
+        :param v: Array of target ids.
+        :return: A tuple (weights, exists) of arrays aligned with u and v.
+        """
+        u, v = np.asarray(u, dtype=np.int64), np.asarray(v, dtype=np.int64)  # Edge keys overflow int32
+        if self.dense:
+            return self.weight_matrix[u, v], self.adjacency_matrix[u, v]
+
+        queries = u * self.num_nodes + v
+        if len(self.edge_keys) == 0:
+            return np.zeros(len(queries)), np.zeros(len(queries), dtype=bool)
+        positions = np.minimum(np.searchsorted(self.edge_keys, queries), len(self.edge_keys) - 1)
+        exists = self.edge_keys[positions] == queries
+        return np.where(exists, self.edge_weights[positions], 0.0), exists
+
+    def path_distances(self, nodes, offsets):
+        """
+        Total distance of every path, ``inf`` for paths using a missing edge.
+        :return: A tuple (distances, valid) of arrays with one entry per path.
+        """
+        count = len(offsets) - 1
+        lengths = np.diff(offsets)
+        if len(nodes) < 2:
+            return np.zeros(count), np.ones(count, dtype=bool)
+
+        # Consecutive pairs in the flat array are edges, except across the boundary between two paths
+        edge_mask = np.ones(len(nodes) - 1, dtype=bool)
+        edge_mask[offsets[1:-1] - 1] = False
+        row_ids = np.repeat(np.arange(count), lengths - 1)
+        weights, exists = self.lookup_edges(nodes[:-1][edge_mask], nodes[1:][edge_mask])
+
+        distances = np.bincount(row_ids, weights=weights, minlength=count)
+        missing = np.bincount(row_ids, weights=~exists, minlength=count)
+        valid = missing == 0
+        distances[~valid] = np.inf
+        return distances, valid
+
+    def exploration_counts(self, nodes, offsets, valid):
+        """
+        Count, for each valid path, the nodes that no earlier path (in this or previous batches) visited,
+        and mark them as visited.
+        """
+        count = len(offsets) - 1
+        row_ids = np.repeat(np.arange(count), np.diff(offsets))
+        new = valid[row_ids] & ~self.visited[nodes]
+        row_ids, new_nodes = row_ids[new], nodes[new]
+        # Paths are stored in order, so the first occurrence of a node belongs to the earliest path visiting it
+        first_nodes, first_positions = np.unique(new_nodes, return_index=True)
+        self.visited[first_nodes] = True
+        return np.bincount(row_ids[first_positions], minlength=count)
+
+    def evaluate(self, nodes, offsets):
+        """
+        Compute the fitness of every path in a packed population.
+        :param nodes: Flat node array as returned by `pack_population`.
+        :param offsets: Path offsets into nodes as returned by `pack_population`.
+        :return: A tuple (fitnesses, distances, valid) of arrays with one entry per path.
+        """
+        base_fitnesses, distances, valid = self.evaluate_base(nodes, offsets)
+        return self.add_exploration_bonus(base_fitnesses, nodes, offsets, valid), distances, valid
+
+    def evaluate_base(self, nodes, offsets):
+        """
+        Compute the pure part of the fitness of every path in a packed population, without the exploration bonus
+        (see `GeneticAlgorithm.base_fitness`). It leaves the visited nodes alone.
+        :return: A tuple (base fitnesses, distances, valid) of arrays with one entry per path.
+        """
+        count = len(offsets) - 1
+        if count == 0:
+            return np.zeros(0), np.zeros(0), np.zeros(0, dtype=bool)
+
+        distances, valid = self.path_distances(nodes, offsets)
+        path_fitness = (1 / (1 + distances)) ** self.distance_weight
+        reached_end = nodes[offsets[1:] - 1] == self.end_node
+
+        base_fitnesses = np.where(reached_end, path_fitness + END_BONUS, path_fitness - distances)
+        base_fitnesses[~valid] = -np.inf
+        return base_fitnesses, distances, valid
+
+    def add_exploration_bonus(self, base_fitnesses, nodes, offsets, valid):
+        """Fitnesses: the base fitnesses plus the bonus of the nodes no earlier path visited, marked as visited."""
+        if len(base_fitnesses) == 0:
+            return base_fitnesses
+        return base_fitnesses + self.exploration_counts(nodes, offsets, valid) * EXPLORATION_BONUS
@@ -0,0 +1,81 @@
+class BoundedCache:
+    """
+    Base of the bounded memo tables: a dictionary of entries with hit, miss and eviction counters. Subclasses
+    decide the eviction order in `get` and `put`.
+    """
+
+    def __init__(self, max_size):
+        """
+        :param max_size: Maximum number of entries kept.
+        """
+        self.max_size = max_size
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def discard_where(self, predicate):
+        """
+        Drop the entries whose key matches a predicate.
+        :return: Number of entries dropped.
+        """
+        stale = [key for key in self.entries if predicate(key)]
+        for key in stale:
+            del self.entries[key]
+        return len(stale)
+
+    def stats(self):
+        """Counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class FitnessCache(BoundedCache):
+    """
+    Bounded memo table for the pure (stateless) part of the fitness, keyed on path tuples.
+
+    When the table is full the oldest entry is dropped (insertion order), which keeps both lookups and
+    evictions O(1). Hit and miss counters are kept for monitoring.
+    """
+
+    def __init__(self, max_size=65536):
+        """
+        :param max_size: Maximum number of paths kept.
+        """
+        super().__init__(max_size)
+
+    def get(self, key):
+        """Return the cached value for key, or None, updating the counters."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store a value, dropping the oldest entry when the table is full."""
+        if len(self.entries) >= self.max_size and key not in self.entries:
+            del self.entries[next(iter(self.entries))]
+            self.evictions += 1
+        self.entries[key] = value
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,195 @@
+import multiprocessing
+import os
+import random
+import traceback
+
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm, calculate_path_distance
+from src.genetic_algorithm.random_streams import make_rng, spawn_seeds
+from src.graph.compact_graph import CompactGraph
+from src.graph.shared_graph import attach_compact_graph, release_shared_blocks, share_compact_graph
+
+TOPOLOGIES = ("ring", "complete", "random")
+
+
+def migration_targets(topology, num_islands, rng=random):
+    """
+    Decide which islands receive the migrants of each island.
+    :param topology: "ring" (each island sends to the next one), "complete" (to every other island) or
+                     "random" (to one other island picked at random every migration).
+    :param num_islands: Number of islands.
+    :param rng: Random generator used by the "random" topology.
+    :return: List where item i is the list of islands receiving migrants from island i.
+    """
+    if num_islands < 2:
+        return [[] for _ in range(num_islands)]
+    if topology == "ring":
+        return [[(island + 1) % num_islands] for island in range(num_islands)]
+    if topology == "complete":
+        return [[other for other in range(num_islands) if other != island] for island in range(num_islands)]
+    if topology == "random":
+        return [[rng.choice([other for other in range(num_islands) if other != island])]
+                for island in range(num_islands)]
+    raise ValueError(f"Unknown topology {topology!r}, expected one of {TOPOLOGIES}")
+
+
+def rank_population(population, graph, end_node):
+    """Sort paths so those reaching end_node come first, shortest distance first."""
+    return sorted(population, key=lambda path: (path[-1] != end_node, calculate_path_distance(graph, path)))
+
+
+def _evolve_island(connection, graph, start_node, end_node, population_size, migration_size, seed=None):
+    """
+    Serve the commands of the main process for one island.
+
+    The island waits for ("evolve", (generations, migrants)) commands: migrants replace the worst
+    individuals, the island evolves for the given number of generations and its best individuals are
+    sent back with ("report", stats). A ("stop", None) command ends the loop.
+    """
+    ga = GeneticAlgorithm(graph, start_node, end_node, generations=0, population_size=population_size,
+                          rng=make_rng(seed))
+    population = ga.create_initial_population()
+    while True:
+        command, payload = connection.recv()
+        if command == "stop":
+            return
+        generations, migrants = payload
+        if migrants:
+            population = rank_population(population, graph, ga.end_node)
+            population = population[:max(len(population) - len(migrants), 0)] + migrants
+        population = ga.evolve(population, generations)
+
+        ranked = rank_population(population, graph, ga.end_node)
+        connection.send(("report", {
+            "best_paths": ranked[:max(migration_size, 1)],
+            "best_distance": calculate_path_distance(graph, ranked[0]),
+            "population_size": len(population),
+        }))
+
+
+def _island_worker(connection, spec, start_node, end_node, population_size, migration_size, seed):
+    """Worker process entry point: attach the shared graph and evolve one island."""
+    graph, blocks = attach_compact_graph(spec)
+    try:
+        _evolve_island(connection, graph, start_node, end_node, population_size, migration_size, seed)
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+    finally:
+        connection.close()
+        del graph
+        release_shared_blocks(blocks)
+
+
+class IslandModel:
+    """
+    Island-model parallel genetic algorithm.
+
+    Each island is a GeneticAlgorithm with its own population running in a separate worker process.
+    The graph is shared read-only through shared memory instead of being pickled into every worker.
+    Every `migration_interval` generations the best `migration_size` paths of each island replace the
+    worst paths of the islands it is connected to in the migration topology.
+    """
+
+    def __init__(self, graph, start_node, end_node, generations, population_size, num_islands=None,
+                 migration_interval=10, migration_size=2, topology="ring", seed=None):
+        """
+        :param graph: Graph data as returned by `load_graph_from_json`, or a prebuilt CompactGraph.
+        :param population_size: Size of the population of each island.
+        :param num_islands: Number of islands (worker processes), by default the number of CPUs.
+        :param migration_interval: Number of generations between migrations.
+        :param migration_size: Number of paths each island sends on every migration.
+        :param topology: Migration topology, one of TOPOLOGIES.
+        :param seed: Optional seed; every island gets an independent stream spawned from it (see
+                     `spawn_seeds`) and the migration topology draws from its own generator.
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology {topology!r}, expected one of {TOPOLOGIES}")
+        self.graph = graph if isinstance(graph, CompactGraph) else CompactGraph.from_data(graph)
+        self.start_node = start_node
+        self.end_node = end_node
+        self.generations = generations
+        self.population_size = population_size
+        self.num_islands = num_islands or os.cpu_count() or 1
+        self.migration_interval = max(1, migration_interval)
+        self.migration_size = migration_size
+        self.topology = topology
+        self.seed = seed
+        self.island_stats = []
+
+    def run(self):
+        """
+        Evolve all islands and return the best path found on any of them.
+        Per-island results are available afterwards in `island_stats`.
+        :return: A tuple (best_path, best_distance) like `GeneticAlgorithm.run`.
+        """
+        # Fail early on unknown nodes instead of inside the workers
+        self.graph.index(self.start_node), self.graph.index(self.end_node)
+        rng = make_rng(self.seed)
+        spec, blocks = share_compact_graph(self.graph)
+        connections, processes = [], []
+        self.island_stats = [{"island": island, "generations": 0, "migrants_sent": 0, "migrants_received": 0,
+                              "best_path": None, "best_distance": float('inf'), "population_size": 0}
+                             for island in range(self.num_islands)]
+        try:
+            island_seeds = spawn_seeds(self.seed, self.num_islands)
+            for island, island_seed in enumerate(island_seeds):
+                parent_connection, child_connection = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_island_worker, daemon=True,
+                    args=(child_connection, spec, self.start_node, self.end_node, self.population_size,
+                          self.migration_size, island_seed))
+                process.start()
+                child_connection.close()
+                connections.append(parent_connection)
+                processes.append(process)
+
+            migrants = [[] for _ in range(self.num_islands)]
+            remaining = self.generations
+            while remaining > 0:
+                step = min(self.migration_interval, remaining)
+                for connection, island_migrants in zip(connections, migrants):
+                    connection.send(("evolve", (step, island_migrants)))
+                reports = [self._receive(connection) for connection in connections]
+                remaining -= step
+
+                for stats, island_migrants, report in zip(self.island_stats, migrants, reports):
+                    stats["generations"] += step
+                    stats["migrants_received"] += len(island_migrants)
+                    stats["best_path"] = self.graph.to_names(report["best_paths"][0])
+                    stats["best_distance"] = report["best_distance"]
+                    stats["population_size"] = report["population_size"]
+
+                migrants = [[] for _ in range(self.num_islands)]
+                if remaining > 0 and self.migration_size > 0:
+                    targets = migration_targets(self.topology, self.num_islands, rng)
+                    for source, report in enumerate(reports):
+                        outgoing = report["best_paths"][:self.migration_size]
+                        for target in targets[source]:
+                            migrants[target].extend(list(path) for path in outgoing)
+                            self.island_stats[source]["migrants_sent"] += len(outgoing)
+
+            for connection in connections:
+                connection.send(("stop", None))
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            for connection in connections:
+                connection.close()
+            release_shared_blocks(blocks, unlink=True)
+
+        if not self.generations:
+            return None, float('inf')
+        best = min(self.island_stats, key=lambda stats: (stats["best_path"][-1] != self.end_node,
+                                                         stats["best_distance"]))
+        return best["best_path"], best["best_distance"]
+
+    @staticmethod
+    def _receive(connection):
+        """Receive a report from an island, re-raising errors that happened in the worker."""
+        kind, payload = connection.recv()
+        if kind == "error":
+            raise RuntimeError(f"Island worker failed:\n{payload}")
+        return payload
@@ -0,0 +1,211 @@
+import numpy as np
+
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.objectives import (EXPLORATION_BONUS, FITNESS_SCHEMES, crowding_distances,
+                                              objective_fitness, pareto_ranks)
+
+
+class MultiObjectiveGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Genetic algorithm minimizing several additive edge attributes of a route at once, e.g. distance ("weight"),
+    travel time and tolls.
+
+    The totals of all objectives of a path come from one pass over its edges. On a CompactGraph the positions
+    of the edges are looked up once per path, and the objective arrays, stacked into one contiguous
+    ``(entries, objectives)`` table, are gathered and summed for the whole population with NumPy. Totals are
+    memoized per path like the distance of the single-objective search.
+
+    A fitness scheme turns the objective vectors of a population into fitness values, so selection, elitism and
+    the operators work unchanged: "weighted_sum" scalarizes them with the formula of the single-objective
+    search, "pareto" ranks them by non-dominated sorting and crowding distance (NSGA-II). Every generation the
+    non-dominated routes found so far are merged into the front, which `run` and `resume` return. The stop
+    criteria (stall_generations, target_distance) follow the weight of the fittest route.
+    """
+
+    def __init__(self, graph, start_node, end_node, generations, population_size, objectives=("weight",),
+                 fitness_scheme="weighted_sum", objective_weights=None, fitness_params=None,
+                 exploration_bonus=None, front_size=50, **options):
+        """
+        :param graph: Graph data as returned by `load_graph_from_json`, or a prebuilt CompactGraph holding the
+                      objective attributes in ``edge_attributes``.
+        :param objectives: Names of the edge attributes to minimize; "weight" is the edge weight. An edge
+                           without a value for an attribute counts 0 for it.
+        :param fitness_scheme: One of FITNESS_SCHEMES ("weighted_sum", "pareto"), or a callable taking the same
+                               arguments as `objectives.weighted_sum_fitness`.
+        :param objective_weights: Optional {objective: weight} of the weighted sum; unlisted objectives weigh 1.
+        :param fitness_params: Optional further parameters of the scheme (distance_weight, end_bonus).
+        :param exploration_bonus: Fitness reward per new node, as in `GeneticAlgorithm.fitness`. By default
+                                  EXPLORATION_BONUS for "weighted_sum" and 0 otherwise, since the crowding
+                                  distance already keeps a Pareto search diverse.
+        :param front_size: Maximum number of routes of the front; the most crowded ones are dropped.
+        :param options: Keyword arguments of `GeneticAlgorithm`, except batch_fitness.
+        """
+        if options.get("batch_fitness"):
+            raise ValueError("batch_fitness only evaluates the weight, not several objectives")
+        if not callable(fitness_scheme) and fitness_scheme not in FITNESS_SCHEMES:
+            raise ValueError(f"Unknown fitness scheme {fitness_scheme!r}, expected one of {FITNESS_SCHEMES}")
+        self.objectives = tuple(objectives)
+        if not self.objectives or len(set(self.objectives)) != len(self.objectives):
+            raise ValueError("Objectives must be distinct attribute names")
+        unknown = set(objective_weights or ()) - set(self.objectives)
+        if unknown:
+            raise ValueError(f"Weights given for unknown objectives {sorted(unknown)}")
+        self.graph_attributes = tuple(name for name in self.objectives if name != "weight")
+        super().__init__(graph, start_node, end_node, generations, population_size, **options)
+        if self.engine == "compact":
+            for name in self.graph_attributes:
+                if name not in self.graph.edge_attributes:
+                    raise ValueError(f"The graph has no edge attribute {name!r}")
+
+        self.fitness_scheme = fitness_scheme
+        self.fitness_params = dict(fitness_params or {})
+        if objective_weights is not None:
+            self.fitness_params["weights"] = [objective_weights.get(name, 1) for name in self.objectives]
+        if exploration_bonus is None:
+            exploration_bonus = EXPLORATION_BONUS if fitness_scheme == "weighted_sum" else 0
+        self.exploration_bonus = exploration_bonus
+        self.front_size = front_size
+        self.front = {}  # {path: objective totals} of the non-dominated routes found so far
+        self.build_objective_table()
+
+    def build_objective_table(self):
+        """Stack the objective arrays of a CompactGraph into one ``(entries, objectives)`` table."""
+        self.objective_table = None
+        if self.engine == "compact":
+            self.objective_table = np.column_stack([self.graph.edge_attribute(name).astype(np.float64)
+                                                    for name in self.objectives])
+
+    def path_objectives(self, path):
+        """
+        Totals of every objective along a path, in one pass over its edges.
+        :return: Tuple of floats, all ``inf`` if the path uses a missing edge.
+        """
+        if self.engine == "compact":
+            positions = self.graph.edge_positions(path)
+            if positions is None:
+                return (float('inf'),) * len(self.objectives)
+            return tuple(self.objective_table[positions].sum(axis=0).tolist())
+        totals = [0.0] * len(self.objectives)
+        for u, v in zip(path, path[1:]):
+            data = self.graph[u].get(v)
+            if data is None:
+                return (float('inf'),) * len(self.objectives)
+            for j, name in enumerate(self.objectives):
+                totals[j] += data.get(name, 0)
+        return tuple(totals)
+
+    def objective_vectors(self, population):
+        """
+        Objective totals of every path of a population. On a CompactGraph the paths missing from the memo table
+        are summed together: one gather of the objective table and one weighted bincount per objective.
+        :return: A tuple (objectives, valid): an ``(N, objectives)`` float array and a boolean array, False
+                 for the paths using a missing edge (whose totals are ``inf``).
+        """
+        objectives = np.empty((len(population), len(self.objectives)))
+        pending, lengths, positions = [], [], []
+        for i, path in enumerate(population):
+            cached = None if self.fitness_cache is None else self.fitness_cache.get(tuple(path))
+            if cached is not None:
+                objectives[i] = cached
+            elif self.engine != "compact":
+                objectives[i] = self.path_objectives(path)
+                if self.fitness_cache is not None:
+                    self.fitness_cache.put(tuple(path), tuple(objectives[i].tolist()))
+            else:
+                edge_positions = self.graph.edge_positions(path)
+                if edge_positions is None:
+                    objectives[i] = np.inf
+                else:
+                    pending.append(i)
+                    lengths.append(len(edge_positions))
+                    positions.extend(edge_positions)
+
+        if pending:
+            rows = np.repeat(np.arange(len(pending)), lengths)
+            costs = self.objective_table[np.asarray(positions, dtype=np.int64)]
+            for j in range(len(self.objectives)):
+                objectives[pending, j] = np.bincount(rows, weights=costs[:, j], minlength=len(pending))
+            if self.fitness_cache is not None:
+                for i in pending:
+                    self.fitness_cache.put(tuple(population[i]), tuple(objectives[i].tolist()))
+        return objectives, np.isfinite(objectives).all(axis=1)
+
+    def evaluate_population(self, population):
+        """
+        Calculate the fitness of every individual, in order, as a list: the fitness scheme applied to the
+        objective vectors of the population (kept in `base_fitnesses`), plus the exploration bonus. The complete
+        routes join the front.
+        """
+        with self.profiler.phase("fitness"):
+            objectives, valid = self.objective_vectors(population)
+            reached_end = np.fromiter((path[-1] == self.end_node for path in population), dtype=bool,
+                                      count=len(population))
+            fitnesses = objective_fitness(self.fitness_scheme, objectives, valid, reached_end, **self.fitness_params)
+            self.base_fitnesses = fitnesses.tolist()
+            if self.exploration_bonus:
+                for i in np.flatnonzero(valid):
+                    unexplored_nodes = set(population[i]) - self.visited_nodes
+                    fitnesses[i] += len(unexplored_nodes) * self.exploration_bonus
+                    self.visited_nodes.update(unexplored_nodes)
+            self.update_front(population, objectives, valid & reached_end)
+            return fitnesses.tolist()
+
+    def update_front(self, population, objectives, complete):
+        """
+        Merge the complete routes of a population into the front, which keeps the non-dominated routes found so
+        far: one route per objective vector and at most front_size of them, dropping the most crowded ones.
+        """
+        candidates = dict(self.front)
+        vectors = set(candidates.values())
+        for i in np.flatnonzero(complete):
+            vector = tuple(objectives[i].tolist())
+            if vector not in vectors:
+                vectors.add(vector)
+                candidates[tuple(population[i])] = vector
+        if len(candidates) == len(self.front):
+            return
+        paths = list(candidates)
+        rows = np.array([candidates[path] for path in paths])
+        members = np.flatnonzero(pareto_ranks(rows) == 0)
+        if len(members) > self.front_size:
+            crowding = crowding_distances(rows[members])
+            members = np.sort(members[np.argsort(-crowding, kind='stable')[:self.front_size]])
+        self.front = {paths[i]: candidates[paths[i]] for i in members}
+
+    def pareto_front(self):
+        """
+        The front of the routes found so far.
+        :return: List of (path of node names, {objective: total}) tuples, sorted by their objective totals.
+        """
+        return [(self.to_node_names(list(path)), dict(zip(self.objectives, vector)))
+                for path, vector in sorted(self.front.items(), key=lambda item: item[1])]
+
+    def update_graph(self, changes):
+        """
+        Apply edge changes like `GeneticAlgorithm.update_graph`, stack the objective table again and keep the
+        routes of the front that are still valid, with their new totals.
+        """
+        dropped = super().update_graph(changes)
+        self.build_objective_table()
+        paths = list(self.front)
+        self.front = {}
+        if paths:
+            objectives, valid = self.objective_vectors(paths)
+            self.update_front(paths, objectives, valid)
+        return dropped
+
+    def _finish_run(self, population):
+        """Keep the last population for `resume`, merge it into the front and return the front."""
+        if self.stop_reason is None:
+            self.stop_reason = "generations"
+        self.population = population
+        self.evaluate_population(population)
+        return self.pareto_front()
+
+    def run(self):
+        """
+        Run the genetic algorithm from a new front.
+        :return: The Pareto front, see `pareto_front`.
+        """
+        self.front = {}
+        return super().run()
@@ -0,0 +1,130 @@
+import numpy as np
+
+# Fitness of a route from its cost, see `GeneticAlgorithm.distance_fitness`
+DISTANCE_WEIGHT = 0.85  # Exponent of the inverse cost, emphasis on short routes
+END_BONUS = 3.0  # Reward for reaching end_node
+EXPLORATION_BONUS = 0.1  # Reward per node no individual has visited before
+
+FITNESS_SCHEMES = ("weighted_sum", "pareto")
+
+
+def pareto_ranks(objectives):
+    """
+    Non-dominated sorting (NSGA-II) of objective vectors to minimize, O(N^2 k) with NumPy: rank 0 is the Pareto
+    front, rank 1 the front of the rest, and so on.
+    :param objectives: ``(N, k)`` array, one row of objective values per individual.
+    :return: Integer array of ranks.
+    """
+    objectives = np.asarray(objectives, dtype=np.float64)
+    count = len(objectives)
+    ranks = np.zeros(count, dtype=np.int64)
+    if count == 0:
+        return ranks
+    # dominates[i, j]: i is nowhere worse than j and better in at least one objective
+    no_worse = np.all(objectives[:, None, :] <= objectives[None, :, :], axis=2)
+    better = np.any(objectives[:, None, :] < objectives[None, :, :], axis=2)
+    dominates = no_worse & better
+    dominated_by = dominates.sum(axis=0)
+    current = np.flatnonzero(dominated_by == 0)
+    rank = 0
+    while current.size:
+        ranks[current] = rank
+        dominated_by[current] = -1
+        dominated_by -= dominates[current].sum(axis=0)
+        current = np.flatnonzero(dominated_by == 0)
+        rank += 1
+    return ranks
+
+
+def crowding_distances(objectives):
+    """
+    Crowding distance of every member of one front (NSGA-II): the sum over the objectives of the gap between its
+    two neighbors, relative to the range of the objective. The extremes of every objective get ``inf``.
+    :param objectives: ``(N, k)`` array of the objective values of the front.
+    :return: Float array of distances.
+    """
+    objectives = np.asarray(objectives, dtype=np.float64)
+    count, k = objectives.shape
+    distances = np.zeros(count)
+    if count <= 2:
+        distances[:] = np.inf
+        return distances
+    for j in range(k):
+        order = np.argsort(objectives[:, j], kind='stable')
+        values = objectives[order, j]
+        distances[order[[0, -1]]] = np.inf
+        spread = values[-1] - values[0]
+        if spread > 0:
+            distances[order[1:-1]] += (values[2:] - values[:-2]) / spread
+    return distances
+
+
+def weighted_sum_fitness(objectives, valid, reached_end, weights=None, distance_weight=DISTANCE_WEIGHT,
+                         end_bonus=END_BONUS):
+    """
+    Scalar fitness of the weighted sum of the objectives, with the formula of `GeneticAlgorithm.distance_fitness`
+    applied to that cost, so a single "weight" objective gives the fitness of the single-objective search.
+    :param objectives: ``(N, k)`` array of objective totals per path.
+    :param valid: Boolean array, False for paths using a missing edge (-inf fitness).
+    :param reached_end: Boolean array, True for paths ending at end_node.
+    :param weights: Weight of every objective, all 1 by default.
+    :param distance_weight: Exponent applied to the inverse cost.
+    :param end_bonus: Reward for reaching end_node; other paths are penalized by their cost.
+    :return: Float array of fitness values.
+    """
+    objectives = np.asarray(objectives, dtype=np.float64)
+    costs = objectives.sum(axis=1) if weights is None else objectives @ np.asarray(weights, dtype=np.float64)
+    with np.errstate(invalid='ignore', over='ignore'):
+        path_fitness = (1 / (1 + costs)) ** distance_weight
+        fitnesses = np.where(reached_end, path_fitness + end_bonus, path_fitness - costs)
+    fitnesses[~np.asarray(valid, dtype=bool)] = -np.inf
+    return fitnesses
+
+
+def pareto_fitness(objectives, valid, reached_end):
+    """
+    Scalar fitness from NSGA-II ranking, so that the selection schemes and elitism work unchanged: the paths
+    reaching end_node get minus their Pareto rank plus up to 0.5 for their crowding distance in their front
+    (better fronts always win and, within a front, isolated routes win, like the crowded comparison operator).
+    Valid paths not reaching end_node come after every front and invalid paths get -inf.
+    :param objectives: ``(N, k)`` array of objective totals per path.
+    :param valid: Boolean array, False for paths using a missing edge.
+    :param reached_end: Boolean array, True for paths ending at end_node.
+    :return: Float array of fitness values.
+    """
+    objectives = np.asarray(objectives, dtype=np.float64)
+    valid = np.asarray(valid, dtype=bool)
+    complete = valid & np.asarray(reached_end, dtype=bool)
+    fitnesses = np.full(len(objectives), -np.inf)
+    fronts = 0
+    if complete.any():
+        rows = objectives[complete]
+        ranks = pareto_ranks(rows)
+        fronts = int(ranks.max()) + 1
+        crowding = np.empty(len(rows))
+        for rank in range(fronts):
+            members = np.flatnonzero(ranks == rank)
+            crowding[members] = crowding_distances(rows[members])
+        fitnesses[complete] = -ranks + 0.5 * (1 - 1 / (1 + crowding))
+    fitnesses[valid & ~complete] = -(fronts + 1)
+    return fitnesses
+
+
+_SCHEMES = {
+    "weighted_sum": weighted_sum_fitness,
+    "pareto": pareto_fitness,
+}
+
+
+def objective_fitness(scheme, objectives, valid, reached_end, **params):
+    """
+    Fitness of a whole population from its objective vectors with one of FITNESS_SCHEMES, or with a callable
+    taking the same arguments.
+    :param params: Scheme parameters (weights, distance_weight or end_bonus for "weighted_sum").
+    :return: Float array of fitness values.
+    """
+    if callable(scheme):
+        return scheme(objectives, valid, reached_end, **params)
+    if scheme not in _SCHEMES:
+        raise ValueError(f"Unknown fitness scheme {scheme!r}, expected one of {FITNESS_SCHEMES}")
+    return _SCHEMES[scheme](objectives, valid, reached_end, **params)
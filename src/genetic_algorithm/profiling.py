@@ -0,0 +1,127 @@
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Phases timed by GeneticAlgorithm; "crossover" and "mutation" include the repair of the child
+PHASES = ("initialization", "fitness", "selection", "elitism", "crossover", "mutation", "progress")
+# Event counters kept by GeneticAlgorithm
+COUNTERS = ("children_accepted", "children_rejected", "crossover_repair_failures", "mutation_repair_failures",
+            "invalid_mutations", "initial_paths_rejected")
+
+
+class PhaseProfiler:
+    """
+    Accumulates wall time and call counts per phase of a genetic algorithm run, plus event counters.
+
+    Pass an instance as ``GeneticAlgorithm(profiler=...)``. Optionally every phase call is also kept as
+    a Chrome trace event (open the file written by `write_chrome_trace` in chrome://tracing or
+    Perfetto), and the run is profiled function by function with cProfile.
+    """
+
+    def __init__(self, trace=False, cprofile=False):
+        """
+        :param trace: Record one trace event per phase call (memory grows with the number of calls).
+        :param cprofile: Profile `GeneticAlgorithm.run` with cProfile, see `print_stats` and `write_pstats`.
+        """
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.run_seconds = 0.0
+        self.trace_events = [] if trace else None
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        """Context manager timing one call of a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if self.trace_events is not None:
+                self.trace_events.append({"name": name, "ph": "X", "ts": (start - self._origin) * 1e6,
+                                          "dur": elapsed * 1e6, "pid": os.getpid(), "tid": threading.get_ident()})
+
+    def count(self, counter, amount=1):
+        """Increment an event counter."""
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    @contextmanager
+    def run(self):
+        """Context manager around a whole run: total time and, if enabled, cProfile."""
+        start = time.perf_counter()
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        try:
+            with self.phase("run"):
+                yield
+        finally:
+            if self.cprofile is not None:
+                self.cprofile.disable()
+            self.run_seconds += time.perf_counter() - start
+
+    def summary(self):
+        """
+        Totals per phase and counters.
+        :return: Dictionary with "run_seconds", "phases" ({phase: {"calls", "seconds", "share"}}, where
+                 share is the fraction of the run time) and "counters".
+        """
+        phases = {name: {"calls": self.calls[name], "seconds": seconds,
+                         "share": seconds / self.run_seconds if self.run_seconds else 0.0}
+                  for name, seconds in self.seconds.items() if name != "run"}
+        return {"run_seconds": self.run_seconds, "phases": phases, "counters": dict(self.counters)}
+
+    def report(self):
+        """Human-readable table of the summary."""
+        summary = self.summary()
+        lines = [f"{'phase':<16} {'calls':>10} {'seconds':>10} {'share':>7}"]
+        for name, phase in summary["phases"].items():
+            lines.append(f"{name:<16} {phase['calls']:>10} {phase['seconds']:>10.4f} {phase['share']:>7.1%}")
+        lines.append(f"{'run':<16} {self.calls.get('run', 0):>10} {summary['run_seconds']:>10.4f}")
+        lines.extend(f"{name}: {value}" for name, value in summary["counters"].items())
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, file_path):
+        """Write the recorded phase calls in the Chrome trace event JSON format."""
+        if self.trace_events is None:
+            raise ValueError("Tracing is disabled, create the profiler with trace=True")
+        with open(file_path, 'w') as f:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, f)
+
+    def print_stats(self, limit=25, sort="cumulative"):
+        """Print the cProfile statistics of the profiled runs."""
+        self._stats().sort_stats(sort).print_stats(limit)
+
+    def write_pstats(self, file_path):
+        """Write the cProfile statistics, for `pstats` or snakeviz."""
+        self._stats().dump_stats(file_path)
+
+    def _stats(self):
+        if self.cprofile is None:
+            raise ValueError("cProfile is disabled, create the profiler with cprofile=True")
+        return pstats.Stats(self.cprofile)
+
+
+class NullProfiler:
+    """Profiler doing nothing, used when profiling is disabled so the hooks cost next to nothing."""
+
+    _context = nullcontext()
+
+    def phase(self, name):
+        return self._context
+
+    def run(self):
+        return self._context
+
+    def count(self, counter, amount=1):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,64 @@
+import json
+import math
+
+# Keys of the progress events passed to `GeneticAlgorithm(progress=...)` listeners
+PROGRESS_FIELDS = ("generation", "best_fitness", "mean_fitness", "best_distance", "elapsed",
+                   "evaluations_per_second")
+
+
+def progress_event(generation, fitnesses, best_distance, elapsed, evaluations):
+    """
+    Build the progress event of one generation.
+    :param generation: Generation number, starting at 1.
+    :param fitnesses: Fitness of every individual of the generation.
+    :param best_distance: Distance of the fittest individual.
+    :param elapsed: Seconds since the evolution started.
+    :param evaluations: Total fitness evaluations since the evolution started.
+    :return: Dictionary with the PROGRESS_FIELDS keys.
+    """
+    finite = [fitness for fitness in fitnesses if math.isfinite(fitness)]
+    return {
+        "generation": generation,
+        "best_fitness": max(fitnesses) if fitnesses else -float('inf'),
+        "mean_fitness": sum(finite) / len(finite) if finite else -float('inf'),
+        "best_distance": best_distance,
+        "elapsed": elapsed,
+        "evaluations_per_second": evaluations / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+class JsonLinesProgressWriter:
+    """Progress listener that writes every event as one JSON line to a text stream."""
+
+    def __init__(self, stream, flush=False):
+        """
+        :param stream: Writable text stream, e.g. an open file or sys.stderr.
+        :param flush: Flush the stream after every event, for live tailing.
+        """
+        self.stream = stream
+        self.flush = flush
+
+    def __call__(self, event):
+        # Infinite values are not valid JSON numbers, write them as null
+        self.stream.write(json.dumps({key: value if not isinstance(value, float) or math.isfinite(value) else None
+                                      for key, value in event.items()}) + "\n")
+        if self.flush:
+            self.stream.flush()
+
+
+class ProgressRecorder:
+    """Progress listener that keeps every event in memory, in the `events` list."""
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+
+def print_progress(event):
+    """Progress listener printing a one-line summary per generation."""
+    print(f"Generation {event['generation']}: best distance {event['best_distance']} | "
+          f"best fitness {event['best_fitness']:.4f} | mean fitness {event['mean_fitness']:.4f} | "
+          f"{event['evaluations_per_second']:.0f} evaluations/s")
+
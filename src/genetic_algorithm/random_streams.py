@@ -0,0 +1,46 @@
+import hashlib
+import random
+
+import numpy as np
+
+
+def seed_to_int(seed):
+    """
+    Convert a seed (a non-negative int, or a str/bytes such as a query seed) to a non-negative int.
+    Strings are hashed, so equal strings always give the same int regardless of PYTHONHASHSEED.
+    """
+    if isinstance(seed, str):
+        seed = seed.encode("utf-8")
+    if isinstance(seed, (bytes, bytearray)):
+        return int.from_bytes(hashlib.sha256(seed).digest()[:16], "little")
+    if seed < 0:
+        raise ValueError(f"Seeds must be non-negative, got {seed}")
+    return int(seed)
+
+
+def make_rng(seed=None):
+    """
+    Create an independent random generator with the interface of the `random` module.
+    :param seed: Any seed accepted by `random.Random` (int, str, bytes), or None for OS entropy.
+                 ``make_rng(seed)`` draws the same numbers as the `random` module after ``random.seed(seed)``.
+    :return: random.Random instance.
+    """
+    return random.Random(seed)
+
+
+def spawn_seeds(seed, count):
+    """
+    Derive independent seeds for parallel workers (islands, pool workers, threads) from one seed,
+    using NumPy's SeedSequence so the child streams do not overlap or correlate like seed + i would.
+    :param seed: Parent seed (see `seed_to_int`), or None for OS entropy.
+    :param count: Number of child seeds.
+    :return: List of count non-negative ints.
+    """
+    sequence = np.random.SeedSequence(None if seed is None else seed_to_int(seed))
+    return [int.from_bytes(child.generate_state(4, np.uint32).tobytes(), "little")
+            for child in sequence.spawn(count)]
+
+
+def spawn_rngs(seed, count):
+    """Create count independent random generators from one seed, see `spawn_seeds`."""
+    return [make_rng(child_seed) for child_seed in spawn_seeds(seed, count)]
@@ -0,0 +1,109 @@
+import numpy as np
+
+SELECTION_SCHEMES = ("tournament", "sus", "rank", "truncation")
+
+
+def _uniform(count, size, rng):
+    return rng.integers(0, size, size=count)
+
+
+def tournament_selection(fitnesses, count, rng, tournament_size=3):
+    """
+    Tournament selection with all tournaments drawn at once: count x tournament_size random indices
+    (with replacement) and the fittest of each row wins. O(count * tournament_size).
+    :param fitnesses: Array of fitness values.
+    :param count: Number of individuals to select.
+    :param rng: numpy.random.Generator.
+    :param tournament_size: Number of contestants per tournament.
+    :return: Array of selected indices.
+    """
+    fitnesses = np.asarray(fitnesses, dtype=np.float64)
+    contestants = rng.integers(0, len(fitnesses), size=(count, tournament_size))
+    return contestants[np.arange(count), np.argmax(fitnesses[contestants], axis=1)]
+
+
+def _sus(weights, count, rng):
+    """Stochastic universal sampling: count equally spaced pointers over the cumulative weights."""
+    total = weights.sum()
+    if not total > 0 or not np.isfinite(total):
+        return _uniform(count, len(weights), rng)
+    step = total / count
+    pointers = rng.uniform(0, step) + step * np.arange(count)
+    selected = np.searchsorted(np.cumsum(weights), pointers, side='right')
+    # Pointers come out in population order, shuffle them so pairing parents stays random
+    return rng.permutation(np.minimum(selected, len(weights) - 1))
+
+
+def stochastic_universal_sampling(fitnesses, count, rng):
+    """
+    Fitness-proportionate selection by stochastic universal sampling, O(N + count log N).
+
+    Fitness values can be negative, so they are shifted by the worst finite fitness; individuals with
+    -inf fitness (invalid paths) are never selected unless every individual is invalid.
+    :param fitnesses: Array of fitness values.
+    :param count: Number of individuals to select.
+    :param rng: numpy.random.Generator.
+    :return: Array of selected indices.
+    """
+    fitnesses = np.asarray(fitnesses, dtype=np.float64)
+    finite = np.isfinite(fitnesses)
+    if not finite.any():
+        return _uniform(count, len(fitnesses), rng)
+    weights = np.where(finite, fitnesses - fitnesses[finite].min(), 0.0)
+    if not weights.any():
+        weights = finite.astype(np.float64)  # All valid individuals are equally fit
+    return _sus(weights, count, rng)
+
+
+def rank_selection(fitnesses, count, rng, pressure=1.5):
+    """
+    Linear ranking selection, O(N log N): the probability of an individual depends only on its rank,
+    from (2 - pressure) for the worst to pressure for the best (relative to the mean), sampled with
+    stochastic universal sampling. Individuals with -inf fitness get no weight.
+    :param fitnesses: Array of fitness values.
+    :param count: Number of individuals to select.
+    :param rng: numpy.random.Generator.
+    :param pressure: Selection pressure between 1 (uniform) and 2.
+    :return: Array of selected indices.
+    """
+    fitnesses = np.asarray(fitnesses, dtype=np.float64)
+    size = len(fitnesses)
+    ranks = np.empty(size)
+    ranks[np.argsort(fitnesses, kind='stable')] = np.arange(size)
+    weights = (2 - pressure) + 2 * (pressure - 1) * ranks / max(size - 1, 1)
+    weights[fitnesses == -np.inf] = 0.0
+    return _sus(weights, count, rng)
+
+
+def truncation_selection(fitnesses, count, rng, fraction=0.5):
+    """
+    Truncation selection, O(N): parents are drawn uniformly among the fittest fraction of the population.
+    :param fitnesses: Array of fitness values.
+    :param count: Number of individuals to select.
+    :param rng: numpy.random.Generator.
+    :param fraction: Fraction of the population kept as parents.
+    :return: Array of selected indices.
+    """
+    fitnesses = np.asarray(fitnesses, dtype=np.float64)
+    kept = min(max(int(len(fitnesses) * fraction), 1), len(fitnesses))
+    best = np.argpartition(-fitnesses, kept - 1)[:kept]
+    return best[rng.integers(0, kept, size=count)]
+
+
+_SCHEMES = {
+    "tournament": tournament_selection,
+    "sus": stochastic_universal_sampling,
+    "rank": rank_selection,
+    "truncation": truncation_selection,
+}
+
+
+def select_indices(scheme, fitnesses, count, rng, **params):
+    """
+    Select count parent indices with one of SELECTION_SCHEMES.
+    :param params: Scheme parameters (tournament_size, pressure or fraction).
+    :return: Array of selected indices.
+    """
+    if scheme not in _SCHEMES:
+        raise ValueError(f"Unknown selection scheme {scheme!r}, expected one of {SELECTION_SCHEMES}")
+    return _SCHEMES[scheme](fitnesses, count, rng, **params)
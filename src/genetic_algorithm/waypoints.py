@@ -0,0 +1,285 @@
+import math
+
+from src.genetic_algorithm.GeneticAlgorithm import (GeneticAlgorithm, calculate_path_distance, correct_path_to_end,
+                                                    crossover)
+from src.genetic_algorithm.fitness_cache import FitnessCache
+from src.graph.goal_distances import distance_cache_for
+
+# Probability that a child of a free-order search also reverses a run of its stop order (a 2-opt move)
+ORDER_MUTATION_RATE = 0.3
+
+
+def join_legs(legs):
+    """Concatenate legs, each starting at the last node of the previous one, into one route."""
+    route = list(legs[0])
+    for leg in legs[1:]:
+        route.extend(leg[1:])
+    return route
+
+
+def order_crossover(order1, order2, rng):
+    """
+    Order crossover (OX) of two stop orders with the same first and last stop: a run of the waypoints of
+    order1 keeps its place and the other waypoints fill the remaining places in the order of order2.
+    """
+    middle1 = order1[1:-1]
+    if len(middle1) < 2:
+        return list(order1)
+    i, j = sorted(rng.sample(range(len(middle1) + 1), 2))
+    kept = set(middle1[i:j])
+    rest = [stop for stop in order2[1:-1] if stop not in kept]
+    return [order1[0]] + rest[:i] + middle1[i:j] + rest[i:] + [order1[-1]]
+
+
+class WaypointGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Genetic algorithm for one route from start_node to end_node through intermediate stops.
+
+    An individual is the full route. It splits at the stops into legs, and every leg is a simple path to
+    its stop. Crossover mixes the legs of the parents and crosses one leg with `crossover`, and mutation
+    perturbs one leg, so a child costs about as much as a child of a single-leg search; leg distances are
+    memoized, so only the changed legs of a child are summed again. With ``free_order`` the waypoints may
+    be visited in any order (a traveling salesman problem on the stops): children also inherit their stop
+    order by order crossover and are mutated with 2-opt moves, which reuse the reversed legs in between.
+
+    The distance table of every stop is computed once and shared through the distance cache of the graph.
+    Legs are random walks guided toward their stop and broken legs are completed along shortest routes, so
+    every individual visits all stops; the stop-to-stop distances bias the stop orders of the initial
+    free-order routes toward near stops.
+    """
+
+    def __init__(self, graph, start_node, end_node, waypoints, generations, population_size, free_order=False,
+                 **options):
+        """
+        :param graph: Graph data as returned by `load_graph_from_json`, or a prebuilt CompactGraph.
+        :param waypoints: Node names of the intermediate stops, in visiting order unless free_order; they must
+                          be distinct and differ from start_node and end_node (which may be equal, for a
+                          round trip).
+        :param free_order: Let the algorithm choose the order of the waypoints.
+        :param options: Keyword arguments of `GeneticAlgorithm`; initial_paths must visit every stop.
+        """
+        super().__init__(graph, start_node, end_node, generations, population_size, **options)
+        self.waypoints = self.graph.to_ids(waypoints) if self.engine == "compact" else list(waypoints)
+        for waypoint in self.waypoints:
+            if waypoint not in self.graph:
+                raise KeyError(waypoint)
+        if len(set(self.waypoints)) != len(self.waypoints) or {self.start_node, self.end_node} & set(self.waypoints):
+            raise ValueError("Waypoints must be distinct and differ from start_node and end_node")
+        self.free_order = free_order
+        self.stops = [self.start_node] + self.waypoints + [self.end_node]
+        # Children share most legs with their parents, so leg distances are memoized on top of route fitness
+        self.leg_cache = FitnessCache(self.fitness_cache.max_size) if self.fitness_cache is not None else None
+        self.build_leg_guides()
+        for path in self.initial_paths:
+            if not self.visits_stops(path):
+                raise ValueError(f"Initial path {self.to_node_names(path)} does not visit every stop")
+
+    def build_leg_guides(self):
+        """
+        Build a GoalGuide toward every stop from the distance tables of the graph, checking that every stop
+        can be reached from start_node.
+        """
+        cache = distance_cache_for(self.graph)
+        self.leg_guides = {stop: cache.guide(stop) for stop in self.stops[1:]}
+        for stop, guide in self.leg_guides.items():
+            if not guide.reachable(self.start_node):
+                raise ValueError(f"Stop {self.to_node_names([stop])[0]!r} cannot be reached from the start node")
+
+    def stop_distance(self, u, v):
+        """Shortest distance between two stops (v must not be start_node, which has no table of its own)."""
+        return self.leg_guides[v].distances[u]
+
+    def stop_order(self, route):
+        """Stops of a route in visiting order: the given order, or with free_order the order of first visits."""
+        if not self.free_order:
+            return self.stops
+        pending = set(self.waypoints)
+        order = [self.start_node]
+        for node in route:
+            if node in pending:
+                order.append(node)
+                pending.discard(node)
+        order.append(self.end_node)
+        return order
+
+    def split_legs(self, route):
+        """
+        Split a route at its stops.
+        :return: List of legs, each from a stop to the next one, or None if the route misses a stop.
+        """
+        legs, start = [], 0
+        for stop in self.stop_order(route)[1:-1]:
+            try:
+                position = route.index(stop, start)
+            except ValueError:
+                return None
+            legs.append(route[start:position + 1])
+            start = position
+        legs.append(route[start:])
+        return legs
+
+    def visits_stops(self, route):
+        """Check that a route goes from start_node to end_node through every waypoint (in order unless free_order)."""
+        if not route or route[0] != self.start_node or route[-1] != self.end_node:
+            return False
+        if self.free_order:
+            return set(self.waypoints) <= set(route)
+        return self.split_legs(route) is not None
+
+    def leg_distance(self, leg):
+        """Distance of a leg, ``inf`` if it uses a missing edge."""
+        if self.leg_cache is None:
+            return calculate_path_distance(self.graph, leg)
+        key = tuple(leg)
+        distance = self.leg_cache.get(key)
+        if distance is None:
+            distance = calculate_path_distance(self.graph, leg)
+            self.leg_cache.put(key, distance)
+        return distance
+
+    def base_fitness(self, individual):
+        """
+        Like `GeneticAlgorithm.base_fitness`, with the distance summed over the (memoized) legs and -inf
+        fitness for routes that miss a stop.
+        """
+        legs = self.split_legs(individual) if self.visits_stops(individual) else None
+        if legs is None:
+            return float('inf'), -float('inf')
+        total_distance = sum(self.leg_distance(leg) for leg in legs)
+        if total_distance == float('inf'):
+            return total_distance, -float('inf')
+        return total_distance, self.distance_fitness(total_distance, True)
+
+    def walk_leg(self, leg, goal):
+        """Extend a leg to goal with a random walk guided by the distance table of goal."""
+        return correct_path_to_end(list(leg), self.graph, goal, self.leg_guides[goal], self.rng)
+
+    def shortest_leg(self, u, goal):
+        """Shortest leg from u to goal."""
+        return self.leg_guides[goal].complete([u])
+
+    def repair_leg(self, leg, goal):
+        """
+        Cut a leg before its first missing edge and complete it to goal along shortest routes (unchanged if
+        it is valid).
+        """
+        for i in range(len(leg) - 1):
+            if leg[i + 1] not in self.graph[leg[i]]:
+                leg = leg[:i + 1]
+                break
+        return leg if leg[-1] == goal else self.leg_guides[goal].complete(leg)
+
+    def random_order(self):
+        """
+        Random stop order for free_order: every next waypoint is drawn with a probability that falls by e
+        for every guide temperature (mean edge weight) it is farther than the nearest remaining one.
+        """
+        remaining = list(self.waypoints)
+        order = [self.start_node]
+        while remaining:
+            distances = [self.stop_distance(order[-1], stop) for stop in remaining]
+            nearest = min(distances)
+            weights = [math.exp(-(distance - nearest) / self.leg_guides[stop].temperature)
+                       for stop, distance in zip(remaining, distances)]
+            stop = self.rng.choices(remaining, weights=weights)[0]
+            remaining.remove(stop)
+            order.append(stop)
+        return order + [self.end_node]
+
+    def random_path(self):
+        """Random route: a guided random walk for every leg, along the stops or a random stop order."""
+        order = self.random_order() if self.free_order else self.stops
+        legs = [self.walk_leg([order[i]], order[i + 1]) for i in range(len(order) - 1)]
+        if any(leg is None for leg in legs):
+            self.profiler.count("initial_paths_rejected")
+            return None
+        return join_legs(legs)
+
+    def leg_table(self, route):
+        """Legs of a route by (stop, next stop), also reversed since edges are undirected."""
+        table = {}
+        for leg in self.split_legs(route):
+            table[(leg[0], leg[-1])] = leg
+            table.setdefault((leg[-1], leg[0]), leg[::-1])
+        return table
+
+    def recombine(self, parent1, parent2):
+        """
+        Uniform crossover of the legs: every leg is copied from a random parent having a leg between the same
+        two stops, and one random leg both parents have is crossed with `crossover`. A leg none of the parents
+        has (after an order crossover) is a shortest leg.
+        """
+        legs1, legs2 = self.leg_table(parent1), self.leg_table(parent2)
+        order = self.stop_order(parent1)
+        if self.free_order:
+            order = order_crossover(order, self.stop_order(parent2), self.rng)
+        pairs = list(zip(order, order[1:]))
+        shared = [k for k, pair in enumerate(pairs) if pair in legs1 and pair in legs2]
+        crossed = self.rng.choice(shared) if shared else None
+        legs = []
+        for k, (u, goal) in enumerate(pairs):
+            leg1, leg2 = legs1.get((u, goal)), legs2.get((u, goal))
+            if k == crossed:
+                leg = self.repair_leg(crossover(leg1, leg2, self.graph, goal, self.leg_guides[goal], self.rng), goal)
+                if leg is None:
+                    return None
+            elif leg1 is not None and leg2 is not None:
+                leg = list(leg1 if self.rng.random() < 0.5 else leg2)
+            elif leg1 is not None or leg2 is not None:
+                leg = list(leg1 if leg1 is not None else leg2)
+            else:
+                leg = self.shortest_leg(u, goal)
+            legs.append(leg)
+        return join_legs(legs)
+
+    def reverse_stops(self, legs):
+        """
+        2-opt move: reverse the visiting order of a random run of waypoints. The legs inside the run are
+        reused backwards and the two legs joining it to the rest of the route are shortest legs.
+        """
+        # Waypoints i..j of the stop order are reversed; leg k goes from stop k to stop k + 1
+        i, j = sorted(self.rng.sample(range(1, len(legs)), 2))
+        before = self.shortest_leg(legs[i - 1][0], legs[j][0])
+        inner = [leg[::-1] for leg in reversed(legs[i:j])]
+        after = self.shortest_leg(legs[i][0], legs[j][-1])
+        return legs[:i - 1] + [before] + inner + [after] + legs[j + 1:]
+
+    def mutate(self, individual, mutation_rate=0.2):
+        """
+        Mutate one random leg like `GeneticAlgorithm.mutate` and repair it toward its stop; with free_order the
+        stop order may also get a 2-opt move.
+        """
+        legs = self.split_legs(individual)
+        if self.free_order and len(self.waypoints) > 1 and self.rng.random() < ORDER_MUTATION_RATE:
+            legs = self.reverse_stops(legs)
+        k = self.rng.randrange(len(legs))
+        leg = list(legs[k])
+        for i in range(1, len(leg) - 1):  # Exclude the stops
+            if self.rng.random() < mutation_rate:
+                neighbors = list(self.graph.neighbors(leg[i]))
+                if neighbors:
+                    leg[i] = self.rng.choice(neighbors)
+        leg = self.repair_leg(list(dict.fromkeys(leg)), legs[k][-1])
+        if leg is None:
+            self.profiler.count("mutation_repair_failures")
+            return None
+        legs[k] = leg
+        return join_legs(legs)
+
+    def repair_path(self, individual):
+        """Repair every leg of a route on the current edges, see `repair_leg`."""
+        legs = [self.repair_leg(leg, leg[-1]) for leg in self.split_legs(individual)]
+        if any(leg is None for leg in legs):
+            return None
+        return join_legs(legs)
+
+    def update_graph(self, changes):
+        """
+        Apply edge changes like `GeneticAlgorithm.update_graph`, forget the leg distances and rebuild the guides
+        of the stops.
+        """
+        dropped = super().update_graph(changes)
+        if self.leg_cache is not None:
+            self.leg_cache.clear()
+        self.build_leg_guides()
+        return dropped
@@ -0,0 +1,355 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.graph.graph_builder import GraphBuilder
+
+
+def position_array(node_names, positions):
+    """
+    Node coordinates as an array aligned with node ids.
+    :param node_names: Sequence of node names.
+    :param positions: Dictionary {node: (x, y)}; may be None or miss some nodes.
+    :return: ``(len(node_names), 2)`` float array with NaN for unknown positions, or None without positions.
+    """
+    if not positions:
+        return None
+    return np.array([positions.get(node, (np.nan, np.nan)) for node in node_names],
+                    dtype=np.float64).reshape(len(node_names), 2)
+
+
+class _LazyRows(dict):
+    """
+    Per-node {neighbor_id: weight} rows, or {neighbor_id: position in the CSR arrays} rows, each built from the
+    CSR arrays the first time it is used.
+    """
+
+    def __init__(self, graph, positions=False):
+        super().__init__()
+        self.graph = graph
+        self.positions = positions
+
+    def __missing__(self, node_id):
+        graph = self.graph
+        start, stop = int(graph.offsets[node_id]), int(graph.offsets[node_id + 1])
+        values = range(start, stop) if self.positions else graph.weights[start:stop].tolist()
+        row = dict(zip(graph.neighbor_ids[start:stop].tolist(), values))
+        self[node_id] = row
+        return row
+
+
+class CompactGraph:
+    """
+    Integer-indexed graph stored in CSR (compressed sparse row) form.
+
+    Every node name is mapped to a contiguous integer id. The neighbors of node ``u`` are
+    ``neighbor_ids[offsets[u]:offsets[u + 1]]`` and the matching edge weights live at the same
+    positions in ``weights``. Neighbor order follows edge insertion order, exactly like networkx, so
+    the genetic algorithm makes the same random choices on both representations.
+
+    For the Python hot loop a per-node ``{neighbor_id: weight}`` row is derived from the arrays the
+    first time the node is used; ``graph[u]`` returns that row, so membership tests and iteration work
+    like they do on a ``networkx.Graph``. The name-to-id index is also built on first use, so a graph
+    on top of memory-mapped arrays is ready as soon as the arrays are mapped.
+
+    Further edge attributes (e.g. travel time or tolls) are optional float arrays in ``edge_attributes``,
+    aligned with ``neighbor_ids`` like the weights, so the costs of all the edges of a path can be gathered
+    from every attribute at once (see `edge_positions`).
+
+    The node set is fixed; edges only change through `update_edges`.
+    """
+
+    def __init__(self, node_names, offsets, neighbor_ids, weights, positions=None, edge_attributes=None):
+        """
+        :param node_names: Sequence of node names, the position of each name is its integer id.
+        :param offsets: Array of length ``len(node_names) + 1`` with the CSR row offsets.
+        :param neighbor_ids: Flat array of neighbor ids.
+        :param weights: Flat array of edge weights aligned with ``neighbor_ids``.
+        :param positions: Optional ``(len(node_names), 2)`` array of node coordinates, NaN when unknown.
+        :param edge_attributes: Optional dictionary {name: array} of further edge attributes aligned with
+                                ``neighbor_ids``.
+        """
+        # Any sequence is kept as is, e.g. the lazy name table of a memory-mapped binary graph
+        self.node_names = node_names if isinstance(node_names, Sequence) else list(node_names)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.neighbor_ids = np.asarray(neighbor_ids, dtype=np.int64)
+        self.weights = np.asarray(weights)
+        self.positions = None if positions is None else np.asarray(positions, dtype=np.float64)
+        self.edge_attributes = {name: np.asarray(values, dtype=np.float64)
+                                for name, values in (edge_attributes or {}).items()}
+        self._node_index = None
+        self._rows = _LazyRows(self)
+        self._position_rows = _LazyRows(self, positions=True)
+
+    @property
+    def node_index(self):
+        """Dictionary mapping node names to integer ids."""
+        if self._node_index is None:
+            self._node_index = {name: node_id for node_id, name in enumerate(self.node_names)}
+        return self._node_index
+
+    @classmethod
+    def from_adjacency(cls, adjacency, positions=None):
+        """
+        Build a compact graph from an ordered ``{node: {neighbor: weight}}`` mapping.
+        :param adjacency: Symmetric adjacency mapping, in the desired node and neighbor order.
+        :param positions: Optional dictionary {node: (x, y)} of node coordinates.
+        :return: CompactGraph object.
+        """
+        node_names = list(adjacency)
+        node_index = {name: node_id for node_id, name in enumerate(node_names)}
+        offsets = [0]
+        neighbor_ids = []
+        weights = []
+        for node in node_names:
+            for neighbor, weight in adjacency[node].items():
+                neighbor_ids.append(node_index[neighbor])
+                weights.append(weight)
+            offsets.append(len(neighbor_ids))
+        return cls(node_names, offsets, neighbor_ids, weights, position_array(node_names, positions))
+
+    @classmethod
+    def from_data(cls, data, positions=None, attributes=()):
+        """
+        Build a compact graph from the same dictionary or list of edges accepted by
+        `create_graph_from_data`, straight into the CSR arrays (see `GraphBuilder.csr_arrays`).
+        :param data: Dict of ``{node: [{"node": neighbor, "weight": weight, ...}, ...]}`` or a list of
+                     ``(u, v)``, ``(u, v, weight)`` or ``(u, v, {"weight": weight, ...})`` tuples.
+        :param positions: Optional dictionary {node: (x, y)} of node coordinates.
+        :param attributes: Names of edge attributes (e.g. "time", "toll") stored in ``edge_attributes``.
+        :return: CompactGraph object.
+        """
+        builder = GraphBuilder.from_data(data, attributes)
+        node_names = builder.node_names
+        return cls(node_names, *builder.csr_arrays(), position_array(node_names, positions),
+                   builder.csr_attributes())
+
+    @classmethod
+    def from_networkx(cls, g):
+        """
+        Build a compact graph from a weighted networkx graph.
+        :param g: The graph (networkx.Graph).
+        :return: CompactGraph object.
+        """
+        return cls.from_adjacency({node: {neighbor: data.get('weight', 1) for neighbor, data in g[node].items()}
+                                   for node in g.nodes})
+
+    def __len__(self):
+        return len(self.node_names)
+
+    def __contains__(self, node_id):
+        return isinstance(node_id, (int, np.integer)) and 0 <= node_id < len(self.node_names)
+
+    def __getitem__(self, node_id):
+        return self._rows[node_id]
+
+    def number_of_nodes(self):
+        return len(self.node_names)
+
+    def number_of_edges(self):
+        """Number of undirected edges (each symmetric pair is counted once)."""
+        rows = np.repeat(np.arange(len(self.offsets) - 1), np.diff(self.offsets))
+        self_loops = int(np.count_nonzero(rows == self.neighbor_ids))
+        return (len(self.neighbor_ids) + self_loops) // 2
+
+    def neighbors(self, node_id):
+        """Return the neighbor ids of a node, in insertion order."""
+        return list(self._rows[node_id])
+
+    def has_edge(self, u, v):
+        return v in self._rows[u]
+
+    def edge_weight(self, u, v):
+        return self._rows[u][v]
+
+    def edge_attribute(self, name):
+        """Array of an edge attribute aligned with ``neighbor_ids``; "weight" is the weight array."""
+        if name == "weight":
+            return self.weights
+        return self.edge_attributes[name]
+
+    def edge_positions(self, path):
+        """
+        Positions of the edges of a path of ids in ``neighbor_ids``, and so in the weight and attribute arrays.
+        :return: List of positions, or None if any edge is missing.
+        """
+        rows = self._position_rows
+        try:
+            return [rows[u][v] for u, v in zip(path, path[1:])]
+        except KeyError:
+            return None
+
+    def index(self, name):
+        """Return the integer id of a node name, raising KeyError if it is not in the graph."""
+        return self.node_index[name]
+
+    def name(self, node_id):
+        return self.node_names[node_id]
+
+    def to_ids(self, path):
+        """Translate a path of node names into a path of integer ids."""
+        return [self.node_index[name] for name in path]
+
+    def to_names(self, path):
+        """Translate a path of integer ids back into node names."""
+        return [self.node_names[node_id] for node_id in path]
+
+    def to_data(self):
+        """
+        Convert back to the JSON dictionary format, ``{name: [{"node": neighbor, "weight": weight}, ...]}``, with
+        the edge attributes in every entry.
+        """
+        if self.edge_attributes:
+            names = self.node_names
+            columns = [("weight", self.weights.tolist())]
+            columns += [(name, values.tolist()) for name, values in self.edge_attributes.items()]
+            neighbor_ids = self.neighbor_ids.tolist()
+            offsets = self.offsets.tolist()
+            return {names[node_id]: [{"node": names[neighbor_ids[position]],
+                                      **{name: values[position] for name, values in columns}}
+                                     for position in range(offsets[node_id], offsets[node_id + 1])]
+                    for node_id in range(len(names))}
+        return {self.node_names[node_id]: [{"node": self.node_names[neighbor], "weight": weight}
+                                           for neighbor, weight in self._rows[node_id].items()]
+                for node_id in range(len(self.node_names))}
+
+    def positions_dict(self):
+        """Node coordinates as a dictionary {name: (x, y)}, skipping unknown positions (None if there are none)."""
+        if self.positions is None:
+            return None
+        return {self.node_names[node_id]: (x, y) for node_id, (x, y) in enumerate(self.positions.tolist())
+                if not (np.isnan(x) or np.isnan(y))}
+
+    def is_valid_path(self, path):
+        """Check that every consecutive pair of ids in the path is connected."""
+        rows = self._rows
+        for i in range(len(path) - 1):
+            if path[i + 1] not in rows[path[i]]:
+                return False
+        return True
+
+    def path_distance(self, path):
+        """Total weight of a path of ids, or ``float('inf')`` if any edge is missing."""
+        rows = self._rows
+        total_distance = 0
+        for i in range(len(path) - 1):
+            weight = rows[path[i]].get(path[i + 1])
+            if weight is None:
+                return float('inf')
+            total_distance += weight
+        return total_distance
+
+    def _edge_position(self, u, v):
+        """Index of the directed entry u -> v in ``neighbor_ids`` and ``weights``."""
+        start, stop = int(self.offsets[u]), int(self.offsets[u + 1])
+        return start + int(np.flatnonzero(self.neighbor_ids[start:stop] == v)[0])
+
+    def update_edges(self, changes):
+        """
+        Change, remove or add undirected edges in place.
+
+        Weight and attribute changes are written into their arrays (copied first if they are read-only, e.g.
+        memory-mapped or shared). Removals and additions rebuild the CSR arrays in one vectorised pass; like on a
+        ``networkx.Graph``, the other neighbors keep their order and an added edge comes last in both rows.
+        :param changes: Iterable of ``(u, v, weight)`` or ``(u, v, weight, attributes)`` tuples of node ids, where
+                        attributes is a dictionary {name: value} of edge attributes. A weight of None removes the
+                        edge (nothing happens if it does not exist); an edge not in the graph is added and must
+                        give a value for every attribute in ``edge_attributes``.
+        :return: Set of the directed ``(u, v)`` pairs whose weight or attributes changed or that were removed or
+                 added, in both directions: the paths using them have a new distance or became invalid or valid.
+        """
+        reweighted = {}
+        reattributed = {}
+        removed = set()
+        added = {}
+        for u, v, weight, *attributes in changes:
+            attributes = dict(attributes[0]) if attributes else {}
+            if u not in self or v not in self:
+                raise ValueError(f"Unknown node id in edge ({u}, {v})")
+            unknown = set(attributes) - set(self.edge_attributes)
+            if unknown:
+                raise ValueError(f"The graph has no edge attributes {sorted(unknown)}")
+            key = (min(u, v), max(u, v))
+            exists = key not in removed and (key in added or v in self._rows[u])
+            if weight is None:
+                if exists:
+                    if added.pop(key, None) is None:
+                        removed.add(key)
+                        reweighted.pop(key, None)
+                        reattributed.pop(key, None)
+            elif key in added or not exists:
+                if key in added:
+                    attributes = {**added[key][1], **attributes}
+                missing = set(self.edge_attributes) - set(attributes)
+                if missing:
+                    raise ValueError(f"Added edge ({u}, {v}) has no value for the edge attributes {sorted(missing)}")
+                added[key] = (weight, attributes)
+            else:
+                if key in reweighted or self._rows[u][v] != weight:
+                    reweighted[key] = weight
+                if attributes:
+                    reattributed.setdefault(key, {}).update(attributes)
+
+        if reweighted:
+            dtype = np.result_type(self.weights, *reweighted.values())
+            if not self.weights.flags.writeable or dtype != self.weights.dtype:
+                self.weights = self.weights.astype(dtype)
+            for (u, v), weight in reweighted.items():
+                self.weights[self._edge_position(u, v)] = weight
+                self.weights[self._edge_position(v, u)] = weight
+                if u in self._rows:
+                    self._rows[u][v] = weight
+                if v in self._rows:
+                    self._rows[v][u] = weight
+
+        for key, attributes in list(reattributed.items()):
+            positions = [self._edge_position(*key), self._edge_position(*key[::-1])]
+            changed = False
+            for name, value in attributes.items():
+                values = self.edge_attributes[name]
+                if values[positions[0]] != value:
+                    if not values.flags.writeable:
+                        values = self.edge_attributes[name] = values.copy()
+                    values[positions] = value
+                    changed = True
+            if not changed:
+                del reattributed[key]
+
+        if removed or added:
+            num_nodes = len(self.node_names)
+            rows = np.repeat(np.arange(num_nodes, dtype=np.int64), np.diff(self.offsets))
+            keep = np.ones(len(rows), dtype=bool)
+            for u, v in removed:
+                keep[self._edge_position(u, v)] = False
+                keep[self._edge_position(v, u)] = False
+            new_rows, new_ids, new_weights = [], [], []
+            new_attributes = {name: [] for name in self.edge_attributes}
+            for (u, v), (weight, attributes) in added.items():
+                pairs = ((u, v),) if u == v else ((u, v), (v, u))
+                for source, target in pairs:
+                    new_rows.append(source)
+                    new_ids.append(target)
+                    new_weights.append(weight)
+                    for name, values in new_attributes.items():
+                        values.append(attributes[name])
+            rows = np.concatenate([rows[keep], np.asarray(new_rows, dtype=np.int64)])
+            neighbor_ids = np.concatenate([self.neighbor_ids[keep], np.asarray(new_ids, dtype=np.int64)])
+            weights = self.weights[keep]
+            if new_weights:
+                weights = np.concatenate([weights, np.asarray(new_weights)])
+            # A stable sort by row keeps the existing neighbor order and puts the added edges last
+            order = np.argsort(rows, kind='stable')
+            self.neighbor_ids = neighbor_ids[order]
+            self.weights = weights[order]
+            self.edge_attributes = {name: np.concatenate([values[keep],
+                                                          np.asarray(new_attributes[name], dtype=np.float64)])[order]
+                                    for name, values in self.edge_attributes.items()}
+            self.offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(rows, minlength=num_nodes), out=self.offsets[1:])
+            self._rows = _LazyRows(self)
+            self._position_rows = _LazyRows(self, positions=True)
+
+        stale = set()
+        for u, v in [*reweighted, *reattributed, *removed, *added]:
+            stale.update(((u, v), (v, u)))
+        return stale
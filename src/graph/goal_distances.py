@@ -0,0 +1,265 @@
+import heapq
+import math
+import random
+from collections import OrderedDict, deque
+
+import numpy as np
+from src.graph.compact_graph import CompactGraph
+
+
+def weighted_neighbors(graph, node):
+    """
+    Iterate over (neighbor, weight) pairs of a node on a networkx.Graph or a CompactGraph.
+    :param graph: The graph.
+    :param node: The node (a name, or an integer id on a CompactGraph).
+    :return: Iterable of (neighbor, weight) tuples, in neighbor order.
+    """
+    if isinstance(graph, CompactGraph):
+        return graph[node].items()
+    return ((neighbor, data['weight']) for neighbor, data in graph[node].items())
+
+
+def dijkstra_distances(graph, source):
+    """
+    Shortest distance from source to every reachable node. Edges are undirected, so this is also the
+    distance from every node to source (the reverse search used for a destination).
+    :param graph: networkx.Graph or CompactGraph.
+    :param source: Node to measure distances from.
+    :return: Dictionary {node: distance}; unreachable nodes are absent.
+    """
+    distances = {source: 0}
+    heap = [(0, 0, source)]
+    counter = 1  # Tie breaker so nodes themselves are never compared
+    while heap:
+        distance, _, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        for neighbor, weight in weighted_neighbors(graph, node):
+            candidate = distance + weight
+            if candidate < distances.get(neighbor, math.inf):
+                distances[neighbor] = candidate
+                heapq.heappush(heap, (candidate, counter, neighbor))
+                counter += 1
+    return distances
+
+
+def shortest_route_hops(graph, source, distances):
+    """
+    Fewest edges on a shortest route from every reachable node to source. With zero-weight edges several
+    neighbors can be equally close to source, and this breaks the tie toward the one that gets there in
+    fewer steps.
+    :param graph: networkx.Graph or CompactGraph.
+    :param source: Node the distances were measured from.
+    :param distances: Dictionary {node: distance}, see `dijkstra_distances`.
+    :return: Dictionary {node: number of edges}.
+    """
+    hops = {source: 0}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for neighbor, weight in weighted_neighbors(graph, node):
+            if neighbor not in hops and distances.get(neighbor) == distances[node] + weight:
+                hops[neighbor] = hops[node] + 1
+                queue.append(neighbor)
+    return hops
+
+
+def straight_line_scale(graph):
+    """
+    Largest factor s such that every edge of a CompactGraph is at least s times as long as the straight line
+    between its nodes. ``s * straight-line distance`` is then a consistent lower bound of the remaining
+    distance whatever the units of the positions, which keeps A* exact.
+    :param graph: CompactGraph with positions.
+    :return: The factor, 0.0 without positions (A* then behaves like Dijkstra).
+    """
+    if graph.positions is None or len(graph.neighbor_ids) == 0:
+        return 0.0
+    rows = np.repeat(np.arange(len(graph.offsets) - 1), np.diff(graph.offsets))
+    offsets = graph.positions[rows] - graph.positions[graph.neighbor_ids]
+    lengths = np.hypot(offsets[:, 0], offsets[:, 1])
+    valid = np.isfinite(lengths) & (lengths > 0)
+    if not valid.any():
+        return 0.0
+    # Shrunk slightly so that rounding never makes the bound exceed an exact distance
+    return max(float(np.min(graph.weights[valid] / lengths[valid])), 0.0) * (1 - 1e-9)
+
+
+def straight_line_heuristic(graph, target, scale):
+    """
+    A* heuristic from the node positions of a CompactGraph: ``scale`` times the straight-line distance to
+    target, 0 for nodes without a position.
+    :param scale: Factor returned by `straight_line_scale`.
+    :return: Callable node id -> lower bound of the distance to target, or None when no bound is available.
+    """
+    if scale <= 0 or graph.positions is None:
+        return None
+    positions = graph.positions
+    target_x, target_y = positions[target].tolist()
+    if math.isnan(target_x) or math.isnan(target_y):
+        return None
+
+    def heuristic(node):
+        x, y = positions[node].tolist()
+        distance = math.hypot(x - target_x, y - target_y)
+        return 0 if math.isnan(distance) else scale * distance
+    return heuristic
+
+
+class GoalGuide:
+    """
+    Distance-to-goal table for one destination, used to bias random walk steps toward the goal and to
+    complete partial paths.
+
+    Stepping from ``u`` to ``v`` costs a detour of ``w(u, v) + d(v) - d(u) >= 0`` over the shortest
+    route; `step` picks an unvisited neighbor with probability proportional to
+    ``exp(-detour / temperature)`` so shortest-route steps are the most likely but others stay
+    possible. `complete` always reaches the goal when it is reachable.
+    """
+
+    def __init__(self, graph, goal, distances, temperature):
+        """
+        :param graph: networkx.Graph or CompactGraph.
+        :param goal: Destination node.
+        :param distances: Dictionary {node: distance to goal}, see `dijkstra_distances`.
+        :param temperature: Detour length that makes a step e times less likely than a shortest-route step.
+        """
+        self.graph = graph
+        self.goal = goal
+        self.distances = distances
+        self.temperature = temperature or 1
+        self._hops = None
+
+    def reachable(self, node):
+        return node in self.distances
+
+    def step(self, node, visited, rng=random):
+        """
+        Draw the next node of a walk among the unvisited neighbors that can still reach the goal.
+        :param node: Current node.
+        :param visited: Container of the nodes already in the path.
+        :param rng: Random generator (random.Random instance or the `random` module).
+        :return: The next node, or None if there is no candidate.
+        """
+        base = self.distances.get(node, math.inf)
+        candidates = []
+        weights = []
+        for neighbor, weight in weighted_neighbors(self.graph, node):
+            if neighbor in visited or neighbor not in self.distances:
+                continue
+            detour = max(weight + self.distances[neighbor] - base, 0) if base != math.inf else 0
+            candidates.append(neighbor)
+            weights.append(math.exp(-detour / self.temperature))
+        if not candidates:
+            return None
+        return rng.choices(candidates, weights=weights)[0]
+
+    def next_hop(self, node):
+        """Neighbor of node on a shortest route to the goal, always closer to the goal in distance or hops."""
+        distances = self.distances
+        neighbor = min(weighted_neighbors(self.graph, node),
+                       key=lambda item: item[1] + distances.get(item[0], math.inf))[0]
+        if distances.get(neighbor, math.inf) < distances[node]:
+            return neighbor
+        # Zero-weight edge: a tied neighbor may lead back, prefer the closest one and then the fewest hops
+        if self._hops is None:
+            self._hops = shortest_route_hops(self.graph, self.goal, distances)
+        return min(weighted_neighbors(self.graph, node),
+                   key=lambda item: (item[1] + distances.get(item[0], math.inf), distances.get(item[0], math.inf),
+                                     self._hops.get(item[0], math.inf)))[0]
+
+    def complete(self, path):
+        """
+        Extend a path to the goal along shortest routes, cutting the loop whenever the route runs into
+        a node already in the path so the result stays a simple path.
+        :param path: Non-empty path whose last node can reach the goal.
+        :return: The completed path, or None if the last node cannot reach the goal.
+        """
+        if not self.reachable(path[-1]):
+            return None
+        positions = {node: i for i, node in enumerate(path)}
+        path = list(path)
+        while path[-1] != self.goal:
+            node = self.next_hop(path[-1])
+            if node in positions:
+                for removed in path[positions[node] + 1:]:
+                    del positions[removed]
+                del path[positions[node] + 1:]
+            else:
+                positions[node] = len(path)
+                path.append(node)
+        return path
+
+
+class DistanceTableCache:
+    """Least-recently-used cache of distance-to-goal tables of one graph, keyed by destination."""
+
+    def __init__(self, graph, max_size=128):
+        """
+        :param graph: networkx.Graph or CompactGraph.
+        :param max_size: Maximum number of destinations kept.
+        """
+        self.graph = graph
+        self.max_size = max_size
+        self.tables = OrderedDict()
+        self._mean_weight = None
+        self._straight_line_scale = None
+
+    def distances(self, goal):
+        """Distance table to goal, computed by reverse Dijkstra on first use."""
+        table = self.tables.get(goal)
+        if table is None:
+            table = dijkstra_distances(self.graph, goal)
+            self.tables[goal] = table
+            while len(self.tables) > self.max_size:
+                self.tables.popitem(last=False)
+        self.tables.move_to_end(goal)
+        return table
+
+    def clear(self):
+        """Forget every table, e.g. after the edges of the graph changed."""
+        self.tables.clear()
+        self._mean_weight = None
+        self._straight_line_scale = None
+
+    def mean_weight(self):
+        """Mean edge weight of the graph, the default guide temperature."""
+        if self._mean_weight is None:
+            if isinstance(self.graph, CompactGraph):
+                weights = self.graph.weights
+                self._mean_weight = float(weights.mean()) if len(weights) else 1.0
+            else:
+                weights = [data['weight'] for _, _, data in self.graph.edges(data=True)]
+                self._mean_weight = sum(weights) / len(weights) if weights else 1.0
+        return self._mean_weight
+
+    def straight_line_scale(self):
+        """Factor of the A* straight-line heuristic of a CompactGraph, see `straight_line_scale`."""
+        if self._straight_line_scale is None:
+            self._straight_line_scale = straight_line_scale(self.graph)
+        return self._straight_line_scale
+
+    def guide(self, goal, temperature=None):
+        """
+        GoalGuide toward goal.
+        :param temperature: Optional guide temperature, by default the mean edge weight.
+        """
+        return GoalGuide(self.graph, goal, self.distances(goal), temperature or self.mean_weight())
+
+
+def distance_cache_for(graph):
+    """
+    Return the DistanceTableCache stored on a graph object, so that every GeneticAlgorithm sharing the
+    graph (e.g. the queries of a BatchSolver) shares its distance tables.
+    """
+    cache = getattr(graph, '_distance_cache', None)
+    if cache is None:
+        cache = DistanceTableCache(graph)
+        graph._distance_cache = cache
+    return cache
+
+
+def invalidate_distance_cache(graph):
+    """Drop the distance tables stored on a graph object, after its edges changed."""
+    cache = getattr(graph, '_distance_cache', None)
+    if cache is not None:
+        cache.clear()
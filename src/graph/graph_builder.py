@@ -0,0 +1,200 @@
+import numpy as np
+
+# An undirected edge is stored under the key ``u_id << ID_BITS | v_id``: plain integers hash faster than id
+# tuples and, unlike tuples, are not tracked by the garbage collector, which matters for millions of edges
+ID_BITS = 32
+ID_MASK = (1 << ID_BITS) - 1
+
+
+class GraphBuilder:
+    """
+    Bulk builder of undirected weighted graphs, shared by `create_graph_from_data`, `CompactGraph.from_data`,
+    the streaming JSON loader and the visualization.
+
+    The input is read in one linear pass: every node name gets an integer id in first-seen order and every
+    undirected edge is stored once, keyed by the id pair it was first seen with, so the symmetric entry of an
+    adjacency list (``v -> u`` after ``u -> v``) only updates the weight. A repeated edge keeps its position
+    and takes the last weight, like repeated ``add_edge`` calls on a ``networkx.Graph``. The node order and
+    the neighbor order of the built graphs are therefore the same as when inserting the edges one by one.
+
+    Further numeric edge attributes (e.g. "time" or "toll") are only collected when named, in one dictionary
+    per attribute keyed like the weights; without them the edge loops do no extra work.
+    """
+
+    def __init__(self, attributes=()):
+        """
+        :param attributes: Names of the edge attributes to collect besides the weight.
+        """
+        self.node_index = {}
+        self._edges = {}
+        self.attributes = tuple(attributes)
+        self._attribute_values = {name: {} for name in self.attributes}
+
+    @classmethod
+    def from_data(cls, data, attributes=()):
+        """
+        Collect the graph data accepted by `create_graph_from_data`.
+        :param data: Dict of ``{node: [{"node": neighbor, "weight": weight, ...}, ...]}`` or a list of
+                     ``(u, v)``, ``(u, v, weight)`` or ``(u, v, {"weight": weight, ...})`` tuples.
+        :param attributes: Names of the edge attributes to collect besides the weight.
+        :return: GraphBuilder object.
+        """
+        builder = cls(attributes)
+        builder.add_data(data)
+        return builder
+
+    @property
+    def node_names(self):
+        """List of node names, the position of each name is its integer id."""
+        return list(self.node_index)
+
+    def number_of_edges(self):
+        return len(self._edges)
+
+    def add_node(self, name):
+        """Add a node if it is new and return its integer id."""
+        return self.node_index.setdefault(name, len(self.node_index))
+
+    def add_edge(self, u, v, weight=1, **attributes):
+        """
+        Add an undirected edge between two node names, or set the weight (and the given collected attributes)
+        of an existing one.
+        """
+        key = self._edge_key(u, v)
+        self._edges[key] = weight
+        self._set_attributes(key, attributes)
+
+    def _edge_key(self, u, v):
+        """Key of the undirected edge between two node names: the id pair it was first seen with."""
+        node_index = self.node_index
+        u_id = node_index.setdefault(u, len(node_index))
+        v_id = node_index.setdefault(v, len(node_index))
+        reverse = v_id << ID_BITS | u_id
+        return reverse if reverse in self._edges else u_id << ID_BITS | v_id
+
+    def _set_attributes(self, key, values):
+        """Store the collected attributes found in a mapping (an adjacency entry) for an edge key."""
+        for name, stored in self._attribute_values.items():
+            if name in values:
+                stored[key] = values[name]
+
+    def add_edges_from(self, edges):
+        """
+        Add a batch of undirected edges.
+        :param edges: Iterable of ``(u, v, weight)`` tuples of node names.
+        """
+        node_index, stored = self.node_index, self._edges
+        for u, v, weight in edges:
+            u_id = node_index.setdefault(u, len(node_index))
+            v_id = node_index.setdefault(v, len(node_index))
+            reverse = v_id << ID_BITS | u_id
+            stored[reverse if reverse in stored else u_id << ID_BITS | v_id] = weight
+
+    def add_adjacency(self, node, entries):
+        """
+        Add a node and its adjacency list, in the JSON format ``[{"node": neighbor, "weight": weight}, ...]``.
+        """
+        node_index, stored = self.node_index, self._edges
+        if self.attributes:
+            node_index.setdefault(node, len(node_index))
+            for entry in entries:
+                key = self._edge_key(node, entry["node"])
+                stored[key] = entry["weight"]
+                self._set_attributes(key, entry)
+            return
+        u_id = node_index.setdefault(node, len(node_index))
+        for entry in entries:
+            v_id = node_index.setdefault(entry["node"], len(node_index))
+            reverse = v_id << ID_BITS | u_id
+            stored[reverse if reverse in stored else u_id << ID_BITS | v_id] = entry["weight"]
+
+    def add_data(self, data):
+        """Add the nodes and edges of graph data, see `from_data`."""
+        if isinstance(data, list):
+            if not self.attributes:
+                self.add_edges_from(_weighted_edge(edge) for edge in data)
+                return
+            for edge in data:
+                u, v, weight = _weighted_edge(edge)
+                key = self._edge_key(u, v)
+                self._edges[key] = weight
+                if len(edge) > 2 and isinstance(edge[2], dict):
+                    self._set_attributes(key, edge[2])
+        elif isinstance(data, dict):
+            for node, entries in data.items():
+                self.add_adjacency(node, entries)
+
+    def _csr_layout(self):
+        """
+        Both directions of every edge in CSR order, built with NumPy without any per-node Python structure.
+        :return: A tuple (offsets, neighbor_ids, keep, order): values given per edge in insertion order are
+                 spread over the CSR entries by ``np.repeat(values, 2)[keep][order]``.
+        """
+        num_nodes, num_edges = len(self.node_index), len(self._edges)
+        keys = np.fromiter(self._edges, dtype=np.int64, count=num_edges)
+        pairs = np.stack([keys >> ID_BITS, keys & ID_MASK], axis=1)
+        # Both directions of edge i sit at positions 2i and 2i + 1 (a self-loop only once), so a stable sort
+        # by source node lists the neighbors of every node in edge insertion order
+        sources = pairs.ravel()
+        targets = pairs[:, ::-1].ravel()
+        keep = np.ones(2 * num_edges, dtype=bool)
+        keep[1::2] = pairs[:, 0] != pairs[:, 1]
+        sources, targets = sources[keep], targets[keep]
+        order = np.argsort(sources, kind='stable')
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+        return offsets, targets[order], keep, order
+
+    def csr_arrays(self):
+        """
+        The adjacency in CSR form.
+        :return: A tuple (offsets, neighbor_ids, weights) for `CompactGraph`.
+        """
+        offsets, neighbor_ids, keep, order = self._csr_layout()
+        weights = np.repeat(np.asarray(list(self._edges.values())), 2)[keep][order]
+        return offsets, neighbor_ids, weights
+
+    def csr_attributes(self):
+        """
+        The collected edge attributes as contiguous float arrays aligned with the neighbor ids of `csr_arrays`.
+        :return: Dictionary {name: array}; an edge without a value for an attribute gets 0 (e.g. no toll).
+        """
+        if not self.attributes:
+            return {}
+        _, _, keep, order = self._csr_layout()
+        arrays = {}
+        for name, stored in self._attribute_values.items():
+            values = np.fromiter((stored.get(key, 0) for key in self._edges), dtype=np.float64,
+                                 count=len(self._edges))
+            arrays[name] = np.repeat(values, 2)[keep][order]
+        return arrays
+
+    def to_networkx(self):
+        """
+        Build a ``networkx.Graph`` with one batched insertion of the nodes and one of the edges.
+        :return: networkx.Graph object with a 'weight' attribute on every edge, and the collected attributes
+                 on the edges that have them.
+        """
+        import networkx as nx  # Imported here so that code paths on compact graphs never load networkx
+
+        names = self.node_names
+        g = nx.Graph()
+        g.add_nodes_from(names)
+        if not self.attributes:
+            g.add_weighted_edges_from((names[key >> ID_BITS], names[key & ID_MASK], weight)
+                                      for key, weight in self._edges.items())
+            return g
+        attribute_values = self._attribute_values.items()
+        g.add_edges_from((names[key >> ID_BITS], names[key & ID_MASK],
+                          {"weight": weight,
+                           **{name: stored[key] for name, stored in attribute_values if key in stored}})
+                         for key, weight in self._edges.items())
+        return g
+
+
+def _weighted_edge(edge):
+    """Normalize a ``(u, v)``, ``(u, v, weight)`` or ``(u, v, {"weight": weight})`` tuple to (u, v, weight)."""
+    weight = 1
+    if len(edge) > 2:
+        weight = edge[2].get('weight', 1) if isinstance(edge[2], dict) else edge[2]
+    return edge[0], edge[1], weight
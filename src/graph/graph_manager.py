@@ -1,26 +1,17 @@
-import networkx as nx
 from src.data.json_loader import load_graph_from_json
+from src.graph.graph_builder import GraphBuilder
 
 
 # Function to create a graph from a dictionary or list of edges
-def create_graph_from_data(data):
+def create_graph_from_data(data, attributes=()):
     """
     Create a graph from a dictionary or list of edges. The data format should be a list of tuples or a dictionary of
-    edges.
+    edges. The graph is built in one linear pass by `GraphBuilder`; nodes without edges are kept.
     :param data: List or dict representing the graph.
+    :param attributes: Names of edge attributes (e.g. "time", "toll") copied onto the edges besides the weight.
     :return: networkx.Graph object.
     """
-    g = nx.Graph()
-
-    if isinstance(data, list):  # A list of edges (tuples)
-        g.add_edges_from(data)
-    elif isinstance(data, dict):  # A dictionary with nodes as keys and edges as values
-        for node, edges in data.items():
-            for neighbor, weight in edges:
-                for edge in edges:
-                    g.add_edge(node, edge["node"], weight=edge["weight"])
-
-    return g
+    return GraphBuilder.from_data(data, attributes).to_networkx()
 
 
 # Function to load a graph from a JSON file
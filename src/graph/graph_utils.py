@@ -1,11 +1,18 @@
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import invalidate_distance_cache
+
+
 # Function to get all neighbors of a node
 def get_neighbors(g, node):
     """
     Get the neighbors of a node in the graph.
-    :param g: The graph (networkx.Graph).
+    :param g: The graph (networkx.Graph or CompactGraph).
     :param node: The node whose neighbors are to be returned.
     :return: List of neighbors of the node.
     """
+    if isinstance(g, CompactGraph):
+        node_id = g.node_index.get(node)
+        return [] if node_id is None else g.to_names(g.neighbors(node_id))
     if node in g:
         return list(g.neighbors(node))
     return []
@@ -15,9 +22,11 @@ def get_neighbors(g, node):
 def get_all_edges(g):
     """
     Get all edges of the graph with their weights.
-    :param g: The graph (networkx.Graph).
+    :param g: The graph (networkx.Graph or CompactGraph).
     :return: List of tuples (node1, node2, weight).
     """
+    if isinstance(g, CompactGraph):
+        return [(g.name(u), g.name(v), weight) for u in range(len(g)) for v, weight in g[u].items() if u <= v]
     return [(u, v, data['weight']) for u, v, data in g.edges(data=True)]
 
 
@@ -25,10 +34,12 @@ def get_all_edges(g):
 def node_exists(g, node):
     """
     Check if a node exists in the graph.
-    :param g: The graph (networkx.Graph).
+    :param g: The graph (networkx.Graph or CompactGraph).
     :param node: The node to check for existence.
     :return: True if the node exists, False otherwise.
     """
+    if isinstance(g, CompactGraph):
+        return node in g.node_index
     return node in g
 
 
@@ -36,11 +47,76 @@ def node_exists(g, node):
 def graph_to_dict(g):
     """
     Convert a networkx graph to a dictionary suitable for JSON storage.
-    :param g: The graph (networkx.Graph).
+    :param g: The graph (networkx.Graph or CompactGraph).
     :return: A dictionary representation of the graph.
     """
+    if isinstance(g, CompactGraph):
+        return {g.name(node_id): [(g.name(neighbor), weight) for neighbor, weight in g[node_id].items()]
+                for node_id in range(len(g))}
     graph_dict = {}
     for node in g.nodes:
         neighbors = [(neighbor, g[node][neighbor]['weight']) for neighbor in g.neighbors(node)]
         graph_dict[node] = neighbors
     return graph_dict
+
+
+# Function to change, remove or add edges in place
+def update_edges(g, changes):
+    """
+    Apply edge changes (e.g. road closures or new travel times) to the graph in place. The distance tables
+    cached on the graph for guided runs are dropped.
+    :param g: The graph (networkx.Graph or CompactGraph).
+    :param changes: Iterable of (node1, node2, weight) or (node1, node2, weight, attributes) tuples, where
+                    attributes is a dictionary {name: value} of further edge attributes (e.g. "time"). A weight
+                    of None removes the edge (nothing happens if it does not exist); an edge not in the graph is
+                    added and must give every attribute the graph carries. Both nodes must exist.
+    :return: Set of the (node1, node2) pairs, in both directions, whose weight or attributes changed or that
+             were removed or added.
+    """
+    changes = list(changes)
+    for u, v, *_ in changes:
+        if not node_exists(g, u) or not node_exists(g, v):
+            raise ValueError(f"Unknown node in edge ({u!r}, {v!r})")
+
+    if isinstance(g, CompactGraph):
+        stale = g.update_edges([(g.index(u), g.index(v), *rest) for u, v, *rest in changes])
+        stale = {(g.name(u), g.name(v)) for u, v in stale}
+    else:
+        _check_added_attributes(g, changes)
+        stale = set()
+        for u, v, weight, *attributes in changes:
+            attributes = attributes[0] if attributes else {}
+            if weight is None:
+                if g.has_edge(u, v):
+                    g.remove_edge(u, v)
+                    stale.update(((u, v), (v, u)))
+            elif not g.has_edge(u, v):
+                g.add_edge(u, v, weight=weight, **attributes)
+                stale.update(((u, v), (v, u)))
+            else:
+                data = g[u][v]
+                if data['weight'] != weight or any(data.get(name) != value for name, value in attributes.items()):
+                    data.update(attributes, weight=weight)
+                    stale.update(((u, v), (v, u)))
+    if changes:
+        invalidate_distance_cache(g)
+    return stale
+
+
+# Function to check the attributes of added edges before a networkx graph is changed
+def _check_added_attributes(g, changes):
+    """
+    Raise a ValueError, before anything is changed, if an edge added to a networkx graph misses an attribute
+    carried by its edges.
+    """
+    carried = None
+    present = {}
+    for u, v, weight, *attributes in changes:
+        key = frozenset((u, v))
+        if weight is not None and not present.get(key, g.has_edge(u, v)):
+            if carried is None:
+                carried = {name for _, _, data in g.edges(data=True) for name in data} - {'weight'}
+            missing = carried - set(attributes[0] if attributes else ())
+            if missing:
+                raise ValueError(f"Added edge ({u!r}, {v!r}) has no value for the edge attributes {sorted(missing)}")
+        present[key] = weight is not None
@@ -0,0 +1,59 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+from src.graph.compact_graph import CompactGraph
+
+SHARED_ARRAYS = ("offsets", "neighbor_ids", "weights")
+
+
+def share_compact_graph(graph):
+    """
+    Copy the CSR arrays (and the node positions, if any) of a compact graph into shared memory blocks.
+    :param graph: CompactGraph to share.
+    :return: A tuple containing two elements:
+             1. A small picklable spec that worker processes pass to `attach_compact_graph`.
+             2. The list of SharedMemory blocks, to be released with `release_shared_blocks` (unlink=True)
+                once every worker is done.
+    """
+    spec = {"node_names": list(graph.node_names), "arrays": {}}
+    blocks = []
+    names = SHARED_ARRAYS if graph.positions is None else SHARED_ARRAYS + ("positions",)
+    for name in names:
+        array = getattr(graph, name)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+        spec["arrays"][name] = (block.name, array.shape, array.dtype.str)
+        blocks.append(block)
+    return spec, blocks
+
+
+def attach_compact_graph(spec):
+    """
+    Rebuild a compact graph on top of shared memory blocks created by `share_compact_graph`.
+    The CSR arrays are not copied; only the per-node lookup rows are built in the calling process.
+    :param spec: Spec returned by `share_compact_graph`.
+    :return: A tuple (graph, blocks); the blocks must stay open while the graph is in use and be
+             released with `release_shared_blocks` (unlink=False) afterwards.
+    """
+    arrays = {}
+    blocks = []
+    for name in spec["arrays"]:
+        block_name, shape, dtype = spec["arrays"][name]
+        block = shared_memory.SharedMemory(name=block_name)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        blocks.append(block)
+    graph = CompactGraph(spec["node_names"], arrays["offsets"], arrays["neighbor_ids"], arrays["weights"],
+                         arrays.get("positions"))
+    return graph, blocks
+
+
+def release_shared_blocks(blocks, unlink=False):
+    """
+    Close shared memory blocks and optionally destroy them.
+    :param blocks: SharedMemory blocks returned by `share_compact_graph` or `attach_compact_graph`.
+    :param unlink: True in the process that created the blocks, to free the memory.
+    """
+    for block in blocks:
+        block.close()
+        if unlink:
+            block.unlink()
@@ -0,0 +1,138 @@
+import heapq
+import math
+
+from src.graph.goal_distances import weighted_neighbors
+
+
+def _trace(predecessors, node):
+    """Walk the predecessor links back from node and return the path from the search source."""
+    path = []
+    while node is not None:
+        path.append(node)
+        node = predecessors[node]
+    path.reverse()
+    return path
+
+
+def _edge_weight(graph, u, v):
+    weight = graph[u][v]
+    return weight['weight'] if isinstance(weight, dict) else weight
+
+
+def astar_path(graph, source, target, heuristic=None, blocked_nodes=(), blocked_edges=()):
+    """
+    Shortest path by A* search, stopping as soon as target is settled. Without a heuristic this is
+    Dijkstra's algorithm.
+    :param graph: networkx.Graph or CompactGraph.
+    :param source: Start node (a name, or an integer id on a CompactGraph).
+    :param target: End node.
+    :param heuristic: Optional callable giving a lower bound of the distance from a node to target; it must
+                      be consistent (see `straight_line_heuristic`) for the result to be exact.
+    :param blocked_nodes: Nodes the path may not enter.
+    :param blocked_edges: Directed (u, v) edges the path may not use.
+    :return: A tuple (path, distance), or (None, inf) if target cannot be reached.
+    """
+    distances = {source: 0}
+    predecessors = {source: None}
+    heap = [(heuristic(source) if heuristic else 0, 0, 0, source)]
+    counter = 1  # Tie breaker so nodes themselves are never compared
+    while heap:
+        _, _, distance, node = heapq.heappop(heap)
+        if node == target:
+            return _trace(predecessors, node), distance
+        if distance > distances[node]:
+            continue
+        for neighbor, weight in weighted_neighbors(graph, node):
+            if neighbor in blocked_nodes or (node, neighbor) in blocked_edges:
+                continue
+            candidate = distance + weight
+            if candidate < distances.get(neighbor, math.inf):
+                distances[neighbor] = candidate
+                predecessors[neighbor] = node
+                priority = candidate + heuristic(neighbor) if heuristic else candidate
+                heapq.heappush(heap, (priority, counter, candidate, neighbor))
+                counter += 1
+    return None, math.inf
+
+
+def dijkstra_path(graph, source, target, blocked_nodes=(), blocked_edges=()):
+    """Shortest path by Dijkstra's algorithm, see `astar_path`."""
+    return astar_path(graph, source, target, None, blocked_nodes, blocked_edges)
+
+
+def bidirectional_dijkstra_path(graph, source, target):
+    """
+    Shortest path by two Dijkstra searches, from source and from target (edges are undirected), that stop
+    once the smallest tentative distances of both frontiers add up to the best connection found. On road
+    networks each search only covers about a disk of half the radius of a one-sided search.
+    :param graph: networkx.Graph or CompactGraph.
+    :return: A tuple (path, distance), or (None, inf) if target cannot be reached.
+    """
+    if source == target:
+        return [source], 0
+    distances = ({source: 0}, {target: 0})
+    predecessors = ({source: None}, {target: None})
+    heaps = ([(0, 0, source)], [(0, 1, target)])
+    counter = 2
+    best, meeting = math.inf, None
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1  # Expand the frontier that is behind
+        distance, _, node = heapq.heappop(heaps[side])
+        if distance > distances[side][node]:
+            continue
+        own, other = distances[side], distances[1 - side]
+        for neighbor, weight in weighted_neighbors(graph, node):
+            candidate = distance + weight
+            if candidate < own.get(neighbor, math.inf):
+                own[neighbor] = candidate
+                predecessors[side][neighbor] = node
+                heapq.heappush(heaps[side], (candidate, counter, neighbor))
+                counter += 1
+            if neighbor in other and candidate + other[neighbor] < best:
+                best = candidate + other[neighbor]
+                meeting = (node, neighbor) if side == 0 else (neighbor, node)
+    if meeting is None:
+        return None, math.inf
+    # The meeting edge joins a node reached from source to a node reached from target
+    forward = _trace(predecessors[0], meeting[0])
+    backward = _trace(predecessors[1], meeting[1])
+    return forward + backward[::-1], best
+
+
+def k_shortest_paths(graph, source, target, k):
+    """
+    The k shortest simple paths from source to target, by Yen's algorithm: every next path deviates from
+    a previous one at some spur node, with the edges already taken from there blocked.
+    :param graph: networkx.Graph or CompactGraph.
+    :param k: Maximum number of paths.
+    :return: List of (path, distance) tuples by increasing distance (fewer than k if there are no more).
+    """
+    path, distance = dijkstra_path(graph, source, target)
+    if path is None or k <= 0:
+        return []
+    found = [(path, distance)]
+    seen = {tuple(path)}
+    candidates = []
+    counter = 0
+    while len(found) < k:
+        last_path, _ = found[-1]
+        root_distance = 0
+        for i in range(len(last_path) - 1):
+            spur_node, root = last_path[i], last_path[:i + 1]
+            # Paths already found share the root, so they end at target past the spur node
+            blocked_edges = {(known[i], known[i + 1]) for known, _ in found if known[:i + 1] == root}
+            spur_path, spur_distance = dijkstra_path(graph, spur_node, target, set(root[:-1]), blocked_edges)
+            if spur_path is not None:
+                candidate = root[:-1] + spur_path
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (root_distance + spur_distance, counter, candidate))
+                    counter += 1
+            root_distance += _edge_weight(graph, last_path[i], last_path[i + 1])
+        if not candidates:
+            break
+        distance, _, path = heapq.heappop(candidates)
+        found.append((path, distance))
+    return found
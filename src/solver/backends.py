@@ -0,0 +1,61 @@
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.graph.goal_distances import distance_cache_for, straight_line_heuristic
+from src.graph.shortest_paths import astar_path, bidirectional_dijkstra_path, dijkstra_path, k_shortest_paths
+
+BACKENDS = ("ga", "dijkstra", "bidirectional", "astar", "hybrid")
+EXACT_BACKENDS = ("dijkstra", "bidirectional", "astar")
+
+# Number of shortest paths seeded into the initial population of the hybrid backend
+HYBRID_PATHS = 5
+
+
+def exact_path(graph, start_id, end_id, backend):
+    """
+    Shortest path with one of the EXACT_BACKENDS on a CompactGraph.
+    A* uses the node positions of the graph as a straight-line heuristic; without positions it searches
+    like Dijkstra.
+    :return: A tuple (path of ids, distance), or (None, inf) if end_id cannot be reached.
+    """
+    if backend == "dijkstra":
+        return dijkstra_path(graph, start_id, end_id)
+    if backend == "bidirectional":
+        return bidirectional_dijkstra_path(graph, start_id, end_id)
+    if backend == "astar":
+        scale = distance_cache_for(graph).straight_line_scale()
+        return astar_path(graph, start_id, end_id, straight_line_heuristic(graph, end_id, scale))
+    raise ValueError(f"Unknown exact backend {backend!r}, expected one of {EXACT_BACKENDS}")
+
+
+def solve_route(graph, start_node, end_node, backend="ga", generations=100, population_size=50, seed=None,
+                ga_options=None, hybrid_paths=HYBRID_PATHS):
+    """
+    Solve one origin/destination query with any of the BACKENDS.
+
+    "ga" is the plain genetic algorithm. "dijkstra", "bidirectional" and "astar" are exact searches.
+    "hybrid" runs the genetic algorithm on an initial population seeded with the `hybrid_paths` shortest
+    paths, which keeps near-optimal alternatives in the population instead of starting from random walks,
+    and returns the shorter of its result and the shortest seeded path, so it is never worse than "dijkstra".
+    :param graph: CompactGraph.
+    :param seed: Optional seed of the genetic algorithm backends.
+    :param ga_options: Extra keyword arguments for GeneticAlgorithm.
+    :return: A tuple (path of node names, distance) like `GeneticAlgorithm.run`; the exact backends return
+             (None, inf) when end_node cannot be reached.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    if backend in EXACT_BACKENDS:
+        path, distance = exact_path(graph, graph.index(start_node), graph.index(end_node), backend)
+        return (None if path is None else graph.to_names(path)), distance
+
+    ga_options = dict(ga_options or {})
+    paths = []
+    if backend == "hybrid":
+        paths = k_shortest_paths(graph, graph.index(start_node), graph.index(end_node), hybrid_paths)
+        ga_options["initial_paths"] = [graph.to_names(path) for path, _ in paths]
+        ga_options["elitism"] = max(ga_options.get("elitism", 0), 1)
+    ga = GeneticAlgorithm(graph, start_node, end_node, generations=generations, population_size=population_size,
+                          seed=seed, **ga_options)
+    path, distance = ga.run()
+    if paths and paths[0][1] < distance:
+        return graph.to_names(paths[0][0]), paths[0][1]
+    return path, distance
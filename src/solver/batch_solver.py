@@ -0,0 +1,144 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.data.json_loader import load_graph_from_json
+from src.graph.compact_graph import CompactGraph
+from src.graph.shared_graph import attach_compact_graph, release_shared_blocks, share_compact_graph
+from src.solver.backends import BACKENDS, solve_route
+
+# Graph attached by each pool worker in `_init_worker`, reused by every query the worker solves
+_worker_graph = None
+_worker_blocks = None
+
+
+def query_seed(seed, start_node, end_node):
+    """
+    Seed for one query, derived from the solver seed and the query itself so that the result of a
+    query does not depend on its position in a batch or on the worker that solves it.
+    """
+    return None if seed is None else f"{seed}:{start_node}:{end_node}"
+
+
+def solve_query(graph, start_node, end_node, generations, population_size, seed=None, ga_options=None,
+                backend="ga"):
+    """
+    Solve a single origin/destination query on an already indexed graph.
+    :param graph: CompactGraph shared by all queries.
+    :param seed: Optional query seed, see `query_seed`. The query gets its own generator, so queries can be
+                 solved concurrently in threads or processes without sharing random state.
+    :param ga_options: Extra keyword arguments for GeneticAlgorithm (e.g. batch_fitness).
+    :param backend: One of BACKENDS, see `solve_route`. Default is the genetic algorithm.
+    :return: A tuple (best_path, best_distance) as returned by `GeneticAlgorithm.run`.
+    """
+    return solve_route(graph, start_node, end_node, backend, generations, population_size, seed, ga_options)
+
+
+def _init_worker(spec):
+    """Pool worker initializer: attach the shared graph once for the lifetime of the worker."""
+    global _worker_graph, _worker_blocks
+    _worker_graph, _worker_blocks = attach_compact_graph(spec)
+
+
+def _solve_in_worker(query):
+    return solve_query(_worker_graph, *query)
+
+
+class BatchSolver:
+    """
+    Solve many origin/destination queries over the same graph.
+
+    The graph is loaded and indexed into a CompactGraph once. Batches of queries are spread over a pool
+    of worker processes that attach the graph through shared memory when they start, so neither the
+    graph construction nor the graph transfer is paid per query.
+    """
+
+    def __init__(self, graph, generations=100, population_size=50, workers=None, seed=None, backend="ga",
+                 **ga_options):
+        """
+        :param graph: Graph data as returned by `load_graph_from_json`, or a prebuilt CompactGraph.
+        :param generations: Generations per query.
+        :param population_size: Population size per query.
+        :param workers: Number of worker processes, by default the number of CPUs. With 1 (or 0) queries
+                        are solved in the calling process.
+        :param seed: Optional seed making every query reproducible, see `query_seed`.
+        :param backend: Solver backend of every query, one of BACKENDS (see `solve_route`).
+        :param ga_options: Extra keyword arguments for GeneticAlgorithm (e.g. batch_fitness=True).
+        """
+        self.graph = graph if isinstance(graph, CompactGraph) else CompactGraph.from_data(graph)
+        self.generations = generations
+        self.population_size = population_size
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.seed = seed
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        self.backend = backend
+        self.ga_options = ga_options
+        self._executor = None
+        self._blocks = None
+
+    @classmethod
+    def from_json(cls, file_path, **kwargs):
+        """
+        Create a solver from a graph JSON file.
+        :param file_path: Path to the JSON file.
+        :param kwargs: Keyword arguments for BatchSolver.
+        :return: BatchSolver object.
+        """
+        graph, _ = load_graph_from_json(file_path)
+        return cls(graph, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool and free the shared graph."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._blocks is not None:
+            release_shared_blocks(self._blocks, unlink=True)
+            self._blocks = None
+
+    def _pool(self):
+        """Start the worker pool on first use."""
+        if self._executor is None:
+            spec, self._blocks = share_compact_graph(self.graph)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(spec,))
+        return self._executor
+
+    def validate(self, queries):
+        """Raise ValueError if any query refers to a node missing from the graph."""
+        unknown = sorted({node for query in queries for node in query[:2] if node not in self.graph.node_index},
+                         key=str)
+        if unknown:
+            raise ValueError(f"Unknown nodes in queries: {unknown}")
+
+    def solve(self, start_node, end_node):
+        """
+        Solve one query in the calling process.
+        :return: A tuple (best_path, best_distance).
+        """
+        self.validate([(start_node, end_node)])
+        return solve_query(self.graph, start_node, end_node, self.generations, self.population_size,
+                           query_seed(self.seed, start_node, end_node), self.ga_options, self.backend)
+
+    def solve_batch(self, queries):
+        """
+        Solve a batch of queries, concurrently when the solver has more than one worker.
+        :param queries: Iterable of (start_node, end_node) pairs.
+        :return: List of (best_path, best_distance) tuples, in the order of the queries.
+        """
+        queries = list(queries)
+        self.validate(queries)
+        tasks = [(start_node, end_node, self.generations, self.population_size,
+                  query_seed(self.seed, start_node, end_node), self.ga_options, self.backend)
+                 for start_node, end_node in queries]
+        if self.workers <= 1:
+            return [solve_query(self.graph, *task) for task in tasks]
+
+        chunksize = max(1, len(tasks) // (self.workers * 4))
+        return list(self._pool().map(_solve_in_worker, tasks, chunksize=chunksize))
@@ -0,0 +1,387 @@
+import asyncio
+import json
+import math
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+
+from src.data.binary_graph import BINARY_EXTENSION, load_graph_from_binary
+from src.data.json_loader import load_graph_from_json
+from src.graph.compact_graph import CompactGraph
+from src.graph.shared_graph import attach_compact_graph, release_shared_blocks, share_compact_graph
+from src.solver.backends import BACKENDS
+from src.solver.batch_solver import query_seed, solve_query
+
+MAX_BODY_SIZE = 1 << 20
+
+# Graphs attached by each pool worker in `_init_service_worker`, by graph name
+_worker_graphs = {}
+_worker_blocks = []
+
+
+def _init_service_worker(specs):
+    """Pool worker initializer: attach every shared graph once for the lifetime of the worker."""
+    for name, spec in specs.items():
+        graph, blocks = attach_compact_graph(spec)
+        _worker_graphs[name] = graph
+        _worker_blocks.extend(blocks)
+
+
+def _service_worker_ready():
+    return os.getpid()
+
+
+def _solve_in_service_worker(graph_name, *query):
+    return solve_query(_worker_graphs[graph_name], *query)
+
+
+def load_graph_file(file_path):
+    """Load a JSON or binary (``.graphbin``) graph file into a CompactGraph."""
+    if file_path.endswith(BINARY_EXTENSION):
+        return load_graph_from_binary(file_path)
+    graph_data, positions = load_graph_from_json(file_path)
+    return CompactGraph.from_data(graph_data, positions)
+
+
+def _is_scalar(value):
+    """Whether a decoded JSON value can name a graph or a node (a string or a number, not a boolean)."""
+    return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+
+class HttpError(Exception):
+    """Error answered to the client with an HTTP status code."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ServiceMetrics:
+    """Request counters and a window of recent route latencies."""
+
+    def __init__(self, window=10000):
+        self.started = time.perf_counter()
+        self.statuses = Counter()
+        self.latencies = deque(maxlen=window)
+        self.in_flight = 0
+        self.queued = 0
+
+    def record(self, status, latency=None):
+        self.statuses[int(status)] += 1
+        if latency is not None:
+            self.latencies.append(latency)
+
+    def snapshot(self):
+        """Counters, throughput since start and latency percentiles (seconds) of the recent window."""
+        uptime = time.perf_counter() - self.started
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            return latencies[min(int(fraction * len(latencies)), len(latencies) - 1)] if latencies else None
+
+        completed = self.statuses[HTTPStatus.OK]
+        return {
+            "uptime": uptime,
+            "requests": sum(self.statuses.values()),
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "routes_per_second": completed / uptime if uptime > 0 else 0.0,
+            "latency": {"p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99),
+                        "max": latencies[-1] if latencies else None},
+        }
+
+
+class RoutingService:
+    """
+    Long-lived HTTP/JSON routing service on asyncio (standard library only).
+
+    Graphs are loaded and indexed once at start-up and shared with a pool of worker processes through
+    shared memory, so a request only pays for its own solve. The event loop never
+    solves: routes run in the pool, at most `max_concurrency` at a time with up to `max_queue` more
+    waiting (further requests get 503). Every request has a deadline: the solve is given the remaining
+    time as its time budget, and the client gets 504 if the result is not back in time.
+
+    Endpoints:
+      - POST /route with {"graph", "start", "end"} and optional {"backend", "generations",
+        "population_size", "seed", "deadline"}: returns {"path", "distance", "reached", "backend", "elapsed"}.
+      - GET /graphs, GET /metrics, GET /health.
+    """
+
+    def __init__(self, graphs, workers=None, max_concurrency=None, max_queue=64, default_deadline=30.0,
+                 generations=100, population_size=50, max_generations=5000, max_population_size=5000,
+                 backend="ga", **ga_options):
+        """
+        :param graphs: Dictionary {name: CompactGraph or graph data}.
+        :param workers: Number of worker processes, by default the number of CPUs. With 0 routes are
+                        solved in threads of this process (for tests and tiny graphs).
+        :param max_concurrency: Maximum number of routes solved at once, by default the number of workers.
+        :param max_queue: Maximum number of routes waiting for a free slot.
+        :param default_deadline: Seconds allowed per request when it does not set its own deadline.
+        :param generations: Default generations per route.
+        :param population_size: Default population size per route.
+        :param max_generations: Largest number of generations a request may ask for.
+        :param max_population_size: Largest population size a request may ask for.
+        :param backend: Default solver backend, one of BACKENDS (see `solve_route`).
+        :param ga_options: Extra keyword arguments for GeneticAlgorithm (e.g. guided=True).
+        """
+        self.graphs = {name: graph if isinstance(graph, CompactGraph) else CompactGraph.from_data(graph)
+                       for name, graph in graphs.items()}
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_concurrency = max_concurrency or max(self.workers, 1)
+        self.max_queue = max_queue
+        self.default_deadline = default_deadline
+        self.generations = generations
+        self.population_size = population_size
+        self.max_generations = max_generations
+        self.max_population_size = max_population_size
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        self.backend = backend
+        self.ga_options = ga_options
+        self.metrics = ServiceMetrics()
+        self._slots = None
+        self._executor = None
+        self._blocks = []
+        self._server = None
+        self._connections = {}
+
+    @classmethod
+    def from_files(cls, graph_files, **kwargs):
+        """
+        Create a service from graph files.
+        :param graph_files: Dictionary {name: path to a JSON or binary graph file}.
+        :param kwargs: Keyword arguments for RoutingService.
+        """
+        return cls({name: load_graph_file(path) for name, path in graph_files.items()}, **kwargs)
+
+    async def start(self, host="127.0.0.1", port=8080):
+        """
+        Start the worker pool and listen for connections.
+        :return: The asyncio server (its ``sockets`` give the bound port when port is 0).
+        """
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        if self.workers > 0:
+            specs = {}
+            for name, graph in self.graphs.items():
+                specs[name], blocks = share_compact_graph(graph)
+                self._blocks.extend(blocks)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_service_worker,
+                                                 initargs=(specs,))
+            # Start the workers before listening: processes forked later would inherit the sockets of
+            # open connections and keep them alive after the service closes them
+            await asyncio.get_running_loop().run_in_executor(self._executor, _service_worker_ready)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def close(self):
+        """
+        Stop listening, close the idle connections, let the routes in progress finish (they are bounded by
+        their deadlines), then shut down the pool and free the shared graphs.
+        """
+        if self._server is not None:
+            self._server.close()
+            # Closing the transports ends the handlers waiting for a next request with an end of stream
+            for writer in self._connections.values():
+                writer.transport.close()
+            if self._connections:
+                await asyncio.wait(list(self._connections))
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        release_shared_blocks(self._blocks, unlink=True)
+        self._blocks = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        await self.close()
+
+    def _parse_route(self, payload):
+        """Validate a route request and return the solve arguments."""
+        if not isinstance(payload, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Expected a JSON object")
+        if not _is_scalar(payload.get("graph")) or payload.get("graph") not in self.graphs:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown graph {payload.get('graph')!r}")
+        graph = self.graphs[payload["graph"]]
+        start_node, end_node = payload.get("start"), payload.get("end")
+        if not (_is_scalar(start_node) and _is_scalar(end_node)):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "start and end must be node names")
+        unknown = [node for node in (start_node, end_node) if node not in graph.node_index]
+        if unknown:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Unknown nodes: {unknown}")
+        try:
+            generations = int(payload.get("generations", self.generations))
+            population_size = int(payload.get("population_size", self.population_size))
+            deadline = float(payload.get("deadline", self.default_deadline))
+        except (TypeError, ValueError):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "generations, population_size and deadline must be numbers")
+        if not (0 <= generations <= self.max_generations and 2 <= population_size <= self.max_population_size
+                and deadline > 0):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "generations, population_size or deadline out of range")
+        backend = payload.get("backend", self.backend)
+        if backend not in BACKENDS:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Unknown backend {backend!r}, expected one of {list(BACKENDS)}")
+        seed = payload.get("seed")
+        if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "seed must be an integer")
+        return payload["graph"], start_node, end_node, backend, generations, population_size, seed, deadline
+
+    async def route(self, payload):
+        """
+        Solve a route request.
+        :param payload: Decoded JSON request body.
+        :return: Response dictionary; raises HttpError on invalid requests, overload or deadline expiry.
+        """
+        (graph_name, start_node, end_node, backend, generations, population_size, seed,
+         deadline) = self._parse_route(payload)
+        started = time.perf_counter()
+        if self._slots.locked() and self.metrics.queued >= self.max_queue:
+            raise HttpError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many pending routes")
+
+        loop = asyncio.get_running_loop()
+        self.metrics.queued += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), deadline)
+        except asyncio.TimeoutError:
+            raise HttpError(HTTPStatus.GATEWAY_TIMEOUT, "Deadline expired while queued")
+        finally:
+            self.metrics.queued -= 1
+
+        self.metrics.in_flight += 1
+        try:
+            remaining = deadline - (time.perf_counter() - started)
+            # The solve stops starting generations when its budget is spent, so the worker is freed
+            # soon after the deadline even though a running process cannot be interrupted
+            ga_options = dict(self.ga_options, time_budget=remaining)
+            query = (start_node, end_node, generations, population_size, query_seed(seed, start_node, end_node),
+                     ga_options, backend)
+            if self.workers > 0:
+                future = loop.run_in_executor(self._executor, _solve_in_service_worker, graph_name, *query)
+            else:
+                future = loop.run_in_executor(self._executor, solve_query, self.graphs[graph_name], *query)
+        except BaseException:
+            self.metrics.in_flight -= 1
+            self._slots.release()
+            raise
+        # The slot is only freed when the solve is over, not when its request gives up on it: a route
+        # still running after a 504 keeps counting against max_concurrency
+        future.add_done_callback(self._finish_route)
+        try:
+            path, distance = await asyncio.wait_for(asyncio.shield(future), remaining)
+        except asyncio.TimeoutError:
+            raise HttpError(HTTPStatus.GATEWAY_TIMEOUT, "Deadline expired")
+        reached = path is not None and path[-1] == end_node
+        return {"path": path, "distance": distance if reached and math.isfinite(distance) else None,
+                "reached": reached, "backend": backend, "elapsed": time.perf_counter() - started}
+
+    def _finish_route(self, future):
+        """Free the slot of a route once its solve is over, whether or not its request still waits for it."""
+        self.metrics.in_flight -= 1
+        self._slots.release()
+        if not future.cancelled():
+            future.exception()  # Retrieved, so a solve failing after its request timed out is not logged as lost
+
+    async def dispatch(self, method, target, body):
+        """
+        Route an HTTP request to its handler.
+        :return: A tuple (status, response dictionary).
+        """
+        path = target.split("?", 1)[0]
+        if path == "/route":
+            if method != "POST":
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST")
+            try:
+                payload = json.loads(body or b"null")
+            except ValueError:
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid JSON")
+            return HTTPStatus.OK, await self.route(payload)
+        if method != "GET":
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET")
+        if path == "/metrics":
+            return HTTPStatus.OK, self.metrics.snapshot()
+        if path == "/graphs":
+            return HTTPStatus.OK, {name: {"nodes": graph.number_of_nodes(), "edges": graph.number_of_edges()}
+                                   for name, graph in self.graphs.items()}
+        if path == "/health":
+            return HTTPStatus.OK, {"status": "ok"}
+        raise HttpError(HTTPStatus.NOT_FOUND, f"No endpoint {path}")
+
+    async def _handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection (keep-alive) until the client closes it."""
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HttpError as error:
+                    # Without a valid length (or with a body too large to read) the body cannot be skipped:
+                    # answer, then close the connection
+                    self.metrics.record(error.status)
+                    await self._write_response(writer, error.status, {"error": error.message}, False)
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                started = time.perf_counter()
+                try:
+                    status, response = await self.dispatch(method, target, body)
+                except HttpError as error:
+                    status, response = error.status, {"error": error.message}
+                except Exception as error:  # e.g. a crashed worker pool: answer instead of dropping the connection
+                    status, response = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(error).__name__}: {error}"}
+                self.metrics.record(status, time.perf_counter() - started if target.startswith("/route") else None)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._write_response(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Client went away or the service is closing
+        finally:
+            del self._connections[task]
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader):
+        """Read one request; returns None when the connection is closed before a request starts."""
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        try:
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise ConnectionError("Malformed request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0) or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length > MAX_BODY_SIZE:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Request body larger than {MAX_BODY_SIZE} bytes")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    @staticmethod
+    async def _write_response(writer, status, response, keep_alive):
+        body = json.dumps(response).encode("utf-8")
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+from src.data.json_loader import load_graph_from_json
+from src.genetic_algorithm.fitness_cache import BoundedCache
+from src.graph.compact_graph import CompactGraph
+from src.solver.batch_solver import query_seed, solve_query
+
+
+def file_content_hash(file_path):
+    """
+    Content hash of a file, used as the graph version in cache keys.
+    :param file_path: Path to the graph file.
+    :return: Hex SHA-256 digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _qualified_name(value):
+    """
+    Name of a module-level function or class for `options_key`, e.g. "src.selection.tournament".
+    Raises TypeError for any other value: lambdas, local functions, partials and other objects have no name
+    that identifies them across processes (their repr holds a memory address).
+    """
+    module, qualname = getattr(value, "__module__", None), getattr(value, "__qualname__", None)
+    if not callable(value) or module is None or qualname is None or "<" in qualname:
+        raise TypeError(f"{value!r} has no stable name")
+    return f"{module}.{qualname}"
+
+
+def options_key(ga_options):
+    """
+    Canonical form of GeneticAlgorithm options for cache keys: a JSON string with sorted keys, so it is the
+    same whatever the order of the options and survives the cache file. Module-level callables (e.g. a
+    selection scheme) are written with their qualified name.
+    :return: The key, or None if an option has no stable representation, in which case nothing is cached.
+    """
+    try:
+        return json.dumps(ga_options, sort_keys=True, default=_qualified_name)
+    except TypeError:
+        return None
+
+
+class RouteCache(BoundedCache):
+    """
+    Bounded least-recently-used cache of solved routes with hit/miss counters.
+
+    Keys are tuples of JSON-compatible values and values are (path, distance) tuples. When a file path
+    is given, the cache is loaded from it on creation and written back by `save`.
+    """
+
+    def __init__(self, max_size=1024, path=None):
+        """
+        :param max_size: Maximum number of routes kept; the least recently used one is evicted first.
+        :param path: Optional JSON file used to persist the cache between process restarts.
+        """
+        super().__init__(max_size)
+        self.path = path
+        self.entries = OrderedDict()
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def get(self, key):
+        """Return the cached value for key, or None, updating the counters and the LRU order."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries beyond max_size."""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (the counters are kept)."""
+        self.entries.clear()
+
+    def save(self):
+        """Write the entries, in LRU order, to the cache file."""
+        if self.path is None:
+            return
+        data = [[list(key), [value[0], value[1]]] for key, value in self.entries.items()]
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(temporary_path, self.path)
+
+    def load(self):
+        """Read the entries back from the cache file, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, (path, distance) in data:
+            self.put(tuple(key), (path, distance))
+
+
+class CachedRouteSolver:
+    """
+    Route solver for a graph file with a RouteCache in front of `GeneticAlgorithm.run`.
+
+    Cache keys are (graph hash, start, end, generations, population size, seed, GA options), so a changed
+    graph never serves stale routes and solvers with different options sharing a cache file never serve each
+    other's routes. Before each query the file is checked (a cheap stat, then a rehash only if its size or
+    modification time changed); when its content changed the graph is reloaded and the routes of the old
+    version are dropped. Queries without a seed, or with a time_budget option whose result depends on the
+    machine's speed, are not reproducible and are never cached; neither are queries with an option that has
+    no stable key, like a lambda (see `options_key`).
+    """
+
+    def __init__(self, graph_file, cache=None, **ga_options):
+        """
+        :param graph_file: Path to the graph JSON file.
+        :param cache: RouteCache to use, by default an in-memory cache of 1024 routes.
+        :param ga_options: Extra keyword arguments for GeneticAlgorithm (e.g. batch_fitness=True).
+        """
+        self.graph_file = graph_file
+        self.cache = cache if cache is not None else RouteCache()
+        self.ga_options = ga_options
+        self.options_key = options_key(ga_options)
+        self.invalidations = 0
+        self.graph = None
+        self.graph_hash = None
+        self._file_stat = None
+        self.refresh()
+
+    def refresh(self):
+        """
+        Reload the graph if the file content changed since it was last loaded.
+        :return: True if the graph was (re)loaded.
+        """
+        stat = os.stat(self.graph_file)
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+        if file_stat == self._file_stat:
+            return False
+        self._file_stat = file_stat
+
+        graph_hash = file_content_hash(self.graph_file)
+        if graph_hash == self.graph_hash:
+            return False
+        if self.graph_hash is not None:
+            self.invalidations += 1
+        graph_data, _ = load_graph_from_json(self.graph_file)
+        self.graph = CompactGraph.from_data(graph_data)
+        self.graph_hash = graph_hash
+        # Routes of any other graph version (including ones loaded from disk) can never be served again
+        self.cache.discard_where(lambda key: key[0] != graph_hash)
+        return True
+
+    def solve(self, start_node, end_node, generations=100, population_size=50, seed=None):
+        """
+        Solve a query, serving it from the cache when an identical seeded query was solved before.
+        :return: A tuple (best_path, best_distance).
+        """
+        self.refresh()
+        if seed is None or self.ga_options.get("time_budget") is not None or self.options_key is None:
+            return solve_query(self.graph, start_node, end_node, generations, population_size,
+                               None if seed is None else query_seed(seed, start_node, end_node), self.ga_options)
+
+        key = (self.graph_hash, start_node, end_node, generations, population_size, seed, self.options_key)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return list(cached[0]), cached[1]
+        result = solve_query(self.graph, start_node, end_node, generations, population_size,
+                             query_seed(seed, start_node, end_node), self.ga_options)
+        self.cache.put(key, (list(result[0]), result[1]))
+        return result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        """Persist the cache, if it has a file."""
+        self.cache.save()
+
+    def stats(self):
+        """Cache counters plus the number of graph invalidations."""
+        return dict(self.cache.stats(), invalidations=self.invalidations)
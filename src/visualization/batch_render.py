@@ -0,0 +1,173 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.graph.compact_graph import CompactGraph
+from src.visualization.visualization import _figure, _networkx_graph, graph_layout
+
+# Graphs up to this many nodes are drawn with node and edge labels, like `visualize_path`
+LABEL_MAX_NODES = 100
+IMAGE_FORMATS = ("png", "svg")
+
+# Renderer rebuilt by each pool worker in `_init_worker`, reused by every route the worker draws
+_worker_renderer = None
+
+
+def load_layout(file_path):
+    """Read a layout saved by `save_layout` (or the positions of a graph JSON file), None if there is no file."""
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path, 'r') as f:
+        return {node: tuple(position) for node, position in json.load(f).items()}
+
+
+def save_layout(layout, file_path):
+    """Save a layout as a JSON dictionary {node: [x, y]}, the format of the positions of a graph file."""
+    with open(file_path, 'w') as f:
+        json.dump({node: list(position) for node, position in layout.items()}, f)
+
+
+class RouteRenderer:
+    """
+    Headless renderer of many routes over the same graph.
+
+    The layout is computed once (see `graph_layout`) and the static map, nodes, edges and labels, is drawn once
+    and kept as an RGBA raster. Every route is then a red line overlay on a reusable Agg figure whose
+    background is that raster, so its cost does not depend on the size of the graph. The state of a renderer
+    is only NumPy arrays and dictionaries: `render_routes` ships it once to each worker process instead of
+    drawing the map again per worker.
+
+    Since the map is a raster, an SVG image is not a full vector drawing: the map is embedded in it as a PNG
+    image at the renderer's dpi, and only the route line and the title are vectors.
+    """
+
+    def __init__(self, graph, positions=None, figsize=(8, 6), dpi=100, labels=None, seed=0, layout_file=None):
+        """
+        :param graph: Graph data as returned by `load_graph_from_json`, a networkx.Graph or a CompactGraph.
+        :param positions: Optional dictionary {node: (x, y)}; the other nodes get a seeded spring layout.
+        :param figsize: Size of the images in inches.
+        :param dpi: Resolution of the images.
+        :param labels: Draw node names and edge weights; by default only for graphs of at most LABEL_MAX_NODES
+                       nodes.
+        :param seed: Seed of the spring layout.
+        :param layout_file: Optional JSON file caching the layout across runs: read when it exists, and written
+                            when nodes had to be laid out.
+        """
+        g = _networkx_graph(graph.to_data() if isinstance(graph, CompactGraph) else graph)
+        cached = load_layout(layout_file) if layout_file is not None else None
+        self.layout = graph_layout(g, {**(cached or {}), **(positions or {})}, seed)
+        if layout_file is not None and (cached is None or cached.keys() != self.layout.keys()):
+            save_layout(self.layout, layout_file)
+        self.figsize = figsize
+        self.dpi = dpi
+        self.labels = g.number_of_nodes() <= LABEL_MAX_NODES if labels is None else labels
+        self.background, self.axes_box, self.limits = self.draw_base(g)
+        self._overlay = None
+
+    def draw_base(self, g):
+        """
+        Draw the static map once, with the style of `visualize_path`.
+        :return: A tuple (RGBA array of the image, axes box in figure coordinates, (xlim, ylim)).
+        """
+        import networkx as nx
+
+        figure = _figure(self.figsize, self.dpi)
+        ax = figure.add_subplot()
+        nx.draw(g, self.layout, ax=ax, with_labels=self.labels, node_size=500 if self.labels else 10,
+                node_color='lightblue', font_size=10, font_weight='bold', edge_color='gray')
+        if self.labels:
+            edge_labels = {(node1, node2): f'{weight} km'
+                           for node1, node2, weight in g.edges(data='weight', default=1)}
+            nx.draw_networkx_edge_labels(g, self.layout, edge_labels=edge_labels, font_size=8, ax=ax)
+        figure.canvas.draw()
+        background = np.asarray(figure.canvas.buffer_rgba()).copy()
+        return background, ax.get_position().bounds, (ax.get_xlim(), ax.get_ylim())
+
+    def state(self):
+        """Everything needed to render routes, see `from_state`."""
+        return {"layout": self.layout, "figsize": self.figsize, "dpi": self.dpi, "labels": self.labels,
+                "background": self.background, "axes_box": self.axes_box, "limits": self.limits}
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild a renderer from its `state` without the graph, e.g. in a worker process."""
+        renderer = cls.__new__(cls)
+        for name, value in state.items():
+            setattr(renderer, name, value)
+        renderer._overlay = None
+        return renderer
+
+    def _overlay_figure(self):
+        """
+        The reusable figure: the raster map (embedded as a PNG image in SVG output), and on top the route line
+        and the title as vectors.
+        """
+        if self._overlay is None:
+            from matplotlib.collections import LineCollection
+
+            figure = _figure(self.figsize, self.dpi)
+            figure.figimage(self.background, zorder=-1)
+            ax = figure.add_axes(self.axes_box)
+            ax.set_xlim(self.limits[0])
+            ax.set_ylim(self.limits[1])
+            ax.set_axis_off()
+            line = LineCollection([], colors='red', linewidths=2)
+            ax.add_collection(line)
+            self._overlay = figure, ax, line
+        return self._overlay
+
+    def render(self, path, output_file, title=None):
+        """
+        Draw a route over the map and write the image; the format (see IMAGE_FORMATS) follows the extension. In an
+        SVG image the map is a PNG raster and only the route and the title are vectors.
+        :param path: List of node names.
+        :param output_file: Image file to write.
+        :param title: Title of the image, by default the end nodes of the path.
+        :return: output_file.
+        """
+        figure, ax, line = self._overlay_figure()
+        layout = self.layout
+        line.set_segments([(layout[path[i]], layout[path[i + 1]]) for i in range(len(path) - 1)])
+        ax.set_title(title if title is not None else f"Path Visualization: {path[0]} -> {path[-1]}")
+        figure.savefig(output_file)
+        return output_file
+
+
+def _init_worker(state):
+    """Pool worker initializer: rebuild the renderer once for the lifetime of the worker."""
+    global _worker_renderer
+    _worker_renderer = RouteRenderer.from_state(state)
+
+
+def _render_in_worker(task):
+    return _worker_renderer.render(*task)
+
+
+def render_routes(renderer, routes, output_dir, image_format="png", titles=None, workers=None):
+    """
+    Render many routes to image files, spread over a pool of worker processes.
+    :param renderer: RouteRenderer of the graph of the routes.
+    :param routes: Iterable of paths of node names.
+    :param output_dir: Directory of the images (created if needed), named ``route-00000.png`` and so on.
+    :param image_format: One of IMAGE_FORMATS; "svg" embeds the map as a PNG raster under a vector route.
+    :param titles: Optional title of every route, see `RouteRenderer.render`.
+    :param workers: Number of worker processes, by default the number of CPUs. With 1 (or 0) the routes are
+                    drawn in the calling process.
+    :return: List of the image files, in the order of the routes.
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unknown image format {image_format!r}, expected one of {IMAGE_FORMATS}")
+    routes = list(routes)
+    titles = [None] * len(routes) if titles is None else list(titles)
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(path, os.path.join(output_dir, f"route-{i:05d}.{image_format}"), title)
+             for i, (path, title) in enumerate(zip(routes, titles))]
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers <= 1 or len(tasks) <= 1:
+        return [renderer.render(*task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(renderer.state(),)) as pool:
+        return list(pool.map(_render_in_worker, tasks, chunksize=chunksize))
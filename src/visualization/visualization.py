@@ -1,71 +1,130 @@
-import matplotlib
-import matplotlib.pyplot as plt
-import networkx as nx
+from src.graph.graph_builder import GraphBuilder
 
-matplotlib.use('Qt5Agg')
+# matplotlib and networkx are imported on first use: they take most of the start-up time of the scripts,
+# and the algorithm itself never needs them
 
 
-def visualize_graph(graph, positions=None):
+def _figure(figsize, dpi=None):
+    """
+    A matplotlib figure on its own Agg canvas. pyplot is never involved, so no GUI backend is loaded, nothing
+    can block on a window, and figures are not kept in the global pyplot registry.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _new_axes(output_file, figsize=(8, 6)):
+    """
+    Axes to draw on: on a pyplot figure when it is shown, on a figure of its own Agg canvas (see `_figure`)
+    when it is only written to a file. The process-wide pyplot backend is left alone, so later figures can
+    still be shown; matplotlib picks that backend itself (MPLBACKEND, matplotlibrc, or the first one that
+    works on this machine).
+    """
+    if output_file is None:
+        import matplotlib.pyplot as plt
+        return plt.figure(figsize=figsize).add_subplot()
+    return _figure(figsize).add_subplot()
+
+
+def _finish(ax, output_file):
+    """Show the figure of the axes, or save it to output_file."""
+    if output_file is None:
+        import matplotlib.pyplot as plt
+        plt.show()
+    else:
+        ax.figure.savefig(output_file)
+
+
+def _networkx_graph(graph):
+    """The graph to draw: a networkx.Graph as is, or graph data converted once by `GraphBuilder`."""
+    import networkx as nx
+
+    if isinstance(graph, nx.Graph):
+        return graph
+    return GraphBuilder.from_data(graph).to_networkx()
+
+
+def graph_layout(g, positions=None, seed=0):
+    """
+    Coordinates of every node of a graph: the given positions, and for the nodes without one a seeded spring
+    layout with the positioned nodes fixed. The layout is cached on the graph object, so drawing many routes
+    over the same graph computes it once.
+    :param g: The graph (networkx.Graph).
+    :param positions: Optional dictionary {node: (x, y)}.
+    :param seed: Seed of the spring layout.
+    :return: Dictionary {node: (x, y)}.
+    """
+    positions = {node: tuple(position) for node, position in (positions or {}).items() if node in g}
+    if len(positions) == g.number_of_nodes():
+        return positions
+    cached = getattr(g, '_layout', None)
+    if cached is not None and cached[0] == (seed, positions) and len(cached[1]) == g.number_of_nodes():
+        return cached[1]
+
+    import networkx as nx
+
+    layout = nx.spring_layout(g, pos=positions or None, fixed=list(positions) or None, seed=seed)
+    layout = {node: tuple(float(value) for value in position) for node, position in layout.items()}
+    g._layout = ((seed, positions), layout)
+    return layout
+
+
+def visualize_graph(graph, positions=None, output_file=None):
     """
     Visualize the graph using matplotlib and networkx.
     :param positions:
-    :param graph: The graph represented as a dictionary (dict).
+    :param graph: The graph represented as a dictionary (dict) or a networkx.Graph.
+    :param output_file: Save the figure to this image file instead of showing it.
     """
-    # Convert the dictionary to a networkx graph
-    g = nx.Graph()
+    import networkx as nx
 
-    # Add nodes and edges
-    for node, neighbors in graph.items():
-        for neighbor in neighbors:
-            g.add_edge(node, neighbor['node'], weight=neighbor['weight'])
+    g = _networkx_graph(graph)
 
-    # If no custom node positions are provided, use spring_layout
-    if positions is None:
-        positions = nx.spring_layout(g)  # Positioning of nodes
+    # Nodes without a custom position are placed by a seeded spring layout, cached on the graph
+    positions = graph_layout(g, positions)
 
     # Draw the graph
-    plt.figure(figsize=(8, 6))
-    nx.draw(g, pos=positions, with_labels=True, node_size=500, node_color='lightblue', font_size=10, font_weight='bold',
-            edge_color='gray')
-    plt.title("Graph visualization")
-    plt.show()
+    ax = _new_axes(output_file)
+    nx.draw(g, pos=positions, ax=ax, with_labels=True, node_size=500, node_color='lightblue', font_size=10,
+            font_weight='bold', edge_color='gray')
+    ax.set_title("Graph visualization")
+    _finish(ax, output_file)
 
 
-def visualize_path(graph, path, positions=None):
+def visualize_path(graph, path, positions=None, output_file=None):
     """
     Visualize a specific path within the graph.
     :param positions:
-    :param graph: The graph represented as a dictionary (dict).
+    :param graph: The graph represented as a dictionary (dict) or a networkx.Graph.
     :param path: List of nodes representing the path.
+    :param output_file: Save the figure to this image file instead of showing it.
     """
-    # Convert the dictionary to a networkx graph
-    g = nx.Graph()
+    import networkx as nx
 
-    # Add nodes and edges
-    for node, neighbors in graph.items():
-        for neighbor in neighbors:
-            g.add_edge(node, neighbor['node'], weight=neighbor['weight'])
+    g = _networkx_graph(graph)
 
-    # If no custom node positions are provided, use spring_layout
-    if positions is None:
-        positions = nx.spring_layout(g)  # Positioning of nodes
+    # Nodes without a custom position are placed by a seeded spring layout, cached on the graph
+    positions = graph_layout(g, positions)
 
     # Draw the full graph
-    plt.figure(figsize=(8, 6))
-    nx.draw(g, positions, with_labels=True, node_size=500, node_color='lightblue', font_size=10, font_weight='bold',
-            edge_color='gray')
+    ax = _new_axes(output_file)
+    nx.draw(g, positions, ax=ax, with_labels=True, node_size=500, node_color='lightblue', font_size=10,
+            font_weight='bold', edge_color='gray')
 
     # Highlight the path
     edges_in_path = [(path[i], path[i + 1]) for i in range(len(path) - 1)]
-    nx.draw_networkx_edges(g, positions, edgelist=edges_in_path, edge_color='red', width=2)
+    nx.draw_networkx_edges(g, positions, edgelist=edges_in_path, edge_color='red', width=2, ax=ax)
 
     # Draw edge labels for the distances
     edge_labels = {}
-    for (node1, node2) in g.edges():
-        weight = g[node1][node2]['weight']
+    for node1, node2, weight in g.edges(data='weight', default=1):
         edge_labels[(node1, node2)] = f'{weight} km'  # Format the weight as km
 
-    nx.draw_networkx_edge_labels(g, positions, edge_labels=edge_labels, font_size=8)
+    nx.draw_networkx_edge_labels(g, positions, edge_labels=edge_labels, font_size=8, ax=ax)
 
-    plt.title(f"Path Visualization: {path}")
-    plt.show()
+    ax.set_title(f"Path Visualization: {path}")
+    _finish(ax, output_file)
@@ -0,0 +1,135 @@
+import unittest
+
+import numpy as np
+from src.data.json_loader import load_graph_from_json
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.array_population import (ArrayGeneticAlgorithm, PopulationBuffers, crossover_rows,
+                                                    mutate_rows)
+from src.genetic_algorithm.profiling import PhaseProfiler
+from src.genetic_algorithm.progress import ProgressRecorder
+from src.graph.compact_graph import CompactGraph
+
+
+class TestArrayPopulation(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Loads the sample graph and builds a guided population of random walks on a grid graph.
+        """
+        self.graph, _ = load_graph_from_json('graphs/bc_cities.json')
+        self.grid = CompactGraph.from_data(grid_graph_data(8))
+        ga = GeneticAlgorithm(self.grid, "0-0", "7-7", 1, 30, guided=True, seed=0)
+        self.population = ga.create_initial_population()
+
+    def test_buffers(self):
+        """
+        Test that PopulationBuffers keeps paths as rows, grows its rows for longer paths, swaps the back buffer in
+        and narrows the rows once the paths are much shorter.
+        """
+        buffers = PopulationBuffers.from_paths([[0, 1, 2], [3]], 4, num_nodes=10)
+        self.assertEqual(buffers.to_lists(), [[0, 1, 2], [3]])
+        self.assertEqual(buffers[0].tolist(), [0, 1, 2])
+        self.assertEqual(buffers.dtype, np.int16)
+        nodes, offsets = buffers.pack()
+        self.assertEqual((nodes.tolist(), offsets.tolist()), ([0, 1, 2, 3], [0, 3, 4]))
+
+        buffers.write_trial(0, list(range(10)))
+        buffers.write_trial(1, [5, 6])
+        buffers.accept_trials(1, np.array([0, 1]))
+        buffers.next_paths[0, :1], buffers.next_lengths[0] = 9, 1
+        buffers.swap(3)
+        self.assertEqual(buffers.to_lists(), [[9], list(range(10)), [5, 6]])
+        self.assertGreaterEqual(buffers.width, 10)
+
+        buffers.accept_trials(0, np.array([1]))
+        buffers.swap(1)
+        self.assertEqual(buffers.to_lists(), [[5, 6]])
+        self.assertEqual(buffers.width, 3)
+
+    def test_crossover_rows_matches_crossover(self):
+        """
+        Test that every child of `crossover_rows` is the child of `crossover` at the same crossover point.
+        """
+        buffers = PopulationBuffers.from_paths(self.population, 200, len(self.grid))
+        rng = np.random.default_rng(0)
+        parents1, parents2 = rng.integers(0, len(self.population), (2, 200))
+        points = crossover_rows(buffers, parents1, parents2, rng.random(200))
+        for row, (i, j) in enumerate(zip(parents1.tolist(), parents2.tolist())):
+            parent1, parent2 = self.population[i], self.population[j]
+            crossover_point = parent1[points[row]]
+            expected = list(dict.fromkeys(parent1[:points[row]] + parent2[parent2.index(crossover_point):]))
+            self.assertEqual(buffers.trial_paths[row, :buffers.trial_lengths[row]].tolist(), expected)
+
+    def test_mutate_rows(self):
+        """
+        Test that `mutate_rows` keeps the start node, only replaces nodes by one of their neighbors and removes
+        repeated nodes, and leaves the rows alone with a zero mutation rate.
+        """
+        buffers = PopulationBuffers.from_paths(self.population, len(self.population), len(self.grid))
+        for row, path in enumerate(self.population):
+            buffers.write_trial(row, path)
+        rng = np.random.default_rng(0)
+        self.assertFalse(mutate_rows(buffers, len(self.population), self.grid, rng, mutation_rate=0).any())
+
+        mutated = mutate_rows(buffers, len(self.population), self.grid, rng, mutation_rate=1)
+        self.assertTrue(mutated.any())
+        for row, path in enumerate(self.population):
+            child = buffers.trial_paths[row, :buffers.trial_lengths[row]].tolist()
+            self.assertEqual(len(set(child)), len(child))
+            self.assertEqual(child[0], path[0])
+            replaced = [neighbor for node in path[1:-1] for neighbor in self.grid.neighbors(node)]
+            self.assertTrue(set(child[1:]) <= set(replaced) | {path[-1]})
+
+    def test_run(self):
+        """
+        Test that a run returns a connected path to the end node, keeps simple paths, is reproducible with a seed
+        and counts the accepted children, and that it can be resumed.
+        """
+        results = []
+        for _ in range(2):
+            profiler = PhaseProfiler()
+            ga = ArrayGeneticAlgorithm(self.grid, "0-0", "7-7", 10, 30, guided=True, elitism=2, seed=3,
+                                       profiler=profiler)
+            best_path, best_distance = ga.run()
+            results.append((best_path, best_distance, ga.population))
+
+            self.assertEqual((best_path[0], best_path[-1]), ("0-0", "7-7"))
+            self.assertEqual(ga.graph.path_distance(ga.graph.to_ids(best_path)), best_distance)
+            self.assertEqual(len(ga.population), 30)
+            self.assertTrue(all(len(set(path)) == len(path) for path in ga.population))
+            self.assertEqual(profiler.counters["children_accepted"], 10 * (30 - 2))
+        self.assertEqual(results[0], results[1])
+
+        ga = ArrayGeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", 10, 10, seed=0)
+        ga.run()
+        best_path, _ = ga.resume(5)
+        self.assertEqual((best_path[0], best_path[-1]), ("Tijuana", "Guerrero-Negro"))
+
+    def test_elitism_keeps_the_shortest_route(self):
+        """
+        Test that elites are ranked by distance rather than by the exploration bonus, so the best distance of
+        successive generations never gets worse.
+        """
+        graph = CompactGraph.from_data(grid_graph_data(10))
+        for seed in range(3):
+            recorder = ProgressRecorder()
+            ArrayGeneticAlgorithm(graph, "0-0", "9-9", 15, 20, guided=True, elitism=2, seed=seed,
+                                  progress=recorder).run()
+            distances = [event["best_distance"] for event in recorder.events]
+            self.assertEqual(distances, sorted(distances, reverse=True))
+
+    def test_invalid_options(self):
+        """
+        Test that the networkx engine and initial paths that are not simple are rejected.
+        """
+        with self.assertRaises(ValueError):
+            ArrayGeneticAlgorithm(self.graph, "Tijuana", "Mexicali", 1, 4, engine="networkx")
+        with self.assertRaises(ValueError):
+            ArrayGeneticAlgorithm(self.graph, "Tijuana", "Mexicali", 1, 4,
+                                  initial_paths=[["Tijuana", "Tecate", "Tijuana", "Tecate", "Mexicali"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
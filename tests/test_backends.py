@@ -0,0 +1,70 @@
+import math
+import unittest
+from src.data.json_loader import load_graph_from_json
+from src.data.synthetic_graphs import GRAPH_KINDS, synthetic_graph_data
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import dijkstra_distances
+from src.solver.backends import BACKENDS, EXACT_BACKENDS, solve_route
+
+
+class TestBackends(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Loads the Baja California sample graph with its positions, plus an isolated node.
+        """
+        graph_data, positions = load_graph_from_json('graphs/bc_cities.json')
+        graph_data["Isla-Guadalupe"] = []
+        self.graph = CompactGraph.from_data(graph_data, positions)
+
+    def test_every_backend(self):
+        """
+        Test that every backend returns a path between the query nodes, the exact and hybrid ones the shortest.
+        """
+        for backend in BACKENDS:
+            path, distance = solve_route(self.graph, "Tijuana", "Guerrero-Negro", backend, generations=5,
+                                         population_size=10, seed=0)
+            self.assertEqual((path[0], path[-1]), ("Tijuana", "Guerrero-Negro"), backend)
+            self.assertEqual(self.graph.path_distance(self.graph.to_ids(path)), distance, backend)
+            if backend != "ga":
+                self.assertEqual(distance, 715, backend)
+
+    def test_hybrid_keeps_seeded_paths(self):
+        """
+        Test that the hybrid backend is reproducible and never worse than the shortest path it was seeded with,
+        even without generations.
+        """
+        results = [solve_route(self.graph, "Mexicali", "Ensenada", "hybrid", generations=0, population_size=4,
+                               seed=1) for _ in range(2)]
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][1], solve_route(self.graph, "Mexicali", "Ensenada", "dijkstra")[1])
+
+    def test_hybrid_never_worse_than_dijkstra(self):
+        """
+        Test that the hybrid backend returns a route no longer than the shortest path on synthetic graphs.
+        """
+        for kind in GRAPH_KINDS:
+            graph = CompactGraph.from_data(*synthetic_graph_data(kind, 100, seed=2))
+            # The farthest node reachable from the first one
+            distances = dijkstra_distances(graph, 0)
+            end_node = graph.name(max(distances, key=distances.get))
+            _, shortest = solve_route(graph, graph.name(0), end_node, "dijkstra")
+            for seed in range(3):
+                path, distance = solve_route(graph, graph.name(0), end_node, "hybrid", generations=3,
+                                             population_size=10, seed=seed)
+                self.assertLessEqual(distance, shortest, kind)
+                self.assertEqual(graph.path_distance(graph.to_ids(path)), distance, kind)
+
+    def test_unreachable_and_unknown(self):
+        """
+        Test that exact backends report unreachable destinations and unknown backends are rejected.
+        """
+        for backend in EXACT_BACKENDS:
+            self.assertEqual(solve_route(self.graph, "Tijuana", "Isla-Guadalupe", backend), (None, math.inf))
+        with self.assertRaises(ValueError):
+            solve_route(self.graph, "Tijuana", "Ensenada", "simulated-annealing")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from src.data.json_loader import load_graph_from_json
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.batch_fitness import BatchFitnessEvaluator, pack_population
+
+
+class TestBatchFitness(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Loads the sample graph and builds a population mixing valid, partial and invalid paths.
+        """
+        self.graph, _ = load_graph_from_json('graphs/bc_cities.json')
+        self.population = [
+            ["Tijuana", "Rosarito", "Ensenada", "San-Quintin", "Guerrero-Negro"],
+            ["Tijuana", "Tecate", "Mexicali", "San-Felipe", "Guerrero-Negro"],
+            ["Tijuana", "Tecate", "Ensenada"],                   # Does not reach the end node
+            ["Tijuana", "Mexicali", "San-Felipe"],               # Tijuana and Mexicali are not adjacent
+            ["Tijuana", "Rosarito", "Ensenada", "San-Quintin", "Guerrero-Negro"],
+        ]
+
+    def test_pack_population(self):
+        """
+        Test that `pack_population` concatenates the paths and records their offsets.
+        """
+        nodes, offsets = pack_population([[0, 1, 2], [3], [4, 5]])
+        self.assertEqual(nodes.tolist(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(offsets.tolist(), [0, 3, 4, 6])
+
+    def test_matches_per_individual_fitness(self):
+        """
+        Test that batch evaluation gives exactly the fitnesses of calling `fitness` on each individual.
+        """
+        for engine in ("networkx", "compact"):
+            reference = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", 1, 5, engine=engine)
+            batched = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", 1, 5, engine=engine,
+                                       batch_fitness=True)
+            population = [reference.graph.to_ids(path) if engine == "compact" else path
+                          for path in self.population]
+
+            # Evaluate twice so the exploration bonus state carries over between generations
+            for _ in range(2):
+                self.assertEqual(batched.evaluate_population(population),
+                                 [reference.fitness(individual) for individual in population])
+
+    def test_sparse_lookup(self):
+        """
+        Test that the sparse edge index gives the same distances as the dense weight matrix.
+        """
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", 1, 5, engine="compact")
+        nodes, offsets = pack_population(self.population, ga.graph.node_index)
+        dense = BatchFitnessEvaluator(ga.graph, ga.end_node, dense=True)
+        sparse = BatchFitnessEvaluator(ga.graph, ga.end_node, dense=False)
+
+        dense_fitnesses, dense_distances, dense_valid = dense.evaluate(nodes, offsets)
+        sparse_fitnesses, sparse_distances, sparse_valid = sparse.evaluate(nodes, offsets)
+        self.assertEqual(dense_fitnesses.tolist(), sparse_fitnesses.tolist())
+        self.assertEqual(sparse_distances.tolist(), [715, 778, 152, float('inf'), 715])
+        self.assertEqual(sparse_valid.tolist(), [True, True, True, False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
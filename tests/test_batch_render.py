@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from src.data.json_loader import load_graph_from_json
+from src.graph.graph_manager import create_graph_from_data
+from src.visualization.batch_render import RouteRenderer, load_layout, render_routes
+from src.visualization.visualization import graph_layout
+
+
+class TestBatchRender(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Loads the Baja California sample graph and creates a temporary output directory.
+        """
+        self.graph, self.positions = load_graph_from_json('graphs/bc_cities.json')
+        self.routes = [["Tijuana", "Rosarito", "Ensenada"], ["Mexicali", "San-Felipe"], ["Tecate", "Tijuana"]]
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_render_png_and_svg(self):
+        """
+        Test that routes are written as PNG and SVG images with the expected names, the map embedded as a PNG
+        raster in the SVG images.
+        """
+        renderer = RouteRenderer(self.graph, self.positions)
+        for image_format, magic in (("png", b"\x89PNG"), ("svg", b"<?xml")):
+            files = render_routes(renderer, self.routes, self.directory.name, image_format, workers=1)
+            self.assertEqual([os.path.basename(file) for file in files],
+                             [f"route-{i:05d}.{image_format}" for i in range(len(self.routes))])
+            for file in files:
+                with open(file, 'rb') as f:
+                    self.assertEqual(f.read(len(magic)), magic)
+        with open(files[0], 'rb') as f:
+            self.assertIn(b"data:image/png;base64,", f.read())  # The map is a raster inside the SVG
+        with self.assertRaises(ValueError):
+            render_routes(renderer, self.routes, self.directory.name, "gif")
+
+    def test_worker_pool_matches_in_process(self):
+        """
+        Test that the worker pool writes the same images as the calling process.
+        """
+        renderer = RouteRenderer(self.graph, self.positions)
+        expected = render_routes(renderer, self.routes, os.path.join(self.directory.name, "serial"), workers=1)
+        files = render_routes(renderer, self.routes, os.path.join(self.directory.name, "pool"), workers=2)
+        for file, expected_file in zip(files, expected):
+            with open(file, 'rb') as f, open(expected_file, 'rb') as g:
+                self.assertEqual(f.read(), g.read())
+
+    def test_layout_is_cached(self):
+        """
+        Test that the spring layout keeps the given positions, lays out the other nodes once per graph and is
+        saved to and read from a layout file.
+        """
+        g = create_graph_from_data(self.graph)
+        partial = {"Tijuana": (0.0, 0.0)}
+        layout = graph_layout(g, partial)
+        self.assertEqual(layout["Tijuana"], (0.0, 0.0))
+        self.assertEqual(set(layout), set(g.nodes))
+        self.assertIs(graph_layout(g, partial), layout)
+
+        layout_file = os.path.join(self.directory.name, "layout.json")
+        renderer = RouteRenderer(self.graph, layout_file=layout_file)
+        self.assertEqual(load_layout(layout_file), renderer.layout)
+        self.assertEqual(RouteRenderer(self.graph, layout_file=layout_file, seed=1).layout, renderer.layout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from src.data.json_loader import load_graph_from_json
+from src.solver.batch_solver import BatchSolver
+
+
+class TestBatchSolver(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Loads the Baja California sample graph and a batch of queries.
+        """
+        self.graph, _ = load_graph_from_json('graphs/bc_cities.json')
+        self.queries = [("Tijuana", "Guerrero-Negro"), ("Mexicali", "Ensenada"), ("San-Felipe", "Rosarito")]
+
+    def test_solve_batch(self):
+        """
+        Test that every query gets a path between its own start and end nodes, in order.
+        """
+        with BatchSolver(self.graph, generations=5, population_size=10, workers=1, seed=0) as solver:
+            results = solver.solve_batch(self.queries)
+
+        self.assertEqual(len(results), len(self.queries))
+        for (start_node, end_node), (path, distance) in zip(self.queries, results):
+            self.assertEqual(path[0], start_node)
+            self.assertEqual(path[-1], end_node)
+            self.assertGreater(distance, 0)
+
+    def test_worker_pool_matches_in_process(self):
+        """
+        Test that seeded queries give the same results in the worker pool and in the calling process.
+        """
+        with BatchSolver(self.graph, generations=5, population_size=10, workers=1, seed=3) as solver:
+            expected = solver.solve_batch(self.queries)
+        with BatchSolver(self.graph, generations=5, population_size=10, workers=2, seed=3) as solver:
+            self.assertEqual(solver.solve_batch(self.queries), expected)
+            self.assertEqual(solver.solve(*self.queries[1]), expected[1])
+
+    def test_exact_backend_in_worker_pool(self):
+        """
+        Test that an exact backend gives the same shortest paths in the worker pool and in the calling process.
+        """
+        with BatchSolver(self.graph, workers=1, backend="dijkstra") as solver:
+            expected = solver.solve_batch(self.queries)
+        self.assertEqual(expected[0][1], 715)
+        with BatchSolver(self.graph, workers=2, backend="dijkstra") as solver:
+            self.assertEqual(solver.solve_batch(self.queries), expected)
+        with self.assertRaises(ValueError):
+            BatchSolver(self.graph, backend="brute-force")
+
+    def test_unknown_node(self):
+        """
+        Test that queries with unknown nodes are rejected before solving.
+        """
+        with BatchSolver(self.graph, generations=1, population_size=2, workers=1) as solver:
+            with self.assertRaises(ValueError):
+                solver.solve_batch([("Tijuana", "La-Paz")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from src.benchmark.suite import TIME_METRICS, compare_results, run_case, run_case_with_timeout
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Benchmarks a small grid case once.
+        """
+        self.result = run_case("grid", 16, generations=3, population_size=6, seed=1)
+
+    def test_run_case(self):
+        """
+        Test that a case records every timing and the solution quality against the exact optimum.
+        """
+        for metric in TIME_METRICS:
+            self.assertGreaterEqual(self.result[metric], 0)
+        self.assertEqual(self.result["nodes"], 16)
+        self.assertEqual(self.result["start_node"], "0-0")
+        self.assertGreater(self.result["optimum"], 0)
+        if self.result["reached"]:
+            self.assertGreaterEqual(self.result["best_distance"], self.result["optimum"])
+            self.assertGreaterEqual(self.result["gap"], 0)
+
+    def test_run_case_with_timeout(self):
+        """
+        Test that an isolated case returns the same seeded result, and that a case out of time keeps
+        its identifying fields.
+        """
+        result = run_case_with_timeout("grid", 16, 3, 6, seed=1, timeout=60)
+        self.assertFalse(result["timed_out"])
+        self.assertEqual(result["best_distance"], self.result["best_distance"])
+
+        result = run_case_with_timeout("grid", 16, 3, 6, seed=1, timeout=0)
+        self.assertTrue(result["timed_out"])
+        self.assertEqual(result["num_nodes"], 16)
+
+    def test_compare_results(self):
+        """
+        Test that slower timings beyond the threshold, longer best distances and new timeouts are regressions.
+        """
+        baseline = {"results": [dict(self.result, solve_seconds=1.0, setup_seconds=1.0, best_distance=100)]}
+        current = {"results": [dict(self.result, solve_seconds=1.5, setup_seconds=1.05, best_distance=101)]}
+        regressions = {row["metric"] for row in compare_results(baseline, current, threshold=0.1)
+                       if row["regression"]}
+        self.assertIn("solve_seconds", regressions)
+        self.assertNotIn("setup_seconds", regressions)
+        self.assertIn("best_distance", regressions)
+
+        current = {"results": [dict(kind="grid", num_nodes=16, generations=3, population_size=6, seed=1,
+                                    timed_out=True)]}
+        rows = compare_results(baseline, current)
+        self.assertEqual([row["metric"] for row in rows], ["timed_out"])
+
+
+if __name__ == '__main__':
+    unittest.main()
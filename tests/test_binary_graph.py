@@ -0,0 +1,147 @@
+import os
+import random
+import tempfile
+import unittest
+from src.data.binary_graph import convert_json_to_binary, load_graph_from_binary, save_graph_to_binary
+from src.data.json_loader import save_graph_to_json
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.graph.compact_graph import CompactGraph
+from src.graph.graph_manager import create_graph_from_data
+from src.graph.graph_utils import get_all_edges, get_neighbors, graph_to_dict, node_exists
+
+
+class TestBinaryGraph(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Creates sample graph data, positions and a temporary directory for the files.
+        """
+        self.sample_graph = {
+            "Tijuana": [
+                {"node": "Rosarito", "weight": 20},
+                {"node": "Tecate", "weight": 52}
+            ],
+            "Rosarito": [
+                {"node": "Tijuana", "weight": 20},
+                {"node": "Ensenada", "weight": 85}
+            ],
+            "Tecate": [
+                {"node": "Tijuana", "weight": 52},
+                {"node": "Mexicali", "weight": 135}
+            ]
+        }
+        self.positions = {"Tijuana": [7, 24], "Rosarito": [5, 22], "Ensenada": [10, 15]}
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "graph.graphbin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """
+        Test that a saved graph loads back with the same nodes, CSR arrays and positions.
+        """
+        save_graph_to_binary(self.sample_graph, self.positions, self.file_path)
+        graph = load_graph_from_binary(self.file_path)
+        expected = CompactGraph.from_data(self.sample_graph)
+
+        self.assertEqual(list(graph.node_names), expected.node_names)
+        self.assertEqual(graph.offsets.tolist(), expected.offsets.tolist())
+        self.assertEqual(graph.neighbor_ids.tolist(), expected.neighbor_ids.tolist())
+        self.assertEqual(graph.weights.tolist(), expected.weights.tolist())
+        self.assertEqual(graph.number_of_edges(), 4)
+        self.assertEqual(graph.edge_weight(graph.index("Tecate"), graph.index("Mexicali")), 135)
+
+        # Nodes without a position are absent from the positions dictionary
+        self.assertEqual(graph.positions_dict(), {node: tuple(xy) for node, xy in self.positions.items()})
+
+    def test_edge_attributes(self):
+        """
+        Test that the edge attributes of a graph are saved and load back aligned with the neighbor ids.
+        """
+        for tijuana in self.sample_graph["Tijuana"]:
+            tijuana.update(time=tijuana["weight"] * 2, toll=1)
+        for graph in (self.sample_graph, CompactGraph.from_data(self.sample_graph, attributes=("time", "toll"))):
+            save_graph_to_binary(graph, self.positions, self.file_path, attributes=("time", "toll"))
+            loaded = load_graph_from_binary(self.file_path)
+            self.assertEqual(list(loaded.edge_attributes), ["time", "toll"])
+            expected = CompactGraph.from_data(self.sample_graph, attributes=("time", "toll"))
+            for name in ("time", "toll"):
+                self.assertEqual(loaded.edge_attribute(name).tolist(), expected.edge_attribute(name).tolist())
+            position = loaded.edge_positions([loaded.index("Tijuana"), loaded.index("Tecate")])[0]
+            self.assertEqual(loaded.edge_attribute("time")[position], 104)
+
+        save_graph_to_binary(self.sample_graph, None, self.file_path)
+        self.assertEqual(load_graph_from_binary(self.file_path).edge_attributes, {})
+
+    def test_without_positions(self):
+        """
+        Test that a graph saved without positions loads with no positions.
+        """
+        save_graph_to_binary(CompactGraph.from_data(self.sample_graph), None, self.file_path)
+        graph = load_graph_from_binary(self.file_path)
+        self.assertIsNone(graph.positions)
+        self.assertIsNone(graph.positions_dict())
+
+    def test_convert_json_to_binary(self):
+        """
+        Test that a JSON graph file converts to a binary file describing the same graph.
+        """
+        json_path = os.path.join(self.directory.name, "graph.json")
+        save_graph_to_json(self.sample_graph, self.positions, json_path)
+        convert_json_to_binary(json_path, self.file_path)
+
+        graph = load_graph_from_binary(self.file_path)
+        self.assertEqual(graph.to_data(), CompactGraph.from_data(self.sample_graph).to_data())
+
+    def test_unicode_names(self):
+        """
+        Test that non-ASCII node names survive the round trip.
+        """
+        save_graph_to_binary([("San Quintín", "Ensenada", 190), ("Ensenada", "Maneadero", 15)], None,
+                             self.file_path)
+        graph = load_graph_from_binary(self.file_path)
+        self.assertEqual(list(graph.node_names), ["San Quintín", "Ensenada", "Maneadero"])
+        self.assertEqual(graph.name(0), "San Quintín")
+        self.assertEqual(graph.index("Maneadero"), 2)
+
+    def test_invalid_file(self):
+        """
+        Test that a file which is not in the binary format raises ValueError.
+        """
+        with open(self.file_path, 'wb') as f:
+            f.write(b"{" * 64)
+        with self.assertRaises(ValueError):
+            load_graph_from_binary(self.file_path)
+
+    def test_graph_utils(self):
+        """
+        Test that the graph utilities give the same results on a binary graph as on a networkx graph.
+        """
+        save_graph_to_binary(self.sample_graph, self.positions, self.file_path)
+        graph = load_graph_from_binary(self.file_path)
+        nx_graph = create_graph_from_data(self.sample_graph)
+
+        self.assertEqual(graph_to_dict(graph), graph_to_dict(nx_graph))
+        self.assertEqual(get_all_edges(graph), get_all_edges(nx_graph))
+        self.assertEqual(get_neighbors(graph, "Tijuana"), get_neighbors(nx_graph, "Tijuana"))
+        self.assertEqual(get_neighbors(graph, "Nowhere"), [])
+        self.assertTrue(node_exists(graph, "Mexicali"))
+        self.assertFalse(node_exists(graph, "Nowhere"))
+
+    def test_genetic_algorithm(self):
+        """
+        Test that the genetic algorithm gives the same seeded result on a binary graph as on the JSON data.
+        """
+        save_graph_to_binary(self.sample_graph, self.positions, self.file_path)
+        random.seed(3)
+        expected = GeneticAlgorithm(self.sample_graph, "Rosarito", "Mexicali", 5, 8).run()
+        random.seed(3)
+        result = GeneticAlgorithm(load_graph_from_binary(self.file_path), "Rosarito", "Mexicali", 5, 8).run()
+        self.assertEqual(result, expected)
+        self.assertEqual(result, (["Rosarito", "Tijuana", "Tecate", "Mexicali"], 207))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+import networkx as nx
+import numpy as np
+from src.graph.compact_graph import CompactGraph
+from src.graph.graph_manager import create_graph_from_data
+
+
+class TestCompactGraph(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Creates sample graph data for testing.
+        """
+        self.sample_graph = {
+            "Tijuana": [
+                {"node": "Rosarito", "weight": 20},
+                {"node": "Tecate", "weight": 52}
+            ],
+            "Rosarito": [
+                {"node": "Tijuana", "weight": 20},
+                {"node": "Ensenada", "weight": 85}
+            ]
+        }
+        self.graph = CompactGraph.from_data(self.sample_graph)
+
+    def test_from_data(self):
+        """
+        Test that `CompactGraph.from_data` maps every node to an id and stores each edge in both rows.
+        """
+        self.assertEqual(self.graph.number_of_nodes(), 4)
+        self.assertEqual(self.graph.number_of_edges(), 3)
+
+        tijuana = self.graph.index("Tijuana")
+        rosarito = self.graph.index("Rosarito")
+        self.assertTrue(self.graph.has_edge(tijuana, rosarito))
+        self.assertTrue(self.graph.has_edge(rosarito, tijuana))
+        self.assertEqual(self.graph.edge_weight(tijuana, rosarito), 20)
+
+        # CSR arrays are consistent with the rows
+        self.assertEqual(len(self.graph.offsets), self.graph.number_of_nodes() + 1)
+        self.assertEqual(len(self.graph.neighbor_ids), len(self.graph.weights))
+
+    def test_neighbor_order_matches_networkx(self):
+        """
+        Test that neighbors come out in the same order as in the networkx graph.
+        """
+        g = create_graph_from_data(self.sample_graph)
+        for node in g.nodes:
+            expected = list(g.neighbors(node))
+            actual = self.graph.to_names(self.graph.neighbors(self.graph.index(node)))
+            self.assertEqual(actual, expected)
+
+    def test_from_networkx(self):
+        """
+        Test that `CompactGraph.from_networkx` keeps nodes and weights.
+        """
+        g = nx.Graph()
+        g.add_edge("Tecate", "Mexicali", weight=135)
+        graph = CompactGraph.from_networkx(g)
+        self.assertEqual(graph.edge_weight(graph.index("Tecate"), graph.index("Mexicali")), 135)
+
+    def test_path_distance(self):
+        """
+        Test distance and validity of integer paths, and the translation back to names.
+        """
+        path = self.graph.to_ids(["Tecate", "Tijuana", "Rosarito", "Ensenada"])
+        self.assertTrue(self.graph.is_valid_path(path))
+        self.assertEqual(self.graph.path_distance(path), 157)
+        self.assertEqual(self.graph.to_names(path), ["Tecate", "Tijuana", "Rosarito", "Ensenada"])
+
+    def test_update_edges_matches_networkx(self):
+        """
+        Test that `update_edges` gives the same arrays, neighbor order included, as the same changes on networkx.
+        """
+        changes = [("Tijuana", "Rosarito", 25), ("Tijuana", "Tecate", None), ("Tecate", "Ensenada", 110),
+                   ("Tijuana", "Tecate", 60), ("Rosarito", "Ensenada", None), ("Ensenada", "Tijuana", None)]
+        g = create_graph_from_data(self.sample_graph)
+        for u, v, weight in changes:
+            if weight is None:
+                if g.has_edge(u, v):
+                    g.remove_edge(u, v)
+            else:
+                g.add_edge(u, v, weight=weight)
+        rosarito = self.graph.index("Rosarito")
+        self.graph[rosarito]  # Build a row before the update, it must not go stale
+
+        stale = self.graph.update_edges([(self.graph.index(u), self.graph.index(v), weight)
+                                         for u, v, weight in changes])
+        expected = CompactGraph.from_networkx(g)
+        self.assertEqual(expected.node_names, self.graph.node_names)
+        np.testing.assert_array_equal(self.graph.offsets, expected.offsets)
+        np.testing.assert_array_equal(self.graph.neighbor_ids, expected.neighbor_ids)
+        np.testing.assert_array_equal(self.graph.weights, expected.weights)
+        self.assertEqual(self.graph[rosarito], {self.graph.index("Tijuana"): 25})
+        self.assertEqual(self.graph.number_of_edges(), 3)
+
+        # Reweighted, removed and added edges are stale in both directions
+        names = {(self.graph.name(u), self.graph.name(v)) for u, v in stale}
+        self.assertEqual(names, {("Tijuana", "Rosarito"), ("Rosarito", "Tijuana"), ("Rosarito", "Ensenada"),
+                                 ("Ensenada", "Rosarito"), ("Tijuana", "Tecate"), ("Tecate", "Tijuana"),
+                                 ("Tecate", "Ensenada"), ("Ensenada", "Tecate")})
+
+    def test_edge_attributes(self):
+        """
+        Test that edge attributes stay aligned with the neighbor ids through `edge_positions`, `to_data` and
+        edge removals and additions.
+        """
+        data = {"A": [{"node": "B", "weight": 4, "toll": 5}, {"node": "C", "weight": 1, "toll": 2}],
+                "C": [{"node": "D", "weight": 3, "toll": 7}]}
+        graph = CompactGraph.from_data(data, attributes=("toll",))
+        path = graph.to_ids(["B", "A", "C", "D"])
+
+        self.assertEqual(graph.edge_attribute("toll")[graph.edge_positions(path)].tolist(), [5, 2, 7])
+        self.assertEqual(graph.edge_attribute("weight")[graph.edge_positions(path)].tolist(), [4, 1, 3])
+        self.assertIsNone(graph.edge_positions(graph.to_ids(["B", "D"])))
+        self.assertEqual(CompactGraph.from_data(graph.to_data(), attributes=("toll",)).to_data(), graph.to_data())
+
+        a, b, c, d = graph.to_ids(["A", "B", "C", "D"])
+        with self.assertRaises(ValueError):
+            graph.update_edges([(a, b, None), (b, d, 9)])  # An added edge needs a toll
+        stale = graph.update_edges([(a, b, None), (b, d, 9, {"toll": 4}), (c, d, 3, {"toll": 6})])
+        self.assertEqual(stale, {(a, b), (b, a), (b, d), (d, b), (c, d), (d, c)})
+        self.assertIsNone(graph.edge_positions(path))
+        path = [b, d, c, a]
+        self.assertEqual(graph.edge_attribute("toll")[graph.edge_positions(path)].tolist(), [4, 6, 2])
+        self.assertEqual(graph.edge_attribute("weight")[graph.edge_positions(path)].tolist(), [9, 3, 1])
+
+    def test_update_edges_on_read_only_arrays(self):
+        """
+        Test that weight changes on read-only (e.g. memory-mapped) arrays update a copy.
+        """
+        weights = self.graph.weights.copy()
+        weights.flags.writeable = False
+        graph = CompactGraph(self.graph.node_names, self.graph.offsets, self.graph.neighbor_ids, weights)
+        tijuana, tecate = graph.index("Tijuana"), graph.index("Tecate")
+        graph.update_edges([(tijuana, tecate, 52.5)])
+        self.assertEqual(graph.edge_weight(tecate, tijuana), 52.5)
+        self.assertEqual(weights.tolist(), self.graph.weights.tolist())
+
+        with self.assertRaises(ValueError):
+            graph.update_edges([(tijuana, 99, 1)])
+
+        invalid_path = self.graph.to_ids(["Tecate", "Ensenada"])
+        self.assertFalse(self.graph.is_valid_path(invalid_path))
+        self.assertEqual(self.graph.path_distance(invalid_path), float('inf'))
+
+
+if __name__ == '__main__':
+    unittest.main()
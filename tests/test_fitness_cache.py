@@ -0,0 +1,60 @@
+import random
+import unittest
+from src.data.json_loader import load_graph_from_json
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.fitness_cache import FitnessCache
+
+
+class TestFitnessCache(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Loads the Baja California sample graph.
+        """
+        self.graph, _ = load_graph_from_json('graphs/bc_cities.json')
+
+    def test_bounded_size(self):
+        """
+        Test that the oldest entry is dropped once the table is full.
+        """
+        cache = FitnessCache(max_size=2)
+        cache.put((1,), (0, 1.0))
+        cache.put((2,), (0, 2.0))
+        cache.put((3,), (0, 3.0))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get((1,)))
+        self.assertEqual(cache.get((3,)), (0, 3.0))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.discard_where(lambda key: key == (2,)), 1)
+        self.assertNotIn((2,), cache)
+
+    def test_memoized_fitness_is_identical(self):
+        """
+        Test that memoization does not change the fitness values, including the exploration bonus.
+        """
+        path = ["Tijuana", "Rosarito", "Ensenada", "San-Quintin", "Guerrero-Negro"]
+        plain = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", 1, 2, fitness_cache_size=0)
+        memoized = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", 1, 2)
+
+        # The first call earns the exploration bonus, the second one is served from the memo table
+        self.assertEqual([memoized.fitness(path) for _ in range(2)], [plain.fitness(path) for _ in range(2)])
+        self.assertEqual(memoized.fitness_cache.stats()["hits"], 1)
+        self.assertEqual(memoized.fitness(["Tijuana", "Mexicali"]), -float('inf'))
+
+    def test_run_results_are_identical(self):
+        """
+        Test that a seeded run gives the same result with and without the memo table.
+        """
+        results = []
+        for size in (0, 1024):
+            random.seed(4)
+            results.append(GeneticAlgorithm(self.graph, "Mexicali", "Guerrero-Negro", generations=10,
+                                            population_size=10, fitness_cache_size=size).run())
+        self.assertEqual(results[0], results[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,252 @@
+import contextlib
+import io
+import json
+import random
+import unittest
+from src.data.json_loader import load_graph_from_json
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import (GeneticAlgorithm, calculate_path_distance, correct_path_to_end,
+                                                     crossover, first_positions)
+from src.genetic_algorithm.progress import PROGRESS_FIELDS, JsonLinesProgressWriter, ProgressRecorder
+
+
+class TestGeneticAlgorithm(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Loads the Baja California sample graph.
+        """
+        self.graph, self.positions = load_graph_from_json('graphs/bc_cities.json')
+
+    def run_quietly(self, ga):
+        """Run the genetic algorithm discarding its console output."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            return ga.run()
+
+    def test_run_returns_valid_path(self):
+        """
+        Test that `run` returns a connected path from the start node to the end node.
+        """
+        random.seed(0)
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=10, population_size=10)
+        best_path, best_distance = self.run_quietly(ga)
+
+        self.assertEqual(best_path[0], "Tijuana")
+        self.assertEqual(best_path[-1], "Guerrero-Negro")
+        self.assertEqual(calculate_path_distance(ga.graph, best_path), best_distance)
+
+    def test_compact_engine_matches_networkx(self):
+        """
+        Test that the compact engine gives the same result as the networkx engine for a fixed seed.
+        """
+        for seed in range(3):
+            results = []
+            for engine in ("networkx", "compact"):
+                random.seed(seed)
+                ga = GeneticAlgorithm(self.graph, "Mexicali", "Guerrero-Negro", generations=10, population_size=10,
+                                      engine=engine)
+                results.append(self.run_quietly(ga))
+            self.assertEqual(results[0], results[1])
+
+    def test_run_is_silent_by_default(self):
+        """
+        Test that `run` only prints when verbose is enabled.
+        """
+        for verbose in (False, True):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                GeneticAlgorithm(self.graph, "Tijuana", "Mexicali", generations=2, population_size=4,
+                                 verbose=verbose).run()
+            self.assertEqual(bool(output.getvalue()), verbose)
+
+    def test_progress_events(self):
+        """
+        Test that the progress listener receives one event per generation.
+        """
+        recorder = ProgressRecorder()
+        stream = io.StringIO()
+        writer = JsonLinesProgressWriter(stream)
+        random.seed(0)
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=5, population_size=10,
+                              progress=lambda event: (recorder(event), writer(event)))
+        ga.run()
+
+        self.assertEqual([event["generation"] for event in recorder.events], [1, 2, 3, 4, 5])
+        for event in recorder.events:
+            self.assertEqual(tuple(event), PROGRESS_FIELDS)
+            self.assertGreaterEqual(event["best_fitness"], event["mean_fitness"])
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[-1]["best_distance"], recorder.events[-1]["best_distance"])
+
+    def test_elitism(self):
+        """
+        Test that with elitism the best distance of successive generations never gets worse.
+        """
+        for seed in range(3):
+            random.seed(seed)
+            recorder = ProgressRecorder()
+            GeneticAlgorithm(self.graph, "Mexicali", "Guerrero-Negro", generations=15, population_size=8,
+                             progress=recorder, elitism=2).run()
+            distances = [event["best_distance"] for event in recorder.events[1:]]
+            self.assertEqual(distances, sorted(distances, reverse=True))
+
+    def test_run_returns_best_route_seen(self):
+        """
+        Test that `run` returns the shortest route evaluated during the run, even when the exploration bonus
+        ranks longer routes above it, for seeds that used to lose it.
+        """
+        graph = grid_graph_data(10)
+        for seed in (1, 3, 4, 9):
+            ga = GeneticAlgorithm(graph, "0-0", "9-9", generations=15, population_size=20, engine="compact",
+                                  guided=True, elitism=2, seed=seed)
+            _, best_distance = ga.run()
+            seen = min(distance for path, (distance, _) in ga.fitness_cache.entries.items() if path[-1] == ga.end_node)
+            self.assertEqual(best_distance, seen)
+
+    def test_early_stopping(self):
+        """
+        Test the stall, target distance and time budget stop criteria.
+        """
+        random.seed(0)
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=1000, population_size=10,
+                              stall_generations=3)
+        ga.run()
+        self.assertEqual(ga.stop_reason, "stalled")
+        self.assertLess(ga.generation, 1000)
+
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=1000, population_size=10,
+                              guided=True, target_distance=10 ** 6)
+        best_path, _ = ga.run()
+        self.assertEqual(ga.stop_reason, "target_distance")
+        self.assertEqual(ga.generation, 1)
+        self.assertEqual(best_path[-1], "Guerrero-Negro")
+
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=1000, population_size=10,
+                              time_budget=0)
+        ga.run()
+        self.assertEqual(ga.stop_reason, "time_budget")
+        self.assertEqual(ga.generation, 0)
+
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=2, population_size=10)
+        ga.run()
+        self.assertEqual(ga.stop_reason, "generations")
+
+    def test_first_positions(self):
+        """
+        Test that `first_positions` keeps the first occurrence of repeated nodes.
+        """
+        self.assertEqual(first_positions(["a", "b", "a", "c"]), {"a": 0, "b": 1, "c": 3})
+
+    def test_crossover(self):
+        """
+        Test that crossover joins parent1 up to a common node with parent2 from that node on.
+        """
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=1, population_size=2)
+        parent1 = ["Tijuana", "Tecate", "Ensenada", "San-Quintin", "Guerrero-Negro"]
+        parent2 = ["Tijuana", "Rosarito", "Ensenada", "San-Felipe", "Guerrero-Negro"]
+        for seed in range(10):
+            random.seed(seed)
+            child = crossover(parent1, parent2, ga.graph, "Guerrero-Negro")
+            self.assertEqual(child[0], "Tijuana")
+            self.assertEqual(child[-1], "Guerrero-Negro")
+            self.assertEqual(len(child), len(set(child)))
+            self.assertTrue(ga.is_valid_path(child))
+
+        # Without common nodes the first parent is kept
+        parent = ["Mexicali"]
+        self.assertIs(crossover(parent, ["Tijuana"], ga.graph, "Tijuana"), parent)
+
+    def test_correct_path_to_end(self):
+        """
+        Test that a blind repair never revisits a node of the path.
+        """
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=1, population_size=2)
+        for seed in range(20):
+            random.seed(seed)
+            repaired = correct_path_to_end(["Tijuana", "Tecate"], ga.graph, "Guerrero-Negro")
+            if repaired is not None:
+                self.assertEqual(repaired[-1], "Guerrero-Negro")
+                self.assertEqual(len(repaired), len(set(repaired)))
+                self.assertTrue(ga.is_valid_path(repaired))
+
+    def test_update_graph_and_resume(self):
+        """
+        Test that after closing an edge of the best route only the memoized paths using it are dropped and
+        `resume` evolves the repaired population into a route that avoids it, on both engines.
+        """
+        for engine in ("networkx", "compact"):
+            ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=10, population_size=10,
+                                  engine=engine, elitism=1, seed=1)
+            best_path, _ = self.run_quietly(ga)
+            closed = (best_path[1], best_path[2])
+            edge = (closed if engine == "networkx" else tuple(ga.graph.to_ids(closed)))
+            cached = len(ga.fitness_cache)
+            uses_edge = sum(any(pair in (edge, edge[::-1]) for pair in zip(path, path[1:]))
+                            for path in ga.fitness_cache.entries)
+
+            dropped = ga.update_graph([(*closed, None)])
+            self.assertEqual(dropped, uses_edge)
+            self.assertEqual(len(ga.fitness_cache), cached - uses_edge)
+
+            new_path, new_distance = ga.resume(generations=5)
+            self.assertEqual(ga.generation, 5)
+            self.assertEqual((new_path[0], new_path[-1]), ("Tijuana", "Guerrero-Negro"))
+            self.assertNotIn(closed, list(zip(new_path, new_path[1:])))
+            self.assertTrue(all(ga.is_valid_path(path) for path in ga.population))
+            self.assertLess(new_distance, float('inf'))
+
+    def test_update_graph_adds_edges(self):
+        """
+        Test that adding an edge drops the memoized fitness of the paths it makes valid, on both engines.
+        """
+        for engine in ("networkx", "compact"):
+            ga = GeneticAlgorithm(self.graph, "Tijuana", "Guerrero-Negro", generations=1, population_size=2,
+                                  engine=engine)
+            path = ["Tijuana", "Ensenada", "San-Quintin", "Guerrero-Negro"]
+            if engine == "compact":
+                path = ga.graph.to_ids(path)
+            self.assertEqual(ga.fitness(path), float('-inf'))
+
+            self.assertEqual(ga.update_graph([("Tijuana", "Ensenada", 100)]), 1)
+            self.assertEqual(ga.fitness_cache.get(tuple(path)), None)
+            self.assertEqual(ga.base_fitness(path)[0], 100 + calculate_path_distance(ga.graph, path[1:]))
+            self.assertGreater(ga.fitness(path), float('-inf'))
+
+    def test_initial_paths(self):
+        """
+        Test that initial paths are put in the initial population and invalid ones are rejected.
+        """
+        seeded = ["Tijuana", "Rosarito", "Ensenada"]
+        for engine in ("networkx", "compact"):
+            ga = GeneticAlgorithm(self.graph, "Tijuana", "Ensenada", generations=1, population_size=4, engine=engine,
+                                  seed=0, initial_paths=[seeded])
+            population = ga.create_initial_population()
+            self.assertEqual(ga.to_node_names(population[0]), seeded)
+            self.assertEqual(len(population), 4)
+        for path in (["Rosarito", "Ensenada"], ["Tijuana", "Ensenada"]):
+            with self.assertRaises(ValueError):
+                GeneticAlgorithm(self.graph, "Tijuana", "Ensenada", generations=1, population_size=4,
+                                 initial_paths=[path])
+
+    def test_resume_without_run(self):
+        """
+        Test that `resume` falls back to a cold run when there is no population yet.
+        """
+        ga = GeneticAlgorithm(self.graph, "Tijuana", "Mexicali", generations=3, population_size=6, seed=2)
+        expected = self.run_quietly(GeneticAlgorithm(self.graph, "Tijuana", "Mexicali", generations=3,
+                                                     population_size=6, seed=2))
+        self.assertEqual(ga.resume(), expected)
+
+    def test_unknown_engine(self):
+        """
+        Test that an unknown engine name is rejected.
+        """
+        with self.assertRaises(ValueError):
+            GeneticAlgorithm(self.graph, "Tijuana", "Mexicali", generations=1, population_size=2, engine="igraph")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import random
+import unittest
+from src.data.json_loader import load_graph_from_json
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm, correct_path_to_end
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import dijkstra_distances, distance_cache_for, invalidate_distance_cache
+from src.graph.graph_manager import create_graph_from_data
+
+
+class TestGoalDistances(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Loads the Baja California sample graph in both representations.
+        """
+        self.graph_data, _ = load_graph_from_json('graphs/bc_cities.json')
+        self.graph = create_graph_from_data(self.graph_data)
+        self.compact = CompactGraph.from_data(self.graph_data)
+
+    def test_dijkstra_distances(self):
+        """
+        Test that distances to the goal are the exact shortest distances on both representations.
+        """
+        distances = dijkstra_distances(self.graph, "Guerrero-Negro")
+        self.assertEqual(distances["Guerrero-Negro"], 0)
+        self.assertEqual(distances["Tijuana"], 715)
+
+        compact_distances = dijkstra_distances(self.compact, self.compact.index("Guerrero-Negro"))
+        self.assertEqual({self.compact.name(node): distance for node, distance in compact_distances.items()},
+                         distances)
+
+    def test_distance_cache_is_shared(self):
+        """
+        Test that distance tables are computed once per destination and graph object.
+        """
+        cache = distance_cache_for(self.graph)
+        self.assertIs(distance_cache_for(self.graph), cache)
+        self.assertIs(cache.distances("Mexicali"), cache.distances("Mexicali"))
+
+        # Invalidation (after the edges changed) keeps the cache object but drops its tables
+        invalidate_distance_cache(self.graph)
+        self.assertIs(distance_cache_for(self.graph), cache)
+        self.assertEqual(len(cache.tables), 0)
+
+    def test_guided_repair(self):
+        """
+        Test that a guided repair completes a path that a blind walk could leave stuck.
+        """
+        guide = distance_cache_for(self.graph).guide("Guerrero-Negro")
+        completed = guide.complete(["Tijuana", "Rosarito"])
+        self.assertEqual(completed, ["Tijuana", "Rosarito", "Ensenada", "San-Quintin", "Guerrero-Negro"])
+
+        # The shortest route back through Tijuana is cut instead of creating a loop
+        completed = guide.complete(["Tijuana", "Tecate"])
+        self.assertEqual(completed[-1], "Guerrero-Negro")
+        self.assertEqual(len(completed), len(set(completed)))
+
+        for seed in range(10):
+            random.seed(seed)
+            repaired = correct_path_to_end(["Mexicali", "Tecate"], self.graph, "Guerrero-Negro", guide)
+            self.assertEqual(repaired[-1], "Guerrero-Negro")
+
+    def test_zero_weight_edges(self):
+        """
+        Test that completing a path over zero-weight edges reaches the goal instead of stepping back and forth.
+        """
+        edges = {"A": ["B"], "B": ["A", "C", "D"], "C": ["B", "E"], "D": ["B"], "E": ["C"]}
+        graph_data = {node: [{"node": neighbor, "weight": 0} for neighbor in neighbors]
+                      for node, neighbors in edges.items()}
+        for graph in (create_graph_from_data(graph_data), CompactGraph.from_data(graph_data)):
+            names = graph.index if isinstance(graph, CompactGraph) else str
+            guide = distance_cache_for(graph).guide(names("E"))
+            self.assertEqual(guide.complete([names("B")]), [names("B"), names("C"), names("E")])
+            self.assertEqual(guide.complete([names("D"), names("B")]),
+                             [names("D"), names("B"), names("C"), names("E")])
+            self.assertEqual(guide.complete([names("A")]), [names("A"), names("B"), names("C"), names("E")])
+
+    def test_guided_population(self):
+        """
+        Test that a guided initial population is full and every individual reaches the end node.
+        """
+        random.seed(0)
+        ga = GeneticAlgorithm(self.graph_data, "Mexicali", "Rosarito", generations=5, population_size=20,
+                              guided=True)
+        population = ga.create_initial_population()
+        self.assertEqual(len(population), 20)
+        for individual in population:
+            self.assertEqual(individual[-1], "Rosarito")
+            self.assertTrue(ga.is_valid_path(individual))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import networkx as nx
+import numpy as np
+from src.graph.compact_graph import CompactGraph
+from src.graph.graph_builder import GraphBuilder
+
+
+class TestGraphBuilder(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Creates graph data with symmetric entries, an asymmetric entry, a self-loop and an isolated node.
+        """
+        self.sample_graph = {
+            "Tijuana": [
+                {"node": "Rosarito", "weight": 20},
+                {"node": "Tecate", "weight": 52}
+            ],
+            "Rosarito": [
+                {"node": "Tijuana", "weight": 20},
+                {"node": "Ensenada", "weight": 85},
+                {"node": "Rosarito", "weight": 1}
+            ],
+            "Ensenada": [
+                {"node": "Rosarito", "weight": 90}
+            ],
+            "San-Felipe": []
+        }
+
+    def test_symmetric_edges_are_stored_once(self):
+        """
+        Test that the two entries of an edge are stored once, with the last weight, and that nodes keep
+        their first-seen order.
+        """
+        builder = GraphBuilder.from_data(self.sample_graph)
+
+        self.assertEqual(builder.node_names, ["Tijuana", "Rosarito", "Tecate", "Ensenada", "San-Felipe"])
+        self.assertEqual(builder.number_of_edges(), 4)
+        graph = builder.to_networkx()
+        self.assertEqual(graph["Rosarito"]["Ensenada"]["weight"], 90)
+
+    def test_networkx_graph_matches_edge_by_edge_insertion(self):
+        """
+        Test that the batched networkx graph has the nodes, neighbor order and weights of inserting the edges
+        one by one.
+        """
+        expected = nx.Graph()
+        for node, edges in self.sample_graph.items():
+            expected.add_node(node)
+            for edge in edges:
+                expected.add_edge(node, edge["node"], weight=edge["weight"])
+
+        graph = GraphBuilder.from_data(self.sample_graph).to_networkx()
+
+        self.assertEqual(list(graph.nodes), list(expected.nodes))
+        for node in expected:
+            self.assertEqual(list(graph[node].items()), list(expected[node].items()))
+
+    def test_csr_arrays_match_adjacency(self):
+        """
+        Test that the CSR arrays built with NumPy equal those of the ordered adjacency dictionary, self-loop
+        included.
+        """
+        adjacency = {}
+        for node, edges in self.sample_graph.items():
+            adjacency.setdefault(node, {})
+            for edge in edges:
+                adjacency[node][edge["node"]] = edge["weight"]
+                adjacency.setdefault(edge["node"], {})[node] = edge["weight"]
+        expected = CompactGraph.from_adjacency(adjacency)
+
+        offsets, neighbor_ids, weights = GraphBuilder.from_data(self.sample_graph).csr_arrays()
+
+        np.testing.assert_array_equal(offsets, expected.offsets)
+        np.testing.assert_array_equal(neighbor_ids, expected.neighbor_ids)
+        np.testing.assert_array_equal(weights, expected.weights)
+        self.assertEqual(weights.dtype, expected.weights.dtype)
+
+    def test_edge_list(self):
+        """
+        Test that a list of edges with and without weights is built, with a default weight of 1.
+        """
+        builder = GraphBuilder.from_data([("A", "B"), ("B", "C", 4), ("C", "D", {"weight": 2}), ("B", "A", 3)])
+
+        self.assertEqual(builder.number_of_edges(), 3)
+        offsets, neighbor_ids, weights = builder.csr_arrays()
+        self.assertEqual(offsets.tolist(), [0, 1, 3, 5, 6])
+        self.assertEqual(neighbor_ids.tolist(), [1, 0, 2, 1, 3, 2])
+        self.assertEqual(weights.tolist(), [3, 3, 4, 4, 2, 2])
+
+    def test_edge_attributes(self):
+        """
+        Test that named edge attributes are collected like the weights (last value wins, missing values are 0)
+        and spread over the CSR entries in both directions.
+        """
+        data = {"A": [{"node": "B", "weight": 4, "time": 2, "toll": 5}, {"node": "C", "weight": 1, "time": 3}],
+                "B": [{"node": "A", "weight": 4, "time": 6}]}
+        builder = GraphBuilder.from_data(data, attributes=("time", "toll"))
+        offsets, neighbor_ids, weights = builder.csr_arrays()
+        attributes = builder.csr_attributes()
+
+        self.assertEqual(neighbor_ids.tolist(), [1, 2, 0, 0])
+        self.assertEqual(attributes["time"].tolist(), [6, 3, 6, 3])
+        self.assertEqual(attributes["toll"].tolist(), [5, 0, 5, 0])
+        self.assertEqual(builder.to_networkx()["B"]["A"], {"weight": 4, "time": 6, "toll": 5})
+        self.assertEqual(GraphBuilder.from_data(data).csr_attributes(), {})
+        edges = GraphBuilder.from_data([("A", "B", {"weight": 4, "time": 2})], attributes=("time",))
+        self.assertEqual(edges.csr_attributes()["time"].tolist(), [2, 2])
+
+    def test_empty_graph(self):
+        """
+        Test that a graph without edges gives empty CSR arrays.
+        """
+        offsets, neighbor_ids, weights = GraphBuilder.from_data({"A": []}).csr_arrays()
+
+        self.assertEqual(offsets.tolist(), [0, 0])
+        self.assertEqual(len(neighbor_ids), 0)
+        self.assertEqual(len(weights), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -51,6 +51,16 @@ class TestGraphManager(unittest.TestCase):
         weight = graph["Tijuana"]["Rosarito"]['weight']
         self.assertEqual(weight, 20)
 
+    def test_create_graph_from_data_keeps_order_and_isolated_nodes(self):
+        """
+        Test that `create_graph_from_data` keeps nodes without edges and the insertion order of the neighbors.
+        """
+        graph = create_graph_from_data(dict(self.sample_graph, Mexicali=[]))
+
+        self.assertEqual(list(graph.nodes), ["Tijuana", "Rosarito", "Tecate", "Ensenada", "Mexicali"])
+        self.assertEqual(list(graph["Rosarito"]), ["Tijuana", "Ensenada"])
+        self.assertEqual(graph.number_of_edges(), 3)
+
     def test_load_graph_from_json_file(self):
         """
         Test that `load_graph_from_json_file` loads a graph correctly from a JSON file.
@@ -1,6 +1,8 @@
 import unittest
 import networkx as nx
-from src.graph.graph_utils import get_neighbors, get_all_edges, node_exists, graph_to_dict
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import distance_cache_for
+from src.graph.graph_utils import get_neighbors, get_all_edges, node_exists, graph_to_dict, update_edges
 
 
 class TestGraphUtils(unittest.TestCase):
@@ -78,6 +80,46 @@ class TestGraphUtils(unittest.TestCase):
         # Test for a node with no neighbors
         self.assertEqual(graph_dict["Ensenada"], [("Rosarito", 85)])
 
+    def test_update_edges(self):
+        """
+        Test that `update_edges` changes, removes and adds edges on both graph types and drops distance tables.
+        """
+        changes = [("Tijuana", "Tecate", 60), ("Rosarito", "Ensenada", None), ("Ensenada", "Mexicali", 250),
+                   ("Tijuana", "Mexicali", None)]
+        compact = CompactGraph.from_networkx(self.graph)
+        for graph in (self.graph, compact):
+            cache = distance_cache_for(graph)
+            cache.distances(graph.index("Mexicali") if graph is compact else "Mexicali")
+            stale = update_edges(graph, changes)
+            self.assertEqual(stale, {("Tijuana", "Tecate"), ("Tecate", "Tijuana"), ("Rosarito", "Ensenada"),
+                                     ("Ensenada", "Rosarito"), ("Ensenada", "Mexicali"), ("Mexicali", "Ensenada")})
+            self.assertEqual(sorted(get_all_edges(graph)), [("Ensenada", "Mexicali", 250),
+                                                            ("Tecate", "Mexicali", 135),
+                                                            ("Tijuana", "Rosarito", 20),
+                                                            ("Tijuana", "Tecate", 60)])
+            self.assertEqual(cache.tables, {})
+
+        with self.assertRaises(ValueError):
+            update_edges(self.graph, [("Tijuana", "San Felipe", 10)])
+
+    def test_update_edge_attributes(self):
+        """
+        Test that `update_edges` sets the attributes of changed and added edges, and rejects an added edge
+        without the attributes the other edges carry before changing anything.
+        """
+        self.graph["Tijuana"]["Tecate"]["time"] = 40
+        with self.assertRaises(ValueError):
+            update_edges(self.graph, [("Tijuana", "Rosarito", None), ("Ensenada", "Mexicali", 250)])
+        self.assertTrue(self.graph.has_edge("Tijuana", "Rosarito"))
+
+        stale = update_edges(self.graph, [("Ensenada", "Mexicali", 250, {"time": 180}),
+                                          ("Tijuana", "Tecate", 52, {"time": 45}),
+                                          ("Tijuana", "Rosarito", 20, {})])
+        self.assertEqual(stale, {("Ensenada", "Mexicali"), ("Mexicali", "Ensenada"), ("Tijuana", "Tecate"),
+                                 ("Tecate", "Tijuana")})
+        self.assertEqual(self.graph["Mexicali"]["Ensenada"], {"weight": 250, "time": 180})
+        self.assertEqual(self.graph["Tecate"]["Tijuana"], {"weight": 52, "time": 45})
+
     def tearDown(self):
         """
         Cleanup method to remove the test files after tests are done.
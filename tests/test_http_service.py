@@ -0,0 +1,175 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest import mock
+from src.data.synthetic_graphs import grid_graph_data
+from src.solver.batch_solver import query_seed, solve_query
+from src.solver.http_service import MAX_BODY_SIZE, RoutingService
+from src.graph.compact_graph import CompactGraph
+
+
+async def request(port, method, path, payload=None):
+    """Send one HTTP request on a new connection and return (status, decoded JSON body)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(content)
+
+
+class TestHttpService(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """
+        Setup method to prepare the test environment.
+        Starts a service on a free port, solving in threads, with a small and a slower grid graph.
+        """
+        self.graph = CompactGraph.from_data(grid_graph_data(4))
+        self.service = RoutingService({"grid": self.graph, "slow": grid_graph_data(7)}, workers=0,
+                                      max_concurrency=1, max_queue=1, generations=5, population_size=8)
+        server = await self.service.start("127.0.0.1", 0)
+        self.port = server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.service.close()
+
+    async def test_route(self):
+        """
+        Test that a seeded route gives the same result as solving the query directly.
+        """
+        status, response = await request(self.port, "POST", "/route",
+                                         {"graph": "grid", "start": "0-0", "end": "3-3", "seed": 4})
+        self.assertEqual(status, 200)
+        expected = solve_query(self.graph, "0-0", "3-3", 5, 8, query_seed(4, "0-0", "3-3"))
+        self.assertEqual((response["path"], response["distance"]), (expected[0], expected[1]))
+        self.assertTrue(response["reached"])
+        self.assertEqual(response["backend"], "ga")
+
+        status, response = await request(self.port, "POST", "/route",
+                                         {"graph": "grid", "start": "0-0", "end": "3-3", "backend": "astar"})
+        self.assertEqual((status, response["backend"]), (200, "astar"))
+        self.assertLessEqual(response["distance"], expected[1])
+
+    async def test_invalid_requests(self):
+        """
+        Test the error statuses of invalid requests.
+        """
+        cases = [
+            ("POST", "/route", {"graph": "nowhere", "start": "0-0", "end": "3-3"}, 404),
+            ("POST", "/route", {"graph": "grid", "start": "0-0", "end": "9-9"}, 400),
+            ("POST", "/route", {"graph": "grid", "start": "0-0", "end": "3-3", "generations": "many"}, 400),
+            ("POST", "/route", {"graph": "grid", "start": "0-0", "end": "3-3", "population_size": 10 ** 6}, 400),
+            ("POST", "/route", ["grid"], 400),
+            ("POST", "/route", {"graph": "grid", "start": "0-0", "end": "3-3", "backend": "quantum"}, 400),
+            ("POST", "/route", {"graph": ["grid"], "start": "0-0", "end": "3-3"}, 404),
+            ("POST", "/route", {"graph": "grid", "start": ["0-0"], "end": "3-3"}, 400),
+            ("POST", "/route", {"graph": "grid", "start": "0-0", "end": {"node": "3-3"}}, 400),
+            ("POST", "/route", {"graph": "grid", "start": "0-0", "end": "3-3", "seed": "four"}, 400),
+            ("POST", "/route", {"graph": "grid", "start": "0-0", "end": "3-3", "seed": [4]}, 400),
+            ("POST", "/route", {"graph": "grid", "start": "0-0", "end": "3-3", "seed": True}, 400),
+            ("GET", "/route", None, 405),
+            ("GET", "/unknown", None, 404),
+        ]
+        for method, path, payload, expected in cases:
+            status, response = await request(self.port, method, path, payload)
+            self.assertEqual(status, expected, (method, path, payload))
+            self.assertIn("error", response)
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"POST /route HTTP/1.1\r\nContent-Length: lots\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+        self.assertTrue(response.startswith(b"HTTP/1.1 400 "))
+
+        # A body too large to read is refused without reading it, and the connection is closed
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(f"POST /route HTTP/1.1\r\nContent-Length: {MAX_BODY_SIZE + 1}\r\n\r\n".encode("latin-1"))
+        response = await reader.read()
+        writer.close()
+        self.assertTrue(response.startswith(b"HTTP/1.1 413 "))
+
+    async def test_overload_and_deadline(self):
+        """
+        Test that requests beyond the queue are rejected with 503 and a request whose deadline expires
+        while queued gets 504, without blocking the event loop.
+        """
+        slow = {"graph": "slow", "start": "0-0", "end": "6-6", "generations": 300, "population_size": 40,
+                "deadline": 2}
+        running = asyncio.ensure_future(request(self.port, "POST", "/route", slow))
+        await asyncio.sleep(0.2)
+        queued = asyncio.ensure_future(request(self.port, "POST", "/route",
+                                               {"graph": "grid", "start": "0-0", "end": "3-3", "deadline": 0.3}))
+        await asyncio.sleep(0.05)
+
+        status, _ = await request(self.port, "POST", "/route", {"graph": "grid", "start": "0-0", "end": "3-3"})
+        self.assertEqual(status, 503)
+        status, health = await request(self.port, "GET", "/health")
+        self.assertEqual((status, health), (200, {"status": "ok"}))
+
+        self.assertEqual((await queued)[0], 504)
+        self.assertIn((await running)[0], (200, 504))
+
+    async def test_slot_kept_until_solve_ends(self):
+        """
+        Test that a route answered with 504 keeps its slot until its solve is over, so later requests are
+        queued (and rejected beyond the queue) instead of piling up unseen in the pool.
+        """
+        done = threading.Event()
+
+        def blocked_solve(*args):
+            done.wait(5)
+            return solve_query(*args)
+
+        with mock.patch("src.solver.http_service.solve_query", blocked_solve):
+            route = {"graph": "grid", "start": "0-0", "end": "3-3", "deadline": 0.2}
+            self.assertEqual((await request(self.port, "POST", "/route", route))[0], 504)
+            self.assertEqual((await request(self.port, "GET", "/metrics"))[1]["in_flight"], 1)
+
+            queued = asyncio.ensure_future(request(self.port, "POST", "/route", dict(route, deadline=5)))
+            await asyncio.sleep(0.1)
+            self.assertEqual((await request(self.port, "POST", "/route", route))[0], 503)
+            done.set()
+            self.assertEqual((await queued)[0], 200)
+        self.assertEqual((await request(self.port, "GET", "/metrics"))[1]["in_flight"], 0)
+
+    async def test_metrics(self):
+        """
+        Test that the metrics count requests by status and report latencies.
+        """
+        await request(self.port, "POST", "/route", {"graph": "grid", "start": "0-0", "end": "3-3"})
+        await request(self.port, "POST", "/route", {"graph": "grid", "start": "0-0", "end": "9-9"})
+        status, metrics = await request(self.port, "GET", "/metrics")
+        self.assertEqual(status, 200)
+        self.assertEqual(metrics["statuses"], {"200": 1, "400": 1})
+        self.assertIsNotNone(metrics["latency"]["p50"])
+        self.assertEqual(metrics["in_flight"], 0)
+
+        status, graphs = await request(self.port, "GET", "/graphs")
+        self.assertEqual(graphs["grid"], {"nodes": 16, "edges": 24})
+
+
+class TestHttpServiceProcessPool(unittest.IsolatedAsyncioTestCase):
+
+    async def test_route_in_worker_process(self):
+        """
+        Test that routes solved in worker processes on the shared graph match the in-process result.
+        """
+        graph = CompactGraph.from_data(grid_graph_data(4))
+        service = RoutingService({"grid": graph}, workers=1, generations=5, population_size=8)
+        server = await service.start("127.0.0.1", 0)
+        try:
+            status, response = await request(server.sockets[0].getsockname()[1], "POST", "/route",
+                                             {"graph": "grid", "start": "0-0", "end": "3-3", "seed": 2})
+        finally:
+            await service.close()
+        self.assertEqual(status, 200)
+        self.assertEqual(response["path"], solve_query(graph, "0-0", "3-3", 5, 8, query_seed(2, "0-0", "3-3"))[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from src.data.json_loader import load_graph_from_json
+from src.genetic_algorithm.island_model import IslandModel, migration_targets
+from src.graph.compact_graph import CompactGraph
+from src.graph.shared_graph import attach_compact_graph, release_shared_blocks, share_compact_graph
+
+
+class TestIslandModel(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Loads the Baja California sample graph.
+        """
+        self.graph, _ = load_graph_from_json('graphs/bc_cities.json')
+
+    def test_migration_targets(self):
+        """
+        Test the island connections of every migration topology.
+        """
+        self.assertEqual(migration_targets("ring", 3), [[1], [2], [0]])
+        self.assertEqual(migration_targets("complete", 3), [[1, 2], [0, 2], [0, 1]])
+        for island, targets in enumerate(migration_targets("random", 4)):
+            self.assertEqual(len(targets), 1)
+            self.assertNotEqual(targets[0], island)
+        self.assertEqual(migration_targets("ring", 1), [[]])
+        with self.assertRaises(ValueError):
+            migration_targets("star", 3)
+
+    def test_shared_graph_round_trip(self):
+        """
+        Test that a compact graph attached from shared memory matches the original.
+        """
+        graph = CompactGraph.from_data(self.graph)
+        spec, blocks = share_compact_graph(graph)
+        try:
+            shared, shared_blocks = attach_compact_graph(spec)
+            self.assertEqual(shared.node_names, graph.node_names)
+            self.assertEqual(shared.weights.tolist(), graph.weights.tolist())
+            self.assertEqual(shared[0], graph[0])
+            del shared
+            release_shared_blocks(shared_blocks)
+        finally:
+            release_shared_blocks(blocks, unlink=True)
+
+    def test_run(self):
+        """
+        Test that the island model returns a path to the end node and per-island statistics.
+        """
+        model = IslandModel(self.graph, "Tijuana", "Guerrero-Negro", generations=6, population_size=10,
+                            num_islands=2, migration_interval=3, migration_size=2, seed=0)
+        best_path, best_distance = model.run()
+
+        self.assertEqual(best_path[0], "Tijuana")
+        self.assertEqual(best_path[-1], "Guerrero-Negro")
+        self.assertEqual(best_distance, min(stats["best_distance"] for stats in model.island_stats))
+        self.assertEqual(len(model.island_stats), 2)
+        for stats in model.island_stats:
+            self.assertEqual(stats["generations"], 6)
+            self.assertEqual(stats["migrants_sent"], 2)
+            self.assertEqual(stats["migrants_received"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
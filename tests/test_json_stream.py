@@ -0,0 +1,105 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.data.json_loader import load_graph_from_json, save_graph_to_json
+from src.data.json_stream import iter_json_graph, stream_compact_graph_from_json, stream_graph_from_json
+from src.data.synthetic_graphs import grid_graph_data, grid_positions
+from src.graph.compact_graph import CompactGraph
+
+
+class TestJsonStream(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Saves a small grid graph with positions to a temporary JSON file.
+        """
+        self.graph_data = grid_graph_data(4)
+        self.positions = grid_positions(4)
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "grid.json")
+        save_graph_to_json(self.graph_data, self.positions, self.file_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_same_as_json_load(self):
+        """
+        Test that the streaming loader returns the same graph and positions as `load_graph_from_json`,
+        whatever the chunk size.
+        """
+        expected = load_graph_from_json(self.file_path)
+        for chunk_size in (1, 7, 1 << 16):
+            self.assertEqual(stream_graph_from_json(self.file_path, chunk_size=chunk_size), expected)
+
+    def test_compact_graph(self):
+        """
+        Test that `stream_compact_graph_from_json` builds the same CompactGraph as `CompactGraph.from_data`.
+        """
+        graph = stream_compact_graph_from_json(self.file_path, chunk_size=5)
+        expected = CompactGraph.from_data(self.graph_data)
+        self.assertEqual(graph.node_names, expected.node_names)
+        self.assertEqual(graph.neighbor_ids.tolist(), expected.neighbor_ids.tolist())
+        self.assertEqual(graph.weights.tolist(), expected.weights.tolist())
+        self.assertEqual(graph.positions_dict()["2-3"], (3, 2))
+
+    def test_edge_attributes(self):
+        """
+        Test that further edge attributes are kept by both loaders and stored as arrays on request.
+        """
+        data = {"A": [{"node": "B", "weight": 4, "time": 2, "toll": 5}],
+                "B": [{"node": "A", "weight": 4, "time": 2, "toll": 5}]}
+        save_graph_to_json(data, {}, self.file_path)
+
+        self.assertEqual(load_graph_from_json(self.file_path), (data, {}))
+        self.assertEqual(stream_graph_from_json(self.file_path), (data, {}))
+        graph = stream_compact_graph_from_json(self.file_path, attributes=("toll",))
+        self.assertEqual(graph.edge_attributes["toll"].tolist(), [5, 5])
+
+    def test_node_filter(self):
+        """
+        Test that a node subset keeps only those nodes and the edges between them.
+        """
+        graph, positions = stream_graph_from_json(self.file_path, nodes={"0-0", "0-1", "1-1"})
+        self.assertEqual(set(graph), {"0-0", "0-1", "1-1"})
+        self.assertEqual(set(positions), {"0-0", "0-1", "1-1"})
+        self.assertEqual([edge["node"] for edge in graph["0-1"]], ["0-0", "1-1"])
+        self.assertEqual([edge["node"] for edge in graph["0-0"]], ["0-1"])
+
+    def test_bbox_filter(self):
+        """
+        Test that a bounding box keeps the nodes whose position is inside it, even though the positions
+        are stored after the adjacency lists.
+        """
+        graph = stream_compact_graph_from_json(self.file_path, bbox=(0, 0, 1, 1))
+        self.assertEqual(sorted(graph.node_names), ["0-0", "0-1", "1-0", "1-1"])
+        self.assertEqual(graph.number_of_edges(), 4)
+
+        graph, _ = stream_graph_from_json(self.file_path, nodes={"0-0", "3-3"}, bbox=(0, 0, 1, 1))
+        self.assertEqual(list(graph), ["0-0"])
+
+    def test_iter_json_graph(self):
+        """
+        Test the records of `iter_json_graph`, including values split across chunk boundaries.
+        """
+        text = json.dumps({"A": [{"node": "B", "weight": 12345}], "B": [{"node": "A", "weight": 12345}],
+                           "positions": {"A": [1.5, -2], "B": [3, 4]}})
+        records = list(iter_json_graph(io.StringIO(text), chunk_size=3))
+        self.assertEqual(records, [("edges", "A", [{"node": "B", "weight": 12345}]),
+                                   ("edges", "B", [{"node": "A", "weight": 12345}]),
+                                   ("position", "A", (1.5, -2)),
+                                   ("position", "B", (3, 4))])
+
+    def test_invalid_json(self):
+        """
+        Test that a truncated or malformed document raises ValueError.
+        """
+        for text in ('{"A": [{"node": "B", "weight": 1}', '[1, 2]', '{"A" [1]}'):
+            with self.assertRaises(ValueError):
+                list(iter_json_graph(io.StringIO(text)))
+
+
+if __name__ == '__main__':
+    unittest.main()
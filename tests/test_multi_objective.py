@@ -0,0 +1,119 @@
+import unittest
+import numpy as np
+from src.data.synthetic_graphs import add_travel_attributes, grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.multi_objective import MultiObjectiveGeneticAlgorithm
+from src.genetic_algorithm.objectives import pareto_ranks
+from src.graph.compact_graph import CompactGraph
+
+OBJECTIVES = ("weight", "time", "toll")
+
+
+class TestMultiObjectiveGeneticAlgorithm(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Creates a 6x6 grid graph whose edges have a weight, a travel time and a toll.
+        """
+        self.data = add_travel_attributes(grid_graph_data(6), toll_fraction=0.3)
+        self.start_node, self.end_node = "0-0", "5-5"
+
+    def route_totals(self, path):
+        """Sum of every objective along a route of node names, straight from the graph data."""
+        totals = dict.fromkeys(OBJECTIVES, 0)
+        for u, v in zip(path, path[1:]):
+            edge = next(edge for edge in self.data[u] if edge["node"] == v)
+            for name in OBJECTIVES:
+                totals[name] += edge[name]
+        return totals
+
+    def test_pareto_front(self):
+        """
+        Test that `run` returns non-dominated routes to end_node with their real objective totals.
+        """
+        ga = MultiObjectiveGeneticAlgorithm(self.data, self.start_node, self.end_node, 15, 20,
+                                            objectives=OBJECTIVES, fitness_scheme="pareto", engine="compact",
+                                            seed=0)
+        front = ga.run()
+
+        self.assertGreater(len(front), 1)
+        for path, totals in front:
+            self.assertEqual((path[0], path[-1]), (self.start_node, self.end_node))
+            self.assertEqual(totals, self.route_totals(path))
+        vectors = np.array([[totals[name] for name in OBJECTIVES] for _, totals in front])
+        self.assertEqual(pareto_ranks(vectors).tolist(), [0] * len(front))
+
+    def test_engines_match(self):
+        """
+        Test that the networkx and compact engines give the same front for a fixed seed.
+        """
+        fronts = []
+        for engine in ("networkx", "compact"):
+            ga = MultiObjectiveGeneticAlgorithm(self.data, self.start_node, self.end_node, 5, 10,
+                                                objectives=OBJECTIVES, fitness_scheme="pareto", engine=engine,
+                                                seed=1)
+            fronts.append(ga.run())
+        self.assertEqual(fronts[0], fronts[1])
+
+    def test_single_objective_matches_genetic_algorithm(self):
+        """
+        Test that the weighted sum of the weight alone evolves exactly like the single-objective search.
+        """
+        ga = GeneticAlgorithm(self.data, self.start_node, self.end_node, 10, 15, engine="compact", seed=2)
+        best_path, best_distance = ga.run()
+        multi = MultiObjectiveGeneticAlgorithm(self.data, self.start_node, self.end_node, 10, 15,
+                                               engine="compact", seed=2)
+        front = multi.run()
+
+        self.assertEqual(multi.population, ga.population)
+        self.assertIn((best_path, {"weight": best_distance}), front)
+
+    def test_weights_steer_the_route(self):
+        """
+        Test that a heavy toll weight finds a route with no more tolls than the cheapest route of a
+        distance-only weighting.
+        """
+        tolls = []
+        for weights in ({"toll": 0}, {"toll": 1000}):
+            ga = MultiObjectiveGeneticAlgorithm(self.data, self.start_node, self.end_node, 20, 20,
+                                                objectives=("weight", "toll"), objective_weights=weights,
+                                                engine="compact", elitism=2, seed=0)
+            ga.run()
+            population = ga.population
+            best = population[int(np.argmax(ga.evaluate_population(population)))]
+            tolls.append(ga.path_objectives(best)[1])
+        self.assertLessEqual(tolls[1], tolls[0])
+
+    def test_update_graph_and_resume(self):
+        """
+        Test that routes through a removed edge leave the front and that a resumed front avoids the edge.
+        """
+        graph = CompactGraph.from_data(self.data, attributes=OBJECTIVES[1:])
+        ga = MultiObjectiveGeneticAlgorithm(graph, self.start_node, self.end_node, 10, 15, objectives=OBJECTIVES,
+                                            fitness_scheme="pareto", seed=0)
+        path = ga.run()[0][0]
+        closed = (path[0], path[1])
+
+        ga.update_graph([(closed[0], closed[1], None)])
+        for path, totals in ga.resume(5):
+            self.assertNotIn(closed, list(zip(path, path[1:])))
+            self.assertEqual(totals, self.route_totals(path))
+
+    def test_invalid_options(self):
+        """
+        Test that unknown schemes, attributes and weights and the batch evaluator are rejected.
+        """
+        options = dict(objectives=OBJECTIVES, engine="compact")
+        with self.assertRaises(ValueError):
+            MultiObjectiveGeneticAlgorithm(self.data, "0-0", "5-5", 1, 2, fitness_scheme="lexicographic", **options)
+        with self.assertRaises(ValueError):
+            MultiObjectiveGeneticAlgorithm(self.data, "0-0", "5-5", 1, 2, objective_weights={"fuel": 1}, **options)
+        with self.assertRaises(ValueError):
+            MultiObjectiveGeneticAlgorithm(self.data, "0-0", "5-5", 1, 2, batch_fitness=True, **options)
+        with self.assertRaises(ValueError):
+            MultiObjectiveGeneticAlgorithm(CompactGraph.from_data(self.data), "0-0", "5-5", 1, 2, **options)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import numpy as np
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.objectives import (crowding_distances, objective_fitness, pareto_fitness, pareto_ranks,
+                                              weighted_sum_fitness)
+
+
+class TestObjectives(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Creates the (distance, toll) totals of five routes: three trade-offs, one dominated and a duplicate.
+        """
+        self.objectives = np.array([[10, 5], [12, 2], [20, 0], [15, 6], [12, 2]], dtype=float)
+
+    def test_pareto_ranks(self):
+        """
+        Test that non-dominated sorting puts the trade-offs and the duplicate on the first front.
+        """
+        self.assertEqual(pareto_ranks(self.objectives).tolist(), [0, 0, 0, 1, 0])
+        self.assertEqual(pareto_ranks(np.array([[3.0], [1.0], [2.0]])).tolist(), [2, 0, 1])
+        self.assertEqual(pareto_ranks(np.zeros((0, 2))).tolist(), [])
+
+    def test_crowding_distances(self):
+        """
+        Test that the extremes of every objective get an infinite crowding distance and the others the
+        normalized gap between their neighbors.
+        """
+        distances = crowding_distances(self.objectives[:3])
+        self.assertEqual(distances[0], np.inf)
+        self.assertEqual(distances[2], np.inf)
+        self.assertAlmostEqual(distances[1], 10 / 10 + 5 / 5)
+
+    def test_weighted_sum_matches_distance_fitness(self):
+        """
+        Test that a single objective gives the fitness of the single-objective search and that weights
+        scalarize the objectives.
+        """
+        valid = np.array([True, True, False])
+        reached_end = np.array([True, False, True])
+        fitnesses = weighted_sum_fitness(np.array([[7.0], [7.0], [np.inf]]), valid, reached_end)
+        self.assertEqual(fitnesses.tolist(), [GeneticAlgorithm.distance_fitness(7.0, True),
+                                              GeneticAlgorithm.distance_fitness(7.0, False), -np.inf])
+
+        weighted = weighted_sum_fitness(np.array([[4.0, 1.0]]), [True], [True], weights=[0.5, 5])
+        self.assertEqual(weighted.tolist(), [GeneticAlgorithm.distance_fitness(7.0, True)])
+
+    def test_pareto_fitness(self):
+        """
+        Test that every route of the first front beats the dominated one, which beats routes not reaching
+        end_node, and that invalid routes get -inf.
+        """
+        objectives = np.vstack([self.objectives, [[1, 1], [np.inf, np.inf]]])
+        reached_end = np.array([True] * 5 + [False, True])
+        valid = np.isfinite(objectives).all(axis=1)
+        fitnesses = pareto_fitness(objectives, valid, reached_end)
+
+        self.assertGreater(min(fitnesses[[0, 1, 2, 4]]), fitnesses[3])
+        self.assertGreater(fitnesses[3], fitnesses[5])
+        self.assertEqual(fitnesses[6], -np.inf)
+        self.assertEqual(objective_fitness("pareto", objectives, valid, reached_end).tolist(), fitnesses.tolist())
+        with self.assertRaises(ValueError):
+            objective_fitness("lexicographic", objectives, valid, reached_end)
+
+
+if __name__ == '__main__':
+    unittest.main()
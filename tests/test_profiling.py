@@ -0,0 +1,90 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm
+from src.genetic_algorithm.profiling import COUNTERS, NULL_PROFILER, PHASES, PhaseProfiler
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Creates a small grid graph.
+        """
+        self.graph = grid_graph_data(4)
+
+    def run_ga(self, profiler=None, **options):
+        random.seed(7)
+        ga = GeneticAlgorithm(self.graph, "0-0", "3-3", 5, 10, profiler=profiler, **options)
+        return ga, ga.run()
+
+    def test_phase_totals(self):
+        """
+        Test that every phase of a run is timed and the child counters add up.
+        """
+        profiler = PhaseProfiler()
+        ga, _ = self.run_ga(profiler, elitism=1)
+        summary = profiler.summary()
+
+        self.assertEqual(set(summary["phases"]), set(PHASES))
+        self.assertEqual(summary["phases"]["initialization"]["calls"], 1)
+        self.assertEqual(summary["phases"]["selection"]["calls"], ga.generation)
+        self.assertGreater(summary["run_seconds"], 0)
+        self.assertLessEqual(sum(phase["seconds"] for phase in summary["phases"].values()),
+                             summary["run_seconds"])
+
+        counters = summary["counters"]
+        self.assertEqual(set(counters), set(COUNTERS))
+        self.assertEqual(counters["children_accepted"], ga.generation * (10 - 1))
+        self.assertEqual(summary["phases"]["crossover"]["calls"],
+                         counters["children_accepted"] + counters["children_rejected"])
+        self.assertEqual(counters["children_rejected"],
+                         counters["crossover_repair_failures"] + counters["mutation_repair_failures"]
+                         + counters["invalid_mutations"])
+        self.assertIn("crossover", profiler.report())
+
+    def test_same_result(self):
+        """
+        Test that profiling does not change the seeded result.
+        """
+        _, expected = self.run_ga()
+        _, result = self.run_ga(PhaseProfiler(trace=True, cprofile=True))
+        self.assertEqual(result, expected)
+
+    def test_outputs(self):
+        """
+        Test the Chrome trace and pstats files, and that they require the matching option.
+        """
+        profiler = PhaseProfiler(trace=True, cprofile=True)
+        self.run_ga(profiler)
+        with tempfile.TemporaryDirectory() as directory:
+            trace_path = os.path.join(directory, "trace.json")
+            profiler.write_chrome_trace(trace_path)
+            with open(trace_path) as f:
+                events = json.load(f)["traceEvents"]
+            self.assertEqual(sum(1 for event in events if event["name"] == "run"), 1)
+            self.assertTrue(all(event["ph"] == "X" and event["dur"] >= 0 for event in events))
+
+            pstats_path = os.path.join(directory, "run.prof")
+            profiler.write_pstats(pstats_path)
+            self.assertGreater(os.path.getsize(pstats_path), 0)
+
+        with self.assertRaises(ValueError):
+            PhaseProfiler().write_chrome_trace("unused.json")
+        with self.assertRaises(ValueError):
+            PhaseProfiler().write_pstats("unused.prof")
+
+    def test_disabled(self):
+        """
+        Test that without a profiler the no-op profiler is used.
+        """
+        ga, _ = self.run_ga()
+        self.assertIs(ga.profiler, NULL_PROFILER)
+
+
+if __name__ == '__main__':
+    unittest.main()
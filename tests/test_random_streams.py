@@ -0,0 +1,94 @@
+import random
+import threading
+import unittest
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm, correct_path_to_end, crossover, selection
+from src.genetic_algorithm.random_streams import make_rng, seed_to_int, spawn_rngs, spawn_seeds
+from src.graph.compact_graph import CompactGraph
+
+
+class TestRandomStreams(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Creates a small grid graph.
+        """
+        self.graph = grid_graph_data(4)
+
+    def test_seed_to_int(self):
+        """
+        Test that string seeds hash to stable non-negative ints and negative seeds are rejected.
+        """
+        self.assertEqual(seed_to_int(5), 5)
+        self.assertEqual(seed_to_int("3:A:B"), seed_to_int(b"3:A:B"))
+        self.assertNotEqual(seed_to_int("3:A:B"), seed_to_int("3:B:A"))
+        with self.assertRaises(ValueError):
+            seed_to_int(-1)
+
+    def test_spawn(self):
+        """
+        Test that spawned seeds are reproducible, distinct, and differ between parent seeds.
+        """
+        seeds = spawn_seeds(7, 4)
+        self.assertEqual(seeds, spawn_seeds(7, 4))
+        self.assertEqual(len(set(seeds)), 4)
+        self.assertNotEqual(seeds, spawn_seeds(8, 4))
+        self.assertEqual(spawn_seeds("query", 2), spawn_seeds("query", 2))
+        self.assertEqual([rng.random() for rng in spawn_rngs(7, 4)], [make_rng(seed).random() for seed in seeds])
+
+    def test_seed_matches_global_random(self):
+        """
+        Test that a GA with seed=s gives the result of the global random module after random.seed(s).
+        """
+        random.seed(5)
+        expected = GeneticAlgorithm(self.graph, "0-0", "3-3", 5, 10).run()
+        random.seed(99)
+        self.assertEqual(GeneticAlgorithm(self.graph, "0-0", "3-3", 5, 10, seed=5).run(), expected)
+        self.assertEqual(GeneticAlgorithm(self.graph, "0-0", "3-3", 5, 10, rng=make_rng(5)).run(), expected)
+
+    def test_global_state_untouched(self):
+        """
+        Test that a GA with its own generator does not consume numbers from the global random module.
+        """
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        GeneticAlgorithm(self.graph, "0-0", "3-3", 3, 6, seed=2, selection_scheme="sus").run()
+        self.assertEqual(random.random(), expected)
+
+    def test_operators(self):
+        """
+        Test that the module-level operators draw from the generator they are given.
+        """
+        graph = CompactGraph.from_data(self.graph)
+        parent1 = graph.to_ids(["0-0", "0-1", "1-1", "2-1", "3-1", "3-2", "3-3"])
+        parent2 = graph.to_ids(["0-0", "1-0", "1-1", "1-2", "2-2", "3-2", "3-3"])
+        end = graph.index("3-3")
+        for seed in range(5):
+            self.assertEqual(crossover(parent1, parent2, graph, end, rng=make_rng(seed)),
+                             crossover(parent1, parent2, graph, end, rng=make_rng(seed)))
+            self.assertEqual(correct_path_to_end([0], graph, end, rng=make_rng(seed)),
+                             correct_path_to_end([0], graph, end, rng=make_rng(seed)))
+            self.assertEqual(selection([parent1, parent2], [1.0, 2.0], 2, rng=make_rng(seed)), [parent2, parent2])
+
+    def test_threads(self):
+        """
+        Test that concurrent solves with their own generators give the same results as sequential ones.
+        """
+        expected = [GeneticAlgorithm(self.graph, "0-0", "3-3", 4, 8, seed=seed).run() for seed in range(4)]
+        results = [None] * 4
+
+        def solve(seed):
+            results[seed] = GeneticAlgorithm(self.graph, "0-0", "3-3", 4, 8, seed=seed).run()
+
+        threads = [threading.Thread(target=solve, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
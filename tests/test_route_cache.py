@@ -0,0 +1,130 @@
+import json
+import os
+import unittest
+from src.data.json_loader import load_graph_from_json
+from src.solver.route_cache import CachedRouteSolver, RouteCache, options_key
+
+
+def ignore_progress(event):
+    """Progress callback that ignores its events."""
+
+
+class TestRouteCache(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Copies the sample graph to a temporary file that the tests can modify.
+        """
+        graph, positions = load_graph_from_json('graphs/bc_cities.json')
+        self.graph = dict(graph, positions=positions)
+        self.graph_file = 'test_route_cache_graph.json'
+        self.cache_file = 'test_route_cache.json'
+        with open(self.graph_file, 'w') as f:
+            json.dump(self.graph, f)
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used entry is evicted and counters are updated.
+        """
+        cache = RouteCache(max_size=2)
+        cache.put(("a",), (["a"], 0))
+        cache.put(("b",), (["b"], 0))
+        self.assertIsNotNone(cache.get(("a",)))  # "a" becomes the most recently used
+        cache.put(("c",), (["c"], 0))
+
+        self.assertNotIn(("b",), cache)
+        self.assertIn(("a",), cache)
+        self.assertIsNone(cache.get(("b",)))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_cached_solve_and_persistence(self):
+        """
+        Test that a repeated seeded query is a cache hit, and that the cache survives a restart.
+        """
+        with CachedRouteSolver(self.graph_file, RouteCache(path=self.cache_file)) as solver:
+            first = solver.solve("Tijuana", "Guerrero-Negro", generations=5, population_size=10, seed=1)
+            second = solver.solve("Tijuana", "Guerrero-Negro", generations=5, population_size=10, seed=1)
+            self.assertEqual(first, second)
+            self.assertEqual(solver.stats()["hits"], 1)
+            self.assertEqual(solver.stats()["misses"], 1)
+
+        with CachedRouteSolver(self.graph_file, RouteCache(path=self.cache_file)) as solver:
+            self.assertEqual(solver.solve("Tijuana", "Guerrero-Negro", generations=5, population_size=10, seed=1),
+                             first)
+            self.assertEqual(solver.stats()["hits"], 1)
+
+    def test_options_are_part_of_the_key(self):
+        """
+        Test that solvers with different options sharing a cache file never serve each other's routes, and that
+        queries with a time budget are not cached.
+        """
+        query = ("Tijuana", "Guerrero-Negro", 5, 10, 1)
+        with CachedRouteSolver(self.graph_file, RouteCache(path=self.cache_file), elitism=1, guided=True) as solver:
+            solver.solve(*query)
+        with CachedRouteSolver(self.graph_file, RouteCache(path=self.cache_file), guided=True, elitism=1) as solver:
+            solver.solve(*query)
+            self.assertEqual(solver.stats()["hits"], 1)
+        with CachedRouteSolver(self.graph_file, RouteCache(path=self.cache_file), guided=True) as solver:
+            solver.solve(*query)
+            self.assertEqual(solver.stats()["hits"], 0)
+            self.assertEqual(len(solver.cache), 2)
+
+        solver = CachedRouteSolver(self.graph_file, time_budget=10)
+        solver.solve(*query)
+        solver.solve(*query)
+        self.assertEqual(len(solver.cache), 0)
+        self.assertEqual(solver.stats()["misses"], 0)
+
+    def test_callable_options(self):
+        """
+        Test that module-level callables are keyed by their qualified name, and that options without a stable
+        name (like a lambda, whose repr holds a memory address) disable the cache.
+        """
+        self.assertEqual(options_key({"progress": ignore_progress}),
+                         json.dumps({"progress": f"{__name__}.ignore_progress"}))
+        self.assertIsNone(options_key({"progress": lambda event: None}))
+
+        query = ("Tijuana", "Guerrero-Negro", 5, 10, 1)
+        for _ in range(2):
+            with CachedRouteSolver(self.graph_file, RouteCache(path=self.cache_file),
+                                   progress=ignore_progress) as solver:
+                solver.solve(*query)
+        self.assertEqual(solver.stats()["hits"], 1)
+
+        solver = CachedRouteSolver(self.graph_file, progress=lambda event: None)
+        solver.solve(*query)
+        solver.solve(*query)
+        self.assertEqual(len(solver.cache), 0)
+
+    def test_graph_change_invalidates(self):
+        """
+        Test that changing the graph file clears the cached routes.
+        """
+        solver = CachedRouteSolver(self.graph_file)
+        solver.solve("Tijuana", "Mexicali", generations=3, population_size=6, seed=0)
+        self.assertEqual(len(solver.cache), 1)
+
+        self.graph["Tijuana"][0]["weight"] = 21
+        with open(self.graph_file, 'w') as f:
+            json.dump(self.graph, f)
+        os.utime(self.graph_file, ns=(0, 0))  # Make sure the modification time changes
+
+        solver.solve("Tijuana", "Mexicali", generations=3, population_size=6, seed=0)
+        self.assertEqual(solver.stats()["invalidations"], 1)
+        self.assertEqual(solver.stats()["misses"], 2)
+        self.assertEqual(len(solver.cache), 1)
+
+    def tearDown(self):
+        """
+        Cleanup method to remove the test files after tests are done.
+        """
+        for path in (self.graph_file, self.cache_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import random
+import unittest
+import numpy as np
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import GeneticAlgorithm, selection
+from src.genetic_algorithm.selection import (SELECTION_SCHEMES, rank_selection, select_indices,
+                                             stochastic_universal_sampling, tournament_selection,
+                                             truncation_selection)
+
+
+class TestSelection(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Creates fitness values with invalid individuals and a seeded generator.
+        """
+        self.fitnesses = np.array([1.0, -np.inf, 3.0, 0.5, -2.0, 2.0, -np.inf, 4.0])
+        self.rng = np.random.default_rng(0)
+
+    def test_original_selection_reproducible(self):
+        """
+        Test that the original tournament selection picks the same parents as sampling
+        (individual, fitness) pairs, so seeded runs are unchanged.
+        """
+        population = [[i] for i in range(len(self.fitnesses))]
+        fitnesses = self.fitnesses.tolist()
+        random.seed(3)
+        expected = []
+        for _ in range(len(population)):
+            tournament = random.sample(list(zip(population, fitnesses)), 3)
+            expected.append(max(tournament, key=lambda x: x[1])[0])
+        random.seed(3)
+        self.assertEqual(selection(population, fitnesses), expected)
+
+    def test_shapes(self):
+        """
+        Test that every scheme returns the requested number of valid indices.
+        """
+        for scheme in SELECTION_SCHEMES:
+            indices = select_indices(scheme, self.fitnesses, 20, self.rng)
+            self.assertEqual(indices.shape, (20,))
+            self.assertTrue(((indices >= 0) & (indices < len(self.fitnesses))).all())
+        with self.assertRaises(ValueError):
+            select_indices("roulette", self.fitnesses, 5, self.rng)
+
+    def test_tournament(self):
+        """
+        Test that a tournament as large as the population nearly always returns the best individual.
+        """
+        indices = tournament_selection(self.fitnesses, 200, self.rng, tournament_size=30)
+        self.assertEqual(np.bincount(indices).argmax(), 7)
+
+    def test_sus_skips_invalid(self):
+        """
+        Test that stochastic universal sampling never picks -inf individuals and favours fitter ones.
+        """
+        indices = stochastic_universal_sampling(self.fitnesses, 1000, self.rng)
+        counts = np.bincount(indices, minlength=len(self.fitnesses))
+        self.assertEqual(counts[1], 0)
+        self.assertEqual(counts[6], 0)
+        self.assertGreater(counts[7], counts[0])
+
+        # Only invalid individuals: uniform fallback
+        self.assertEqual(len(stochastic_universal_sampling(np.full(4, -np.inf), 6, self.rng)), 6)
+
+    def test_rank(self):
+        """
+        Test that rank selection follows ranks, not fitness magnitude.
+        """
+        counts = np.bincount(rank_selection(np.array([0.0, 1.0, 1000.0]), 3000, self.rng, pressure=2.0),
+                             minlength=3)
+        self.assertEqual(counts[0], 0)
+        self.assertAlmostEqual(counts[2] / counts[1], 2.0, delta=0.1)
+
+    def test_truncation(self):
+        """
+        Test that truncation selection only picks from the fittest fraction.
+        """
+        indices = truncation_selection(self.fitnesses, 100, self.rng, fraction=0.25)
+        self.assertEqual(set(indices.tolist()), {2, 7})
+
+    def test_genetic_algorithm(self):
+        """
+        Test that the GA runs with every scheme and is reproducible under random.seed.
+        """
+        graph = grid_graph_data(4)
+        for scheme in SELECTION_SCHEMES:
+            results = []
+            for _ in range(2):
+                random.seed(11)
+                ga = GeneticAlgorithm(graph, "0-0", "3-3", 4, 8, selection_scheme=scheme)
+                results.append(ga.run())
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(results[0][0][-1], "3-3")
+        with self.assertRaises(ValueError):
+            GeneticAlgorithm(graph, "0-0", "3-3", 4, 8, selection_scheme="roulette")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import itertools
+import math
+import random
+import unittest
+import networkx as nx
+from src.data.json_loader import load_graph_from_json
+from src.data.synthetic_graphs import random_geometric_graph_data
+from src.graph.compact_graph import CompactGraph
+from src.graph.graph_manager import create_graph_from_data
+from src.graph.shortest_paths import astar_path, bidirectional_dijkstra_path, dijkstra_path, k_shortest_paths
+from src.graph.goal_distances import straight_line_heuristic, straight_line_scale
+
+
+class TestShortestPaths(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Builds a random geometric graph with positions in both representations, and the sample graph.
+        """
+        graph_data, positions = random_geometric_graph_data(150, seed=2)
+        self.graph = create_graph_from_data(graph_data)
+        self.compact = CompactGraph.from_data(graph_data, positions)
+        self.scale = straight_line_scale(self.compact)
+        self.bc_graph = create_graph_from_data(load_graph_from_json('graphs/bc_cities.json')[0])
+
+    def test_backends_match_networkx(self):
+        """
+        Test that Dijkstra, bidirectional Dijkstra and A* return connected paths of the exact shortest distance.
+        """
+        rng = random.Random(0)
+        for _ in range(30):
+            source, target = rng.sample(range(len(self.compact)), 2)
+            try:
+                expected = nx.dijkstra_path_length(self.graph, self.compact.name(source), self.compact.name(target))
+            except nx.NetworkXNoPath:
+                expected = math.inf
+            heuristic = straight_line_heuristic(self.compact, target, self.scale)
+            for path, distance in (dijkstra_path(self.compact, source, target),
+                                   bidirectional_dijkstra_path(self.compact, source, target),
+                                   astar_path(self.compact, source, target, heuristic)):
+                self.assertEqual(distance, expected)
+                if path is None:
+                    self.assertEqual(expected, math.inf)
+                else:
+                    self.assertEqual((path[0], path[-1]), (source, target))
+                    self.assertEqual(self.compact.path_distance(path), distance)
+
+    def test_networkx_graph(self):
+        """
+        Test the searches on a networkx graph of node names, including blocked nodes.
+        """
+        self.assertEqual(dijkstra_path(self.bc_graph, "Tijuana", "Guerrero-Negro")[1], 715)
+        self.assertEqual(bidirectional_dijkstra_path(self.bc_graph, "Tijuana", "Guerrero-Negro")[1], 715)
+        self.assertEqual(bidirectional_dijkstra_path(self.bc_graph, "Tijuana", "Tijuana"), (["Tijuana"], 0))
+        path, distance = dijkstra_path(self.bc_graph, "Tijuana", "Guerrero-Negro", blocked_nodes={"Ensenada"})
+        self.assertNotIn("Ensenada", path)
+        self.assertGreater(distance, 715)
+
+    def test_straight_line_heuristic_is_a_lower_bound(self):
+        """
+        Test that the straight-line heuristic never overestimates the remaining distance.
+        """
+        target = 0
+        heuristic = straight_line_heuristic(self.compact, target, self.scale)
+        distances = nx.single_source_dijkstra_path_length(self.graph, self.compact.name(target))
+        for name, distance in distances.items():
+            self.assertLessEqual(heuristic(self.compact.index(name)), distance)
+        self.assertIsNone(straight_line_heuristic(CompactGraph.from_data(load_graph_from_json(
+            'graphs/bc_cities.json')[0]), 0, 1.0))
+
+    def test_k_shortest_paths(self):
+        """
+        Test that Yen's algorithm returns the k shortest simple paths by increasing distance.
+        """
+        paths = k_shortest_paths(self.bc_graph, "Tijuana", "Guerrero-Negro", 4)
+        expected = list(itertools.islice(nx.shortest_simple_paths(self.bc_graph, "Tijuana", "Guerrero-Negro",
+                                                                  weight="weight"), 4))
+        self.assertEqual([distance for _, distance in paths],
+                         [nx.path_weight(self.bc_graph, path, "weight") for path in expected])
+        for path, distance in paths:
+            self.assertEqual(len(path), len(set(path)))
+            self.assertEqual(nx.path_weight(self.bc_graph, path, "weight"), distance)
+        self.assertEqual(len({tuple(path) for path, _ in paths}), len(paths))
+
+        # Fewer paths than asked when there are no more
+        self.assertEqual(k_shortest_paths(self.bc_graph, "Tijuana", "Rosarito", 100)[0], (["Tijuana", "Rosarito"], 20))
+        self.assertLess(len(k_shortest_paths(self.bc_graph, "Tijuana", "Rosarito", 100)), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from src.data.synthetic_graphs import (GRAPH_KINDS, add_travel_attributes, grid_graph_data, grid_positions,
+                                       random_geometric_graph_data, scale_free_graph_data, synthetic_graph_data)
+from src.graph.compact_graph import CompactGraph
+
+
+class TestSyntheticGraphs(unittest.TestCase):
+
+    def assertSymmetric(self, graph_data):
+        """Every edge is listed by both of its nodes with the same weight."""
+        edges = {(node, edge["node"]): edge["weight"] for node, edges in graph_data.items() for edge in edges}
+        for (u, v), weight in edges.items():
+            self.assertEqual(edges.get((v, u)), weight)
+
+    def test_grid(self):
+        """
+        Test the size, symmetry and positions of a grid graph.
+        """
+        graph_data = grid_graph_data(5)
+        graph = CompactGraph.from_data(graph_data)
+        self.assertEqual(graph.number_of_nodes(), 25)
+        self.assertEqual(graph.number_of_edges(), 2 * 5 * 4)
+        self.assertSymmetric(graph_data)
+        self.assertEqual(grid_positions(5)["1-3"], [3, 1])
+
+    def test_random_geometric(self):
+        """
+        Test that a random geometric graph only connects nodes within the radius and is reproducible.
+        """
+        graph_data, positions = random_geometric_graph_data(200, radius=0.15, seed=4)
+        self.assertEqual(len(graph_data), 200)
+        self.assertSymmetric(graph_data)
+        for node, edges in graph_data.items():
+            for edge in edges:
+                (x1, y1), (x2, y2) = positions[node], positions[edge["node"]]
+                self.assertLessEqual((x1 - x2) ** 2 + (y1 - y2) ** 2, 0.15 ** 2)
+                self.assertGreaterEqual(edge["weight"], 1)
+        self.assertEqual(random_geometric_graph_data(200, radius=0.15, seed=4), (graph_data, positions))
+        self.assertNotEqual(random_geometric_graph_data(200, radius=0.15, seed=5)[1], positions)
+
+    def test_scale_free(self):
+        """
+        Test the number of edges and the degree skew of a preferential attachment graph.
+        """
+        graph_data, positions = scale_free_graph_data(500, edges_per_node=2, seed=1)
+        graph = CompactGraph.from_data(graph_data)
+        self.assertEqual(graph.number_of_nodes(), 500)
+        self.assertEqual(graph.number_of_edges(), 1 + 2 * (500 - 2))
+        self.assertSymmetric(graph_data)
+        degrees = sorted(len(edges) for edges in graph_data.values())
+        self.assertGreater(degrees[-1], 10 * degrees[len(degrees) // 2])
+        self.assertEqual(set(positions), set(graph_data))
+
+    def test_add_travel_attributes(self):
+        """
+        Test that every edge gets the same time and toll in both directions and that only toll roads are faster
+        than their length.
+        """
+        graph_data = add_travel_attributes(grid_graph_data(6), toll_fraction=0.3)
+        edges = {(node, edge["node"]): edge for node, edges in graph_data.items() for edge in edges}
+        for (u, v), edge in edges.items():
+            self.assertEqual(edges[(v, u)], dict(edge, node=u))
+            if edge["toll"]:
+                self.assertLessEqual(edge["time"], edge["weight"])
+            else:
+                self.assertGreaterEqual(edge["time"], edge["weight"])
+        self.assertTrue(any(edge["toll"] for edge in edges.values()))
+
+    def test_synthetic_graph_data(self):
+        """
+        Test the dispatch on the graph kind.
+        """
+        for kind in GRAPH_KINDS:
+            graph_data, positions = synthetic_graph_data(kind, 100)
+            self.assertEqual(len(graph_data), 100)
+            self.assertEqual(set(positions), set(graph_data))
+        self.assertEqual(len(synthetic_graph_data("grid", 110)[0]), 100)
+        with self.assertRaises(ValueError):
+            synthetic_graph_data("hexagonal", 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 import networkx as nx
 from src.visualization.visualization import visualize_graph, visualize_path
@@ -29,6 +33,31 @@ class TestVisualization(unittest.TestCase):
         # Assert that show was called (indicating the path was rendered)
         mock_show.assert_called_once()
 
+    def test_visualize_path_to_file(self):
+        """Test that visualize_path saves the figure to a file instead of showing it."""
+        graph = {"A": [{"node": "B", "weight": 2}], "B": [{"node": "A", "weight": 2}, {"node": "C", "weight": 3}],
+                 "C": [{"node": "B", "weight": 3}]}
+        with tempfile.TemporaryDirectory() as directory:
+            output_file = os.path.join(directory, "path.png")
+            with patch("matplotlib.pyplot.show") as mock_show, patch("matplotlib.use") as mock_use:
+                visualize_path(graph, ["A", "B", "C"], output_file=output_file)
+                mock_show.assert_not_called()
+                self.assertGreater(os.path.getsize(output_file), 0)
+
+                # The backend is left alone, so a later figure is still shown
+                visualize_path(graph, ["A", "B", "C"])
+            mock_use.assert_not_called()
+            mock_show.assert_called_once()
+
+    def test_imports_are_lazy(self):
+        """Test that importing the visualization module and the run script loads neither matplotlib nor networkx."""
+        code = ("import sys, src.visualization.visualization, scripts.run_algorithm; "
+                "print([m for m in ('matplotlib', 'networkx') if m in sys.modules])")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", code], cwd=root, env=dict(os.environ, PYTHONPATH=root),
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
 
 if __name__ == "__main__":
     unittest.main()
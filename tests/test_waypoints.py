@@ -0,0 +1,138 @@
+import random
+import unittest
+from src.data.synthetic_graphs import grid_graph_data
+from src.genetic_algorithm.GeneticAlgorithm import calculate_path_distance
+from src.genetic_algorithm.waypoints import WaypointGeneticAlgorithm, join_legs, order_crossover
+from src.graph.compact_graph import CompactGraph
+from src.graph.goal_distances import distance_cache_for
+
+
+class TestWaypointGeneticAlgorithm(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Setup method to prepare the test environment.
+        Creates a 6x6 grid graph and a route through three stops.
+        """
+        self.data = grid_graph_data(6)
+        self.start_node, self.end_node = "0-0", "5-5"
+        self.waypoints = ["0-5", "5-0", "2-3"]
+
+    def shortest_in_order(self, graph, stops):
+        """Sum of the shortest distances between consecutive stops."""
+        cache = distance_cache_for(graph)
+        return sum(cache.distances(graph.index(v))[graph.index(u)] for u, v in zip(stops, stops[1:]))
+
+    def test_route_visits_stops_in_order(self):
+        """
+        Test that the best route goes through the waypoints in order and that its distance is its real
+        distance, not shorter than the shortest route through the stops.
+        """
+        ga = WaypointGeneticAlgorithm(self.data, self.start_node, self.end_node, self.waypoints, generations=20,
+                                      population_size=20, engine="compact", seed=0)
+        best_path, best_distance = ga.run()
+
+        self.assertTrue(ga.visits_stops(ga.graph.to_ids(best_path)))
+        positions = [best_path.index(stop) for stop in [self.start_node] + self.waypoints]
+        self.assertEqual(positions, sorted(positions))
+        self.assertEqual(best_path[-1], self.end_node)
+        self.assertEqual(calculate_path_distance(ga.graph, ga.graph.to_ids(best_path)), best_distance)
+        stops = [self.start_node] + self.waypoints + [self.end_node]
+        self.assertGreaterEqual(best_distance, self.shortest_in_order(ga.graph, stops))
+
+    def test_free_order(self):
+        """
+        Test that a free-order route visits every waypoint and is not longer than the best route in the
+        given (zigzag) order.
+        """
+        graph = CompactGraph.from_data(self.data)
+        ordered = WaypointGeneticAlgorithm(graph, self.start_node, self.end_node, self.waypoints, generations=20,
+                                           population_size=20, seed=0)
+        free = WaypointGeneticAlgorithm(graph, self.start_node, self.end_node, self.waypoints, generations=20,
+                                        population_size=20, free_order=True, seed=0)
+        _, ordered_distance = ordered.run()
+        best_path, free_distance = free.run()
+
+        self.assertTrue(set(self.waypoints) <= set(best_path))
+        self.assertEqual((best_path[0], best_path[-1]), (self.start_node, self.end_node))
+        self.assertLessEqual(free_distance, ordered_distance)
+
+    def test_engines_match(self):
+        """
+        Test that the networkx and compact engines give the same route for a fixed seed.
+        """
+        results = []
+        for engine in ("networkx", "compact"):
+            ga = WaypointGeneticAlgorithm(self.data, self.start_node, self.end_node, self.waypoints, generations=5,
+                                          population_size=10, engine=engine, free_order=True, seed=1)
+            results.append(ga.run())
+        self.assertEqual(results[0], results[1])
+
+    def test_round_trip(self):
+        """
+        Test a route that starts and ends at the same node.
+        """
+        ga = WaypointGeneticAlgorithm(self.data, "0-0", "0-0", ["3-3", "0-4"], generations=10, population_size=10,
+                                      engine="compact", seed=0)
+        best_path, _ = ga.run()
+
+        self.assertEqual((best_path[0], best_path[-1]), ("0-0", "0-0"))
+        self.assertLess(best_path.index("3-3"), best_path.index("0-4"))
+
+    def test_split_legs(self):
+        """
+        Test that a route splits at its stops and that a route missing a stop gets -inf fitness.
+        """
+        ga = WaypointGeneticAlgorithm(self.data, "0-0", "0-3", ["0-2"], generations=1, population_size=2,
+                                      engine="networkx", seed=0)
+        route = ["0-0", "1-0", "1-1", "1-2", "0-2", "0-3"]
+        self.assertEqual(ga.split_legs(route), [["0-0", "1-0", "1-1", "1-2", "0-2"], ["0-2", "0-3"]])
+        self.assertEqual(join_legs(ga.split_legs(route)), route)
+        self.assertIsNone(ga.split_legs(["0-0", "0-1", "1-1", "1-2", "1-3", "0-3"]))
+        self.assertEqual(ga.base_fitness(["0-0", "0-1", "1-1", "1-2", "1-3", "0-3"])[1], -float('inf'))
+
+    def test_order_crossover(self):
+        """
+        Test that order crossover keeps the first and last stop and yields a permutation of the waypoints.
+        """
+        rng = random.Random(0)
+        for _ in range(20):
+            child = order_crossover(["s", 1, 2, 3, 4, 5, "e"], ["s", 5, 3, 1, 4, 2, "e"], rng)
+            self.assertEqual((child[0], child[-1]), ("s", "e"))
+            self.assertEqual(sorted(child[1:-1]), [1, 2, 3, 4, 5])
+
+    def test_update_graph_and_resume(self):
+        """
+        Test that after closing an edge of the best route, the resumed route avoids it and still visits the
+        stops in order.
+        """
+        ga = WaypointGeneticAlgorithm(self.data, self.start_node, self.end_node, self.waypoints, generations=10,
+                                      population_size=10, engine="compact", seed=0)
+        best_path, _ = ga.run()
+        closed = (best_path[1], best_path[2])
+
+        ga.update_graph([(closed[0], closed[1], None)])
+        best_path, best_distance = ga.resume(5)
+
+        self.assertTrue(ga.visits_stops(ga.graph.to_ids(best_path)))
+        self.assertNotIn(closed, list(zip(best_path, best_path[1:])))
+        self.assertNotIn(closed[::-1], list(zip(best_path, best_path[1:])))
+        self.assertEqual(calculate_path_distance(ga.graph, ga.graph.to_ids(best_path)), best_distance)
+
+    def test_invalid_waypoints(self):
+        """
+        Test that repeated, unknown or unreachable stops are rejected.
+        """
+        with self.assertRaises(ValueError):
+            WaypointGeneticAlgorithm(self.data, "0-0", "5-5", ["1-1", "1-1"], 1, 2)
+        with self.assertRaises(ValueError):
+            WaypointGeneticAlgorithm(self.data, "0-0", "5-5", ["5-5"], 1, 2)
+        with self.assertRaises(KeyError):
+            WaypointGeneticAlgorithm(self.data, "0-0", "5-5", ["9-9"], 1, 2)
+        data = dict(self.data, island=[])
+        with self.assertRaises(ValueError):
+            WaypointGeneticAlgorithm(data, "0-0", "5-5", ["island"], 1, 2, engine="compact")
+
+
+if __name__ == '__main__':
+    unittest.main()